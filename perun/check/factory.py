@@ -4,29 +4,22 @@ Collection of global methods for detection of performance changes
 from __future__ import annotations
 
 # Standard Imports
+import collections
 import contextlib
-import distutils.util as dutils
+import hashlib
+import json
 import os
 import re
 
-from typing import Any, Iterable, Protocol, TYPE_CHECKING
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Protocol, TYPE_CHECKING, Union
 
 # Third-Party Imports
 
 # Perun Imports
 from perun.logic import config, pcs, runner, store
 from perun.select.abstract_base_selection import AbstractBaseSelection
-from perun.check.methods import (
-    average_amount_threshold,
-    best_model_order_equality,
-    exclusive_time_outliers,
-    fast_check,
-    integral_comparison,
-    linear_regression,
-    local_statistics,
-    polynomial_regression,
-)
 from perun.utils import decorators, log
+from perun.utils.common import common_kit
 from perun.utils.structs import (
     DetectionChangeResult,
     DegradationInfo,
@@ -35,6 +28,7 @@ from perun.utils.structs import (
     ModelRecord,
 )
 from perun.utils.exceptions import UnsupportedModuleException
+import perun
 import perun.profile.helpers as profiles
 
 if TYPE_CHECKING:
@@ -43,6 +37,8 @@ if TYPE_CHECKING:
 
 # Minimal confidence rate from both models to perform the detection
 _MIN_CONFIDENCE_RATE = 0.15
+# Configuration keys of the parameters read by the detection methods
+_METHOD_PARAMETER_KEYS = ("degradation.cutoff", "degradation.location_filter")
 
 
 class CallableDetectionMethod(Protocol):
@@ -112,14 +108,14 @@ def pre_collect_profiles(minor_version: MinorVersion) -> None:
 
     :param MinorVersion minor_version: minor version for which we are collecting the data
     """
-    should_precollect = dutils.strtobool(
+    should_precollect = common_kit.strtobool(
         str(config.lookup_key_recursively("degradation.collect_before_check", "false"))
     )
     if should_precollect and minor_version.checksum not in pre_collect_profiles.minor_version_cache:
         # Set the registering after run to true for this run
         config.runtime().set("profiles.register_after_run", "true")
         # Actually collect the resources
-        collect_to_log = dutils.strtobool(
+        collect_to_log = common_kit.strtobool(
             str(config.lookup_key_recursively("degradation.log_collect", "false"))
         )
         log_file = os.path.join(pcs.get_log_directory(), f"{minor_version.checksum}-precollect.log")
@@ -135,16 +131,122 @@ def pre_collect_profiles(minor_version: MinorVersion) -> None:
         pre_collect_profiles.minor_version_cache.add(minor_version.checksum)
 
 
-def degradation_in_minor(
-    minor_version: str, quiet: bool = False
-) -> list[tuple[DegradationInfo, str, str]]:
-    """Checks for degradation according to the profiles stored for the given minor version.
+# Task of degradation check: (baseline, target, models strategy, method); profiles are given either
+# loaded or by the path to their object, method may be None to run all applicable methods
+CheckTask = tuple[Union[str, "Profile"], Union[str, "Profile"], str, Optional[str]]
+
+
+class CheckedPair(NamedTuple):
+    """Pair of profiles checked for the minor version
+
+    :ivar CheckTask task: the degradation check of the pair
+    :ivar str cmdstr: command string of the configuration of the profiles
+    :ivar str baseline_checksum: minor version of the baseline profile
+    :ivar str fingerprint: fingerprint of the check (see :func:`get_check_fingerprint`)
+    """
+
+    task: CheckTask
+    cmdstr: str
+    baseline_checksum: str
+    fingerprint: Optional[str]
+
+
+def get_number_of_jobs() -> int:
+    """Returns number of worker processes used for checking the pairs of profiles
+
+    The number is set by :ckey:`degradation.jobs` (e.g. by ``perun check --jobs``).
+
+    :return: number of jobs, by default 1 (i.e. the checks are run sequentially)
+    """
+    return max(int(config.lookup_key_recursively("degradation.jobs", "1")), 1)
+
+
+def get_check_fingerprint(task: CheckTask) -> Optional[str]:
+    """Computes the fingerprint identifying the results of the check task
+
+    The fingerprint consists of the SHA of baseline and target profile objects, the models strategy
+    and the checking method together with its parameters. If the method is not specified, then
+    the rules for applying the methods (:ckey:`degradation.apply` and
+    :ckey:`degradation.strategies`) are used instead, since they determine the methods for the
+    (unchanged) baseline profile. The parameters of the methods set in the configuration (see
+    :data:`_METHOD_PARAMETER_KEYS`) and the version of Perun are included as well.
+
+    :param CheckTask task: checked pair of profiles, models strategy and the checking method
+    :return: fingerprint of the check, or None if the profiles are not stored as objects
+    """
+    baseline, target, models_strategy, method = task
+    if not isinstance(baseline, str) or not isinstance(target, str):
+        return None
+    baseline_sha, target_sha = store.version_path_to_sha(baseline), store.version_path_to_sha(
+        target
+    )
+    if baseline_sha is None or target_sha is None:
+        return None
+    method_parameters = method or {
+        "apply": config.lookup_key_recursively("degradation.apply", default="all"),
+        "strategies": config.gather_key_recursively("degradation.strategies"),
+    }
+    # Only the values with the highest priority are used by the methods
+    configured_parameters = {
+        key: next(iter(config.gather_key_recursively(key)), None) for key in _METHOD_PARAMETER_KEYS
+    }
+    fingerprint = json.dumps(
+        [
+            perun.__version__,
+            baseline_sha,
+            target_sha,
+            models_strategy,
+            method_parameters,
+            configured_parameters,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+
+
+def run_check_task(task: CheckTask) -> list[DegradationInfo]:
+    """Runs the degradation check for one pair of baseline and target profiles
+
+    The profiles given by the paths are loaded first, hence the task can be run in the worker
+    process without the need of sending the whole profiles. The profiles are loaded lazily, i.e.
+    the resources are decoded only if the checking method needs them.
+
+    :param CheckTask task: checked pair of profiles, models strategy and the checking method
+    :return: list of detected changes (i.e. without those with no change)
+    """
+    baseline, target, models_strategy, method = task
+    baseline_profile = (
+        store.load_profile_from_file(baseline, False, True, use_cache=True, lazy=True)
+        if isinstance(baseline, str)
+        else baseline
+    )
+    target_profile = (
+        store.load_profile_from_file(target, False, True, use_cache=True, lazy=True)
+        if isinstance(target, str)
+        else target
+    )
+    methods = [method] if method else get_strategies_for(baseline_profile)
+    return [
+        deg
+        for degradation_method in methods
+        for deg in run_degradation_check(
+            degradation_method, baseline_profile, target_profile, models_strategy=models_strategy
+        )
+        if deg.result != PerformanceChange.NoChange
+    ]
+
+
+def prepare_checks_in_minor(minor_version: str) -> list[CheckedPair]:
+    """Finds all pairs of profiles that are checked for the given minor version
+
+    For each profile of the minor version (the `target`) we find the compatible profiles of
+    the predecessor versions (the `baselines`) according to the selection. The baselines are not
+    loaded, this is left to the (possibly parallel) checks.
 
     :param str minor_version: representation of head point of degradation checking
-    :param bool quiet: if set to true then nothing will be printed
-    :returns: list of found changes
+    :return: list of checked pairs of profiles
     """
-    log.major_info(f"Checking Version {minor_version}")
     selection: AbstractBaseSelection = pcs.selection()
     minor_version_info = pcs.vcs().get_minor_version_info(minor_version)
 
@@ -153,48 +255,147 @@ def degradation_in_minor(
     for parent_version in selection.get_parents(minor_version_info):
         pre_collect_profiles(parent_version)
 
-    profile_queue = profiles_to_queue(minor_version)
-    detected_changes = []
-
-    for target_config, target_profile_info in profile_queue.items():
+    checks: list[CheckedPair] = []
+    for target_config, target_profile_info in profiles_to_queue(minor_version).items():
         # Iterate through the profiles and check degradation between those of same configuration
-        target_prof = store.load_profile_from_file(target_profile_info.realpath, False, True)
+        target_prof = store.load_profile_from_file(
+            target_profile_info.realpath, False, True, use_cache=True, lazy=True
+        )
         cmdstr = profiles.config_tuple_to_cmdstr(target_config)
 
         for baseline_info, baseline_profile_info in selection.get_profiles(
             minor_version_info, target_prof
         ):
-            baseline_prof = store.load_profile_from_file(
-                baseline_profile_info.realpath, False, True
+            task: CheckTask = (
+                baseline_profile_info.realpath,
+                target_profile_info.realpath,
+                "best-model",
+                None,
+            )
+            checks.append(
+                CheckedPair(task, cmdstr, baseline_info.checksum, get_check_fingerprint(task))
             )
-            for deg in degradation_between_profiles(baseline_prof, target_prof, "best-model"):
-                if deg.result != PerformanceChange.NoChange:
-                    detected_changes.append((deg, cmdstr, baseline_info.checksum))
+    return checks
+
+
+def run_checks_in_minor(
+    minor_version: str,
+    checks: list[CheckedPair],
+    pool_map: Callable[..., Iterable[list[DegradationInfo]]],
+) -> Iterable[list[DegradationInfo]]:
+    """Runs the checks of the minor version, reusing the results stored by the previous checks
+
+    The checks whose fingerprint matches some of the stored results are not run again, unless
+    :ckey:`degradation.force_recheck` is set (e.g. by ``perun check --force``). The rest of the
+    checks is submitted to the pool right away.
+
+    :param str minor_version: representation of head point of degradation checking
+    :param list checks: list of checked pairs of profiles
+    :param function pool_map: map function used to run the checks
+    :return: results of the checks, in the same order as the checks
+    """
+    force_recheck = common_kit.strtobool(
+        str(config.lookup_key_recursively("degradation.force_recheck", "false"))
+    )
+    stored_results = (
+        {}
+        if force_recheck
+        else store.load_check_results_for(pcs.get_object_directory(), minor_version)
+    )
+    fresh_results = iter(
+        pool_map(run_check_task, [c.task for c in checks if c.fingerprint not in stored_results])
+    )
+    return (
+        [deg for deg, _, _ in stored_results[check.fingerprint]]
+        if check.fingerprint in stored_results
+        else next(fresh_results)
+        for check in checks
+    )
+
+
+def finish_checks_in_minor(
+    minor_version: str,
+    checks: list[CheckedPair],
+    results: Iterable[list[DegradationInfo]],
+    quiet: bool = False,
+) -> list[tuple[DegradationInfo, str, str]]:
+    """Merges the results of checks of the minor version and stores the detected changes
+
+    The results are merged in the order of the checks, so the detected changes are the same
+    regardless of the number of jobs.
+
+    :param str minor_version: representation of head point of degradation checking
+    :param list checks: list of checked pairs of profiles
+    :param iterable results: results of the check tasks, in the same order as the checks
+    :param bool quiet: if set to true then nothing will be printed
+    :return: list of found changes
+    """
+    check_results = {}
+    detected_changes = []
+    for check, degradations in zip(checks, results):
+        changes = [(deg, check.cmdstr, check.baseline_checksum) for deg in degradations]
+        if check.fingerprint is not None:
+            check_results[check.fingerprint] = changes
+        detected_changes.extend(changes)
 
     # Store the detected degradation
     store.save_degradation_list_for(pcs.get_object_directory(), minor_version, detected_changes)
+    store.save_check_results_for(pcs.get_object_directory(), minor_version, check_results)
     if not quiet:
         log.print_list_of_degradations(detected_changes)
     return detected_changes
 
 
+def degradation_in_minor(
+    minor_version: str, quiet: bool = False
+) -> list[tuple[DegradationInfo, str, str]]:
+    """Checks for degradation according to the profiles stored for the given minor version.
+
+    The pairs of profiles are checked in :func:`get_number_of_jobs` worker processes.
+
+    :param str minor_version: representation of head point of degradation checking
+    :param bool quiet: if set to true then nothing will be printed
+    :returns: list of found changes
+    """
+    log.major_info(f"Checking Version {minor_version}")
+    checks = prepare_checks_in_minor(minor_version)
+    with common_kit.worker_pool(get_number_of_jobs()) as pool_map:
+        results = run_checks_in_minor(minor_version, checks, pool_map)
+        return finish_checks_in_minor(minor_version, checks, results, quiet)
+
+
 @log.print_elapsed_time
 def degradation_in_history(head: str) -> list[tuple[DegradationInfo, str, str]]:
     """Walks through the minor version starting from the given head, checking for degradation.
 
+    The checks of the minor versions are distributed among :func:`get_number_of_jobs` worker
+    processes. At most that many minor versions are checked ahead, the results of the oldest one
+    are collected and printed before the checks of the next minor version are submitted, so the
+    output keeps in step with the walked history.
+
     :param str head: starting point of the checked history for degradation.
     :returns: tuple (degradation result, degradation location, degradation rate)
     """
     log.major_info("Checking Whole History")
     log.minor_info("This might take a while")
-    detected_changes = []
+    detected_changes: list[tuple[DegradationInfo, str, str]] = []
     version_selection: AbstractBaseSelection = pcs.selection()
-    with log.History(head) as history:
-        for minor_version in pcs.vcs().walk_minor_versions(head):
+    jobs = get_number_of_jobs()
+    with log.History(head) as history, common_kit.worker_pool(jobs) as pool_map:
+        pending_versions: collections.deque[
+            tuple[MinorVersion, Optional[tuple[list[CheckedPair], Iterable[list[DegradationInfo]]]]]
+        ] = collections.deque()
+
+        def finish_oldest_version() -> None:
+            """Collects the results of the oldest pending minor version and prints them"""
+            minor_version, minor_version_checks = pending_versions.popleft()
             history.progress_to_next_minor_version(minor_version)
             newly_detected_changes = []
-            if version_selection.should_check_version(minor_version):
-                newly_detected_changes = degradation_in_minor(minor_version.checksum, True)
+            if minor_version_checks is not None:
+                log.major_info(f"Checking Version {minor_version.checksum}")
+                newly_detected_changes = finish_checks_in_minor(
+                    minor_version.checksum, *minor_version_checks, quiet=True
+                )
                 log.print_short_change_string(
                     log.count_degradations_per_group(newly_detected_changes)
                 )
@@ -204,6 +405,18 @@ def degradation_in_history(head: str) -> list[tuple[DegradationInfo, str, str]]:
             log.print_list_of_degradations(newly_detected_changes)
             detected_changes.extend(newly_detected_changes)
             history.flush(with_border=True)
+
+        for minor_version in pcs.vcs().walk_minor_versions(head):
+            if version_selection.should_check_version(minor_version):
+                checks = prepare_checks_in_minor(minor_version.checksum)
+                results = run_checks_in_minor(minor_version.checksum, checks, pool_map)
+                pending_versions.append((minor_version, (checks, results)))
+            else:
+                pending_versions.append((minor_version, None))
+            if len(pending_versions) >= jobs:
+                finish_oldest_version()
+        while pending_versions:
+            finish_oldest_version()
     log.newline()
     log.print_short_summary_of_degradations(detected_changes)
     return detected_changes
@@ -236,6 +449,18 @@ def run_degradation_check(
 
     Constructs from string an Checker object and runs the check method
     """
+    # The methods pull in the heavy numerical modules, hence they are imported only when needed
+    from perun.check.methods import (
+        average_amount_threshold,
+        best_model_order_equality,
+        exclusive_time_outliers,
+        fast_check,
+        integral_comparison,
+        linear_regression,
+        local_statistics,
+        polynomial_regression,
+    )
+
     if degradation_method == "average_amount_threshold":
         yield from average_amount_threshold.AverageAmountThreshold().check(
             baseline_profile, target_profile, **kwargs
@@ -299,12 +524,18 @@ def degradation_between_files(
                 f"Performance check does not make sense for profiles collected in different ways!"
             )
 
-    detected_changes = []
-    for deg in degradation_between_profiles(baseline_file, target_file, models_strategy):
-        if deg.result != PerformanceChange.NoChange:
-            detected_changes.append(
-                (deg, profiles.config_tuple_to_cmdstr(baseline_config), target_minor_version)
-            )
+    # The methods are checked in parallel, the profiles are sent to the workers
+    tasks: list[CheckTask] = [
+        (baseline_file, target_file, models_strategy, method)
+        for method in get_strategies_for(baseline_file)
+    ]
+    cmdstr = profiles.config_tuple_to_cmdstr(baseline_config)
+    with common_kit.worker_pool(min(get_number_of_jobs(), len(tasks))) as pool_map:
+        detected_changes = [
+            (deg, cmdstr, target_minor_version)
+            for degradations in pool_map(run_check_task, tasks)
+            for deg in degradations
+        ]
 
     # Store the detected changes for given minor version
     store.save_degradation_list_for(
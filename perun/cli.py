@@ -70,7 +70,6 @@ from perun.utils.exceptions import (
 )
 from perun.utils.structs import Executable
 import perun.collect
-import perun.fuzz.factory as fuzz
 import perun.postprocess
 import perun.profile.helpers as profiles
 import perun.view
@@ -125,6 +124,14 @@ DEV_MODE = False
     default=False,
     callback=cli_kit.print_version,
 )
+@click.option(
+    "--startup-profile",
+    help="Prints the import time of the slowest modules on the startup path of Perun.",
+    is_eager=True,
+    is_flag=True,
+    default=False,
+    callback=cli_kit.print_startup_profile,
+)
 @click.option(
     "--metrics",
     "-m",
@@ -678,6 +685,17 @@ def show(ctx: click.Context, profile: Profile, **_: Any) -> None:
     callback=cli_kit.lookup_minor_version_callback,
     help="Will check the index of different minor version <hash> during the profile lookup",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    callback=cli_kit.set_config_option_from_flag(perun_config.runtime, "postprocess.jobs"),
+    help=(
+        "Number of worker processes used for computing the models of individual uids in"
+        " parallel. The computed models are the same regardless of the number of jobs."
+    ),
+)
 @click.pass_context
 def postprocessby(ctx: click.Context, profile: Profile, **_: Any) -> None:
     """Postprocesses the given stored or pending profile using selected
@@ -1164,6 +1182,8 @@ def collect(ctx: click.Context, **kwargs: Any) -> None:
 )
 def fuzz_cmd(cmd: str, **kwargs: Any) -> None:
     """Performs fuzzing for the specified command according to the initial sample of workload."""
+    import perun.fuzz.factory as fuzz
+
     kwargs["executable"] = Executable(cmd)
     fuzz.run_fuzzing_for_command(**kwargs)
 
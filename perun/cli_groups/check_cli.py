@@ -3,7 +3,6 @@ from __future__ import annotations
 
 # Standard Imports
 from typing import Any, TYPE_CHECKING, Optional
-import distutils.util as dutils
 
 # Third-Party Imports
 import click
@@ -11,7 +10,7 @@ import click
 # Perun Imports
 from perun.logic import pcs, config as perun_config
 from perun.utils import log
-from perun.utils.common import cli_kit
+from perun.utils.common import cli_kit, common_kit
 import perun.check.factory as check
 
 if TYPE_CHECKING:
@@ -24,11 +23,14 @@ if TYPE_CHECKING:
     "-f",
     is_flag=True,
     default=False,
+    callback=cli_kit.set_config_option_from_flag(perun_config.runtime, "degradation.force_recheck"),
     help=(
         "Force comparison of the selected profiles even if their configuration"
         "does not match. This may be necessary when, e.g., different project"
         "versions build binaries with version information in their name"
         "(python3.10 and python3.11), thus failing the consistency check. "
+        "Moreover, the pairs of profiles that were already checked are checked again, "
+        "instead of reusing the stored results."
     ),
 )
 @click.option(
@@ -59,6 +61,17 @@ if TYPE_CHECKING:
         "methods: Integral Comparison (IC) and Local Statistics (LS)."
     ),
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    callback=cli_kit.set_config_option_from_flag(perun_config.runtime, "degradation.jobs"),
+    help=(
+        "Number of worker processes used for checking the pairs of profiles in parallel."
+        " The detected changes are the same regardless of the number of jobs."
+    ),
+)
 def check_group(**_: Any) -> None:
     """Applies for the points of version history checks for possible performance changes.
 
@@ -107,10 +120,10 @@ def check_group(**_: Any) -> None:
         8. Exclusive Time Outliers (ETO)
 
     """
-    should_precollect = dutils.strtobool(
+    should_precollect = common_kit.strtobool(
         str(perun_config.lookup_key_recursively("degradation.collect_before_check", "false"))
     )
-    precollect_to_log = dutils.strtobool(
+    precollect_to_log = common_kit.strtobool(
         str(perun_config.lookup_key_recursively("degradation.log_collect", "false"))
     )
     if should_precollect:
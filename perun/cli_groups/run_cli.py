@@ -58,6 +58,25 @@ from perun.utils.structs import CollectStatus
     callback=cli_kit.unsupported_option_callback,
     help="If set to true, then even if the repository is dirty, the changes will not be stashed",
 )
+@click.option(
+    "--parallel",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    callback=cli_kit.set_config_option_from_flag(perun_config.runtime, "execute.parallel"),
+    help=(
+        "Number of jobs run in parallel. Each job is run in separate worker process, while the"
+        " generated profiles are stored in the same order as for the sequential run. Refer to"
+        " :ckey:`execute.parallel` for more details."
+    ),
+)
+@click.option(
+    "--pin-cpus",
+    is_flag=True,
+    default=False,
+    callback=cli_kit.set_config_option_from_flag(perun_config.runtime, "execute.pin_cpus"),
+    help="If set to true, then each of the parallel jobs is run on separate CPU.",
+)
 @click.pass_context
 def run(ctx: click.Context, **kwargs: Any) -> None:
     """Generates batch of profiles w.r.t. specification of list of jobs.
@@ -8,40 +8,25 @@ from __future__ import annotations
 
 # Standard Imports
 from subprocess import CalledProcessError
-from typing import Any
+from typing import Any, Optional, TYPE_CHECKING
 import dataclasses
 import os
 import shutil
 
 # Third-Party Imports
 import click
+import numpy as np
 
 # Perun Imports
 from perun.collect.complexity import configurator, makefiles, symbols
 from perun.logic import runner
+from perun.profile.factory import Profile
 from perun.utils import exceptions, log
 from perun.utils.external import commands
 from perun.utils.structs import Executable, CollectStatus
 
-
-# The profiling record template
-@dataclasses.dataclass
-class ProfileRecord:
-    """
-    ProfileRecord corresponds to format written in the intermediate format collected by `complexity` collector.
-
-    action: corresponds to either "i" (call/in function) or "o" (return/out function)
-    func: corresponds an address of the recorded functions (this needs to be translated)
-    timestamp: corresponds to recorded timestamp of the call/return of the function
-    size: corresponds to the size of the underlying data structure in the function
-    """
-
-    __slots__ = ["action", "func", "timestamp", "size"]
-
-    action: str
-    func: str
-    timestamp: str
-    size: str
+if TYPE_CHECKING:
+    import numpy.typing as npt
 
 
 # The collect phase status messages
@@ -60,6 +45,39 @@ _COLLECTOR_SUBTYPES = {"delta": "time delta"}
 # The time conversion constant
 _MICRO_TO_SECONDS = 1000000.0
 
+# The approximate size (in bytes) of the profiling log parsed at once
+_BLOCK_SIZE = 2**24
+
+
+@dataclasses.dataclass
+class _LogColumns:
+    """Columns of the parsed profiling log and the state of the parsing shared by its blocks
+
+    :ivar list addresses: the distinct function addresses, indexed by their codes
+    :ivar dict address_codes: the map of function addresses to their codes
+    :ivar ndarray stack_funcs: codes of the functions of not yet returned calls (the call stack)
+    :ivar ndarray stack_timestamps: timestamps of the not yet returned calls
+    :ivar list funcs: blocks of function codes of the matched calls, in the order of returns
+    :ivar list amounts: blocks of time deltas of the matched calls
+    :ivar list sizes: blocks of structure sizes of the matched calls
+    :ivar int start: timestamp of the first record, None if no record was parsed yet
+    :ivar int end: timestamp of the last record
+    """
+
+    addresses: list[str] = dataclasses.field(default_factory=list)
+    address_codes: dict[str, int] = dataclasses.field(default_factory=dict)
+    stack_funcs: npt.NDArray[np.int64] = dataclasses.field(
+        default_factory=lambda: np.empty(0, dtype=np.int64)
+    )
+    stack_timestamps: npt.NDArray[np.int64] = dataclasses.field(
+        default_factory=lambda: np.empty(0, dtype=np.int64)
+    )
+    funcs: list[npt.NDArray[np.int64]] = dataclasses.field(default_factory=list)
+    amounts: list[npt.NDArray[np.int64]] = dataclasses.field(default_factory=list)
+    sizes: list[npt.NDArray[np.int64]] = dataclasses.field(default_factory=list)
+    start: Optional[int] = None
+    end: int = 0
+
 
 def before(executable: Executable, **kwargs: Any) -> tuple[CollectStatus, str, dict[str, Any]]:
     """Builds, links and configures the complexity collector executable
@@ -163,78 +181,139 @@ def after(executable: Executable, **kwargs: Any) -> tuple[CollectStatus, str, di
     address_map = symbols.extract_symbol_address_map(executable.cmd)
     log.minor_success("Symbol address map", "extracted")
 
-    resources: list[dict[str, Any]] = []
-    call_stack: list[ProfileRecord] = []
-    profile_start, profile_end = 0, 0
-
+    log_columns = _LogColumns()
     with open(data_path, "r") as profile:
-        is_first_line = True
-        for line in profile:
-            # Split the line into action, function name, timestamp and size
-            record = ProfileRecord(*line.split())
-
-            # Process the record
-            if _process_file_record(record, call_stack, resources, address_map) != 0:
-                # Stack error
-                err_msg = "Call stack error, record: " + record.func + ", " + record.action
-                err_msg += ", stack top: "
-                err_msg += (
-                    call_stack[-1].func + ", " + call_stack[-1].action if call_stack else "empty"
-                )
+        lines = profile.readlines(_BLOCK_SIZE)
+        while lines:
+            err_msg = _process_log_block(lines, log_columns)
+            if err_msg:
                 log.minor_fail("Parsing log")
                 return CollectStatus.ERROR, err_msg, dict(kwargs)
-
-            # Get the first and last record timestamps to determine the profiling time
-            profile_end = int(record.timestamp)
-            if is_first_line:
-                is_first_line = False
-                profile_start = int(record.timestamp)
+            lines = profile.readlines(_BLOCK_SIZE)
     log.minor_success("Parsing log")
 
-    # Update the profile dictionary
-    kwargs["profile"] = {
-        "global": {
-            "time": f"{(profile_end - profile_start) / _MICRO_TO_SECONDS}s",
-            "resources": resources,
-        }
-    }
+    # Update the profile with columns of resources of each function
+    kwargs["profile"] = Profile()
+    profile_time = f"{(log_columns.end - (log_columns.start or 0)) / _MICRO_TO_SECONDS}s"
+    for uid, amounts, sizes in _group_by_uids(log_columns, address_map):
+        kwargs["profile"].update_resource_columns(
+            {"type": "mixed", "subtype": _COLLECTOR_SUBTYPES["delta"], "uid": uid},
+            {"amount": amounts.tolist(), "structure-unit-size": sizes.tolist()},
+            {"time": profile_time},
+        )
     return CollectStatus.OK, _COLLECTOR_STATUS_MSG[0], dict(kwargs)
 
 
-def _process_file_record(
-    record: ProfileRecord,
-    call_stack: list[ProfileRecord],
-    resources: list[dict[str, Any]],
-    address_map: dict[str, str],
-) -> int:
-    """Processes the next profile record and tries to pair it with stack record if possible
+def _process_log_block(lines: list[str], log_columns: _LogColumns) -> Optional[str]:
+    """Parses the block of profiling log records and pairs the function calls with their returns
 
-    :param ProfileRecord record: the ProfileRecord tuple containing the record data
-    :param list call_stack: the call stack with file records
-    :param list resources: the list of resource dictionaries
-    :param dict address_map: the 'function address : demangled name' map
+    The records are converted to columns of actions, function codes, timestamps and sizes. The
+    calls are paired with returns using the depths of the call stack: each return is paired with
+    the closest preceding call on the same depth. The calls that were not returned yet are kept
+    as the call stack for the next block.
 
-    :return int: the status code, nonzero values for errors
+    :param list lines: the lines of the block of the profiling log
+    :param _LogColumns log_columns: the parsed columns and the parsing state shared by blocks
+
+    :return str: error message if the records cannot be paired, None otherwise
     """
-    returned_code = 1
-    if record.action == "i":
-        call_stack.append(record)
-        returned_code = 0
-    elif call_stack and call_stack[-1].action == "i" and call_stack[-1].func == record.func:
-        # Function exit, match with the function enter to create resources record
-        matching_record = call_stack.pop()
-        resources.append(
-            {
-                "amount": int(record.timestamp) - int(matching_record.timestamp),
-                "uid": address_map[record.func],
-                "type": "mixed",
-                "subtype": _COLLECTOR_SUBTYPES["delta"],
-                "structure-unit-size": int(record.size),
-            }
+    tokens = "".join(lines).split()
+    if len(tokens) != 4 * len(lines):
+        malformed = next(line for line in lines if len(line.split()) != 4)
+        return f"Malformed record: {malformed.strip()}"
+    addresses, address_codes = np.unique(np.array(tokens[1::4]), return_inverse=True)
+    for address in addresses:
+        if address not in log_columns.address_codes:
+            log_columns.address_codes[address] = len(log_columns.addresses)
+            log_columns.addresses.append(str(address))
+    codes = np.array([log_columns.address_codes[address] for address in addresses], dtype=np.int64)
+
+    # The call stack of the previous blocks is prepended to the records as the calls
+    stack_size = len(log_columns.stack_funcs)
+    is_call = np.concatenate((np.ones(stack_size, dtype=bool), np.array(tokens[0::4]) == "i"))
+    funcs = np.concatenate((log_columns.stack_funcs, codes[address_codes]))
+
+    # Calls are on the depth of the stack before them, returns on the depth after them
+    depths = np.cumsum(np.where(is_call, 1, -1))
+    depths[is_call] -= 1
+    order = np.argsort(depths, kind="stable")
+    ordered_depths, ordered_is_call, ordered_funcs = depths[order], is_call[order], funcs[order]
+
+    # Each return must directly follow the call of the same function on the same depth
+    follows_call = np.zeros(len(order), dtype=bool)
+    follows_call[1:] = (
+        (ordered_depths[1:] == ordered_depths[:-1])
+        & ordered_is_call[:-1]
+        & (ordered_funcs[1:] == ordered_funcs[:-1])
+    )
+    is_paired = ~ordered_is_call & follows_call & (ordered_depths >= 0)
+    unpaired = np.flatnonzero(~ordered_is_call & ~is_paired)
+    if len(unpaired):
+        first_unpaired = unpaired[np.argmin(order[unpaired])]
+        record = order[first_unpaired] - stack_size
+        err_msg = f"Call stack error, record: {tokens[4 * record + 1]}, {tokens[4 * record]}"
+        if ordered_depths[first_unpaired] < 0:
+            return err_msg + ", stack top: empty"
+        stack_top = log_columns.addresses[ordered_funcs[first_unpaired - 1]]
+        return err_msg + f", stack top: {stack_top}, i"
+
+    try:
+        timestamps = np.concatenate(
+            (log_columns.stack_timestamps, np.array(tokens[2::4], dtype=np.int64))
         )
-        returned_code = 0
-    # Call stack function frames not matching
-    return returned_code
+        sizes = np.array(tokens[3::4], dtype=np.int64)
+    except ValueError as exc:
+        return f"Malformed record: {exc}"
+    if log_columns.start is None:
+        log_columns.start = int(timestamps[stack_size])
+    log_columns.end = int(timestamps[-1])
+
+    # Pair the returns with the calls in the order of the returns
+    returns = np.flatnonzero(is_paired)
+    returns = returns[np.argsort(order[returns])]
+    return_records, call_records = order[returns], order[returns - 1]
+    log_columns.funcs.append(funcs[return_records])
+    log_columns.amounts.append(timestamps[return_records] - timestamps[call_records])
+    log_columns.sizes.append(sizes[return_records - stack_size])
+
+    # The calls without returns form the call stack for the next block
+    is_returned = np.zeros(len(order), dtype=bool)
+    is_returned[returns - 1] = True
+    stack = np.sort(order[ordered_is_call & ~is_returned])
+    log_columns.stack_funcs, log_columns.stack_timestamps = funcs[stack], timestamps[stack]
+    return None
+
+
+def _group_by_uids(
+    log_columns: _LogColumns, address_map: dict[str, str]
+) -> list[tuple[str, npt.NDArray[np.int64], npt.NDArray[np.int64]]]:
+    """Groups the paired calls by the uids of their functions
+
+    The address map is queried only once for each distinct function address.
+
+    :param _LogColumns log_columns: the parsed columns of the profiling log
+    :param dict address_map: the 'function address : demangled name' map
+
+    :return list: triples of uid, time deltas and structure sizes of its calls
+    """
+    if not log_columns.funcs:
+        return []
+    funcs = np.concatenate(log_columns.funcs)
+    paired_funcs = np.unique(funcs)
+    uids, paired_uids = np.unique(
+        [address_map[log_columns.addresses[func]] for func in paired_funcs], return_inverse=True
+    )
+    func_to_uid = np.zeros(len(log_columns.addresses), dtype=np.int64)
+    func_to_uid[paired_funcs] = paired_uids.ravel()
+    func_uids = func_to_uid[funcs]
+    order = np.argsort(func_uids, kind="stable")
+    bounds = np.flatnonzero(np.diff(func_uids[order])) + 1
+    amounts = np.split(np.concatenate(log_columns.amounts)[order], bounds)
+    sizes = np.split(np.concatenate(log_columns.sizes)[order], bounds)
+    return [
+        (str(uids[func_uids[group[0]]]), group_amounts, group_sizes)
+        for group, group_amounts, group_sizes in zip(np.split(order, bounds), amounts, sizes)
+    ]
 
 
 def _check_dependencies() -> None:
@@ -4,36 +4,206 @@ Contains helper functions for parsing information from perf
 from __future__ import annotations
 
 # Standard Imports
-from typing import Any
+from typing import Any, Iterable, Optional
+import collections
+import itertools
+import re
+import sys
 
 # Third-Party Imports
-import progressbar
 
 # Perun Imports
 
 
-def parse_events(perf_events: list[str]) -> list[dict[str, Any]]:
+# The patterns of the `perf script` output, w.r.t. the stackcollapse-perf.pl script
+PATTERN_HEADER: re.Pattern[str] = re.compile(r"^(\S.+?)\s+(\d+)/*(\d+)*\s+")
+PATTERN_EVENT: re.Pattern[str] = re.compile(r":\s*(\d+)*\s+(\S+):\s*$")
+PATTERN_FRAME: re.Pattern[str] = re.compile(r"^\s*(\w+)\s*(.+) \((.*)\)")
+PATTERN_OFFSET: re.Pattern[str] = re.compile(r"\+0x[\da-f]+$")
+PATTERN_ARGS: re.Pattern[str] = re.compile(r"\((?!anonymous namespace\)).*")
+PATTERN_JAVA_ARGS: re.Pattern[str] = re.compile(r"\.\(.*\)\.")
+
+
+class StackCollapser:
+    """Collapses the stacks of the `perf script` output into counts of samples of each stack
+
+    This is a built-in equivalent of the stackcollapse-perf.pl script of Brendan Gregg (with its
+    default options), that reads the output as a stream. The frames and stacks are interned, so
+    the identical stacks are aggregated already while reading and are referred to by their ids.
+
+    :ivar dict frames: cache of the raw frames (function and module) to their tidied functions
+    :ivar dict stack_ids: map of the interned stacks (command and its frames) to their ids
+    :ivar list stacks: the interned stacks indexed by their ids
+    :ivar dict traces: cache of traces of the stacks in the format of the profile
+    :ivar str event_filter: the type of the collapsed events, the first encountered one by default
+    """
+
+    __slots__ = ["frames", "stack_ids", "stacks", "traces", "event_filter"]
+
+    def __init__(self) -> None:
+        """Initializes empty tables of the interned frames and stacks"""
+        self.frames: dict[tuple[str, str, bool], tuple[str, ...]] = {}
+        self.stack_ids: dict[tuple[str, ...], int] = {}
+        self.stacks: list[tuple[str, ...]] = []
+        self.traces: dict[int, list[dict[str, str]]] = {}
+        self.event_filter: str = ""
+
+    def collapse(self, perf_script_lines: Iterable[str]) -> collections.Counter[int]:
+        """Collapses the samples of the `perf script` output into counts of samples of stacks
+
+        :param perf_script_lines: lines of the `perf script` output
+        :return: number of samples of each id of the stack
+        """
+        counts: collections.Counter[int] = collections.Counter()
+        pname: Optional[str] = None
+        period = 1
+        frame_groups: list[tuple[str, ...]] = []
+        for line in perf_script_lines:
+            if line[:1] in ("\t", " "):
+                # The frames are the most frequent lines, hence they are checked first
+                if pname is not None and (frame := PATTERN_FRAME.match(line)):
+                    raw_frame: tuple[str, str, bool] = (
+                        frame.group(2),
+                        frame.group(3),
+                        pname.startswith("java"),
+                    )
+                    if (funcs := self.frames.get(raw_frame)) is None:
+                        funcs = self.frames[raw_frame] = self._tidy_frame(*raw_frame)
+                    frame_groups.append(funcs)
+            elif line.startswith("#"):
+                continue
+            elif not line.rstrip("\n"):
+                if pname is not None:
+                    counts[self._intern_stack(pname, frame_groups)] += period
+                pname, frame_groups = None, []
+            elif header := PATTERN_HEADER.match(line):
+                pname, period = self._parse_header(header.group(1), line)
+        return counts
+
+    def _parse_header(self, command: str, line: str) -> tuple[Optional[str], int]:
+        """Parses the header of the sample, i.e. its command, period and event
+
+        :param command: the command of the sample
+        :param line: the header line
+        :return: the process name (None if the event is filtered) and the period of the sample
+        """
+        period = 1
+        if event := PATTERN_EVENT.search(line):
+            if not self.event_filter:
+                self.event_filter = event.group(2)
+            elif event.group(2) != self.event_filter:
+                return None, period
+            period = int(event.group(1) or 0) or 1
+        return sys.intern(command.replace(" ", "_")), period
+
+    @staticmethod
+    def _tidy_frame(raw_func: str, module: str, is_java: bool) -> tuple[str, ...]:
+        """Converts the raw frame to the (possibly inlined) functions of the stack
+
+        :param raw_func: the raw function with its offset
+        :param module: the module of the function
+        :param is_java: whether the process of the sample is java
+        :return: the tidied functions of the frame
+        """
+        raw_func = PATTERN_OFFSET.sub("", raw_func)
+        inlined: list[str] = []
+        # Skip the process names
+        for func in [] if raw_func.startswith("(") else raw_func.split("->"):
+            if func == "[unknown]":
+                # use module name instead, if known
+                func = f"[{module.rsplit('/', 1)[-1]}]" if module != "[unknown]" else "[unknown]"
+            func = func.replace(";", ":")
+            if not PATTERN_JAVA_ARGS.search(func):
+                func = PATTERN_ARGS.sub("", func, count=1)
+            func = func.replace('"', "").replace("'", "")
+            if is_java and "/" in func and func.startswith("L"):
+                func = func[1:]
+            if inlined and "_[i]" not in func:
+                func += "_[i]"
+            inlined.append(sys.intern(func))
+        return tuple(inlined)
+
+    def _intern_stack(self, pname: str, frame_groups: list[tuple[str, ...]]) -> int:
+        """Interns the stack of the sample
+
+        The frames of the `perf script` are listed from the leaf, while the collapsed stack is
+        listed from the root.
+
+        :param pname: the process name of the sample
+        :param frame_groups: the functions of the frames of the sample
+        :return: the id of the interned stack
+        """
+        stack = (pname,) + tuple(itertools.chain.from_iterable(reversed(frame_groups)))
+        stack_id = self.stack_ids.setdefault(stack, len(self.stacks))
+        if stack_id == len(self.stacks):
+            self.stacks.append(stack)
+        return stack_id
+
+    def trace_of(self, stack_id: int) -> list[dict[str, str]]:
+        """Returns the trace of the stack in the format of the profile
+
+        The traces are shared by all the resources of the same stack.
+
+        :param stack_id: the id of the interned stack
+        :return: list of the frames of the stack, excluding the command and the uid
+        """
+        if (trace := self.traces.get(stack_id)) is None:
+            trace = self.traces[stack_id] = [{"func": f} for f in self.stacks[stack_id][1:-1]]
+        return trace
+
+
+def parse_events(
+    perf_events: list[collections.Counter[int]], stacks: StackCollapser
+) -> list[dict[str, Any]]:
     """Parses perf events into a list of resources
 
     Each resource is identified by its topmost called function (uid),
     and contains traces and unit (the bottom function). For each
     function we count the number of samples.
 
-    :param perf_events: string with perf events
+    :param perf_events: numbers of samples of the collapsed stacks, for each run of perf
+    :param stacks: the interned stacks of the perf events
     :return: list of resources
     """
     resources = []
-    for event in progressbar.progressbar(perf_events):
-        if event.strip():
-            record, samples = event.split(" ")
-            parts = record.split(";")
-            command, trace, uid = parts[0], parts[1:-1], parts[-1]
+    for run_events in perf_events:
+        for stack_id, samples in run_events.items():
+            stack = stacks.stacks[stack_id]
             resources.append(
                 {
-                    "amount": int(samples),
-                    "uid": uid,
-                    "command": command,
-                    "trace": [{"func": f} for f in trace],
+                    "amount": samples,
+                    "uid": stack[-1],
+                    "command": stack[0],
+                    "trace": stacks.trace_of(stack_id),
                 }
             )
     return resources
+
+
+def aggregate_events(
+    perf_events: list[collections.Counter[int]], stacks: StackCollapser
+) -> list[dict[str, Any]]:
+    """Parses perf events of all runs into a list of resources aggregated across the runs
+
+    Unlike :func:`parse_events`, each collapsed stack (i.e. its command, trace and uid) results
+    in single resource, which sums the samples of all runs. The numbers of samples in the
+    individual runs are retained in the `repeat-amounts` list (e.g. for estimating the variance).
+
+    :param perf_events: numbers of samples of the collapsed stacks, for each run of perf
+    :param stacks: the interned stacks of the perf events
+    :return: list of aggregated resources
+    """
+    resources = []
+    for stack_id in sorted(set().union(*perf_events)):
+        stack = stacks.stacks[stack_id]
+        repeat_amounts = [run_events[stack_id] for run_events in perf_events]
+        resources.append(
+            {
+                "amount": sum(repeat_amounts),
+                "repeat-amounts": repeat_amounts,
+                "uid": stack[-1],
+                "command": stack[0],
+                "trace": stacks.trace_of(stack_id),
+            }
+        )
+    return resources
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 # Standard Imports
-from pathlib import Path
 from typing import Any
-import os
+import collections
+import io
 import subprocess
 import time
 
@@ -17,7 +17,7 @@ from perun.collect.kperf import parser
 from perun.logic import runner
 from perun.utils import log
 from perun.utils.structs import Executable, CollectStatus
-from perun.utils.external import commands
+from perun.utils.external import commands, processes
 
 
 def before(**_: Any) -> tuple[CollectStatus, str, dict[str, Any]]:
@@ -31,15 +31,6 @@ def before(**_: Any) -> tuple[CollectStatus, str, dict[str, Any]]:
         all_found = False
         log.minor_fail(f"{log.cmd_style('perf')}", "not-executable")
 
-    # Check that helper script can be run
-    script_dir = Path(Path(__file__).resolve().parent, "scripts")
-    parse_script = os.path.join(script_dir, "stackcollapse-perf.pl")
-    if commands.is_executable(f'echo "" | {parse_script}'):
-        log.minor_success(f"{log.cmd_style(parse_script)}", "executable")
-    else:
-        all_found = False
-        log.minor_fail(f"{log.cmd_style(parse_script)}", "not-executable")
-
     if not all_found:
         log.minor_fail("Checking dependencies")
         return CollectStatus.ERROR, "Some depedencies cannot be run", {}
@@ -49,31 +40,41 @@ def before(**_: Any) -> tuple[CollectStatus, str, dict[str, Any]]:
     return CollectStatus.OK, "", {}
 
 
-def run_perf(executable: Executable, run_with_sudo: bool = False) -> str:
+def run_perf(
+    executable: Executable, stacks: parser.StackCollapser, run_with_sudo: bool = False
+) -> collections.Counter[int]:
     """Runs perf and obtains the output
 
+    The output of `perf script` is collapsed into the stacks as it is streamed from the perf.
+
     :param executable: run executable profiled by perf
+    :param stacks: the interned stacks of the collected samples
     :param run_with_sudo: if the command should be run with sudo
-    :return: parsed output of perf
+    :return: number of samples of each stack id
     """
-    script_dir = Path(Path(__file__).resolve().parent, "scripts")
-    parse_script = os.path.join(script_dir, "stackcollapse-perf.pl")
-
     if run_with_sudo:
         perf_record_command = f"sudo perf record -q -g -o collected.data {executable}"
-        perf_script_command = f"sudo perf script -i collected.data | {parse_script}"
+        perf_script_command = "sudo perf script -i collected.data"
     else:
         perf_record_command = f"perf record -q -g -o collected.data {executable}"
-        perf_script_command = f"perf script -i collected.data | {parse_script}"
+        perf_script_command = "perf script -i collected.data"
 
     try:
         commands.run_safely_external_command(perf_record_command)
-        out, _ = commands.run_safely_external_command(perf_script_command)
+        with processes.nonblocking_subprocess(
+            perf_script_command, {"stdout": subprocess.PIPE, "stderr": subprocess.DEVNULL}
+        ) as perf_script:
+            assert perf_script.stdout is not None
+            counts = stacks.collapse(
+                io.TextIOWrapper(perf_script.stdout, encoding="utf-8", errors="replace")
+            )
+            if perf_script.wait() != 0:
+                raise subprocess.CalledProcessError(perf_script.returncode, perf_script_command)
         log.minor_success(f"Raw data from {log.cmd_style(str(executable))}", "collected")
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, OSError):
         log.minor_fail(f"Raw data from {log.cmd_style(str(executable))}", "not collected")
-        return ""
-    return out.decode("utf-8")
+        return collections.Counter()
+    return counts
 
 
 def collect(executable: Executable, **kwargs: Any) -> tuple[CollectStatus, str, dict[str, Any]]:
@@ -82,16 +83,19 @@ def collect(executable: Executable, **kwargs: Any) -> tuple[CollectStatus, str,
     warmups = kwargs["warmup"]
     repeats = kwargs["repeat"]
 
+    kwargs["stacks"] = parser.StackCollapser()
+
     log.minor_info(f"Running {log.highlight(warmups)} warmup iterations")
     for _ in progressbar.progressbar(range(0, warmups)):
-        run_perf(executable, kwargs.get("with_sudo", False))
+        run_perf(executable, parser.StackCollapser(), kwargs.get("with_sudo", False))
 
     log.minor_info(f"Running {log.highlight(repeats)} iterations")
     before_time = time.time()
     kwargs["raw_data"] = []
     for _ in progressbar.progressbar(range(0, repeats)):
-        output = run_perf(executable, kwargs.get("with_sudo", False))
-        kwargs["raw_data"].extend(output.splitlines())
+        kwargs["raw_data"].append(
+            run_perf(executable, kwargs["stacks"], kwargs.get("with_sudo", False))
+        )
     kwargs["time"] = time.time() - before_time
 
     return CollectStatus.OK, "", kwargs
@@ -100,7 +104,10 @@ def collect(executable: Executable, **kwargs: Any) -> tuple[CollectStatus, str,
 def after(**kwargs: Any) -> tuple[CollectStatus, str, dict[str, Any]]:
     """Parses the raw data into performance profile"""
     log.major_info("Creating performance profile")
-    resources = parser.parse_events(kwargs["raw_data"])
+    if kwargs.get("aggregate", False):
+        resources = parser.aggregate_events(kwargs["raw_data"], kwargs["stacks"])
+    else:
+        resources = parser.parse_events(kwargs["raw_data"], kwargs["stacks"])
 
     if resources:
         log.minor_success("perf events", "parsed")
@@ -136,6 +143,16 @@ def after(**kwargs: Any) -> tuple[CollectStatus, str, dict[str, Any]]:
     type=click.INT,
     help="Runs [INT] samplings of the profiled command.",
 )
+@click.option(
+    "--aggregate",
+    "-a",
+    is_flag=True,
+    default=False,
+    help=(
+        "Aggregates the samples of the same stacks across the samplings into single resource,"
+        " retaining the numbers of samples of the individual samplings."
+    ),
+)
 def kperf(ctx: click.Context, **kwargs: Any) -> None:
     """Generates kernel sampled traces for specific commands based on perf."""
     runner.run_collector_from_cli_context(ctx, "kperf", kwargs)
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 # Standard Imports
 from decimal import Decimal
-from typing import Any, TYPE_CHECKING
+from typing import Any, Iterator, TYPE_CHECKING
 import collections
 import re
 
@@ -122,44 +122,59 @@ def parse_resources(allocation: list[str]) -> dict[str, Any]:
     return data
 
 
-def parse_log(filename: str, executable: Executable, snapshots_interval: float) -> dict[str, Any]:
-    """Parse raw data in the log file
+def iterate_allocations(filename: str) -> Iterator[list[str]]:
+    """Iterates through the allocations in the log file one by one
+
+    The allocations are separated by an empty line and the log has to end with the EXIT record.
+    The log is read line by line, so at most one allocation is held in the memory.
 
     :param string filename: name of the log file
-    :param Executable executable: profiled binary
-    :param float snapshots_interval: interval of snapshots [s]
-    :returns structure: formatted structure representing section "snapshots" and "global"
-        in memory profile
+    :returns iterator: iterator of allocations as lists of their raw lines
+    :raises ValueError: if the log does not end with the EXIT record, i.e. it is malformed
     """
-    interval = snapshots_interval
+    allocation: list[str] = []
     with open(filename) as logfile:
-        log_lines = logfile.read()
-    # allocations are split by empty line
-    log = log_lines.split("\n\n")
+        for line in logfile:
+            line = line.rstrip("\n")
+            if line:
+                allocation.append(line)
+            elif allocation:
+                yield allocation
+                allocation = []
 
     # Check that there is exit, and the Memory Log is thus not malformed
-    if log.pop().strip().find("EXIT") == -1:
+    if not any("EXIT" in line for line in allocation):
         raise ValueError
 
-    allocations = []
-    for item in log:
-        allocations.append(item.splitlines())
 
+def parse_log(
+    filename: str, executable: Executable, snapshots_interval: float
+) -> Iterator[dict[str, Any]]:
+    """Parse raw data in the log file
+
+    The log is streamed twice: first, the names and addresses of the stack traces are collected
+    to resolve them collectively and then the allocations are parsed into snapshots, which are
+    yielded one by one as soon as their interval is over.
+
+    :param string filename: name of the log file
+    :param Executable executable: profiled binary
+    :param float snapshots_interval: interval of snapshots [s]
+    :returns iterator: iterator of snapshots, i.e. dictionaries with "time" and "resources"
+    """
     # Collect names and addresses for demangling and addr2line collective call
     names, ips = set(), set()
-    for allocation in allocations:
+    for allocation in iterate_allocations(filename):
         for resource in allocation[2:]:
             name, instruction_pointer, offset = resource.split(" ")
             names.add(name)
             ips.add((instruction_pointer, offset))
 
     # Build caches for demangle and addr2line for further calls
-    syscalls.build_demangle_cache(names)
-    syscalls.build_address_to_line_cache(ips, executable.cmd)
+    syscalls.build_symbol_caches(names, ips, executable.cmd)
 
-    snapshots = []
+    interval = snapshots_interval
     data: dict[str, Any] = {"time": f"{interval:f}", "resources": []}
-    for allocation in allocations:
+    for allocation in iterate_allocations(filename):
         # parsing timestamp,
         # it's the only one number on the 1st line
         time_string = allocation[0]
@@ -170,7 +185,7 @@ def parse_log(filename: str, executable: Executable, snapshots_interval: float)
         time = Decimal(common_kit.safe_match(PATTERN_TIME, time_string, "-1"))
 
         while time > interval:
-            snapshots.append(data)
+            yield data
             interval += snapshots_interval
             data = {"resources": [], "time": f"{interval:f}"}
 
@@ -178,7 +193,4 @@ def parse_log(filename: str, executable: Executable, snapshots_interval: float)
         # parsing resources,
         data["resources"].append(parse_resources(allocation))
 
-    if data:
-        snapshots.append(data)
-
-    return {"snapshots": snapshots, "global": {"resources": []}}
+    yield data
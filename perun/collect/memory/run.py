@@ -11,6 +11,7 @@ import click
 # Perun Imports
 from perun.collect.memory import filter as filters, parsing as parser, syscalls
 from perun.logic import runner
+from perun.profile.factory import Profile
 from perun.utils import log
 from perun.utils.structs import CollectStatus, Executable
 
@@ -107,8 +108,22 @@ def after(
     exclude_funcs = kwargs.get("no_func", [])
     exclude_sources = kwargs.get("no_source", [])
 
+    # The snapshots are filtered and added to the profile one by one as they are parsed
+    profile = Profile()
     try:
-        profile = parser.parse_log(_tmp_log_filename, executable, sampling)
+        for snapshot_number, snapshot in enumerate(
+            parser.parse_log(_tmp_log_filename, executable, sampling)
+        ):
+            batch = {"snapshots": [snapshot]}
+            if not include_all:
+                filters.remove_allocators(batch)
+                filters.trace_filter(batch, function=["?"], source=["unreachable"])
+            if exclude_funcs or exclude_sources:
+                filters.allocation_filter(batch, function=exclude_funcs, source=exclude_sources)
+            filters.remove_uidless_records_from(batch)
+            profile.update_resources(
+                batch["snapshots"], "snapshots", first_snapshot=snapshot_number
+            )
     except (IndexError, ValueError) as parse_err:
         log.minor_fail("Parsing of log")
         return (
@@ -117,18 +132,11 @@ def after(
             {},
         )
     log.minor_success("Parsing of log")
-    filters.set_global_region(profile)
 
     if not include_all:
-        filters.remove_allocators(profile)
-        filters.trace_filter(profile, function=["?"], source=["unreachable"])
         log.minor_success("Filtering traces")
-
     if exclude_funcs or exclude_sources:
-        filters.allocation_filter(profile, function=exclude_funcs, source=exclude_sources)
         log.minor_success("Excluding functions")
-
-    filters.remove_uidless_records_from(profile)
     log.minor_success("Removing unassigned records")
 
     return CollectStatus.OK, "", {"profile": profile}
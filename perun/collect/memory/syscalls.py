@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 # Standard Imports
-from typing import Any, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
+import hashlib
 import os
 import re
 import subprocess
@@ -10,33 +11,40 @@ import subprocess
 # Third-Party Imports
 # Perun Imports
 
-from perun.utils.exceptions import SuppressedExceptions
+from perun.logic import temp
+from perun.utils.exceptions import NotPerunRepositoryException, SuppressedExceptions
 
 if TYPE_CHECKING:
     from perun.utils.structs import Executable
 
 PATTERN_WORD = re.compile(r"(\w+)|[?]")
 PATTERN_HEXADECIMAL = re.compile(r"0x[0-9a-fA-F]+")
+PATTERN_BUILD_ID = re.compile(r"Build ID:\s*([0-9a-fA-F]+)")
+
+# The directory in the perun tmp/ with the persistent symbol caches of the profiled binaries
+SYMBOL_CACHE_DIR = "memory/symbols"
 
 
 demangle_cache = {}
 address_to_line_cache = {}
 
 
-def build_demangle_cache(names: set[str]) -> None:
+def build_demangle_cache(names: set[str], cached: Optional[dict[str, str]] = None) -> None:
     """Builds global cache for demangle() function calls.
 
     Instead of continuous calls to subprocess, this takes all of the collected names
-    and calls the demangle just once, while constructing the cache.
+    and demangles the names, that are not cached yet, by a single run of c++filt.
 
     :param set names: set of names that will be demangled in future
+    :param dict cached: already demangled names
     """
     global demangle_cache
 
-    list_of_names = [name for name in names if PATTERN_WORD.match(name)]
-    sys_call = ["c++filt"] + list_of_names
-    output = subprocess.check_output(sys_call).decode("utf-8").strip()
-    demangle_cache = dict(zip(list_of_names, output.split("\n")))
+    demangle_cache = dict(cached or {})
+    list_of_names = [
+        name for name in names if PATTERN_WORD.match(name) and name not in demangle_cache
+    ]
+    demangle_cache.update(zip(list_of_names, _resolve_by_stdin(["c++filt"], list_of_names)))
 
 
 def demangle(name: str) -> str:
@@ -47,24 +55,28 @@ def demangle(name: str) -> str:
     return demangle_cache[name]
 
 
-def build_address_to_line_cache(addresses: set[tuple[str, str]], binary_name: str) -> None:
+def build_address_to_line_cache(
+    addresses: set[tuple[str, str]], binary_name: str, cached: Optional[dict[str, Any]] = None
+) -> None:
     """Builds global cache for address_to_line() function calls.
 
     Instead of continuous calls to subprocess, this takes all of collected
-    names and calls the addr2line just once.
+    addresses and translates the addresses, that are not cached yet, by a single run of addr2line.
 
     :param set addresses: set of addresses that will be translated to line info
     :param str binary_name: name of the binary which will be parsed for info
+    :param dict cached: already translated addresses of the binary
     """
     global address_to_line_cache
 
-    list_of_addresses = [a[0] for a in addresses if PATTERN_HEXADECIMAL.match(a[0])]
-
-    sys_call = ["addr2line", "-e", binary_name] + list_of_addresses
-    output = subprocess.check_output(sys_call).decode("utf-8").strip()
-    address_to_line_cache = dict(
-        zip(list_of_addresses, map(lambda x: x.split(":"), output.split("\n")))
-    )
+    address_to_line_cache = dict(cached or {})
+    list_of_addresses = [
+        a[0]
+        for a in addresses
+        if PATTERN_HEXADECIMAL.match(a[0]) and a[0] not in address_to_line_cache
+    ]
+    lines = _resolve_by_stdin(["addr2line", "-e", binary_name], list_of_addresses)
+    address_to_line_cache.update(zip(list_of_addresses, (line.split(":") for line in lines)))
 
 
 def address_to_line(ip: str) -> list[Any]:
@@ -75,6 +87,76 @@ def address_to_line(ip: str) -> list[Any]:
     return address_to_line_cache[ip][:]
 
 
+def build_symbol_caches(names: set[str], addresses: set[tuple[str, str]], binary_name: str) -> None:
+    """Builds global caches for demangle() and address_to_line() function calls.
+
+    The caches are persistently stored in the perun tmp/ directory for each build of the binary
+    (see :func:`binary_key`), hence the repeated collections of the same binary resolve only the
+    names and addresses, that were not seen by the previous collections.
+
+    :param set names: set of names that will be demangled in future
+    :param set addresses: set of addresses that will be translated to line info
+    :param str binary_name: name of the binary which will be parsed for info
+    """
+    cache_file: Optional[str] = None
+    cached: dict[str, dict[str, str]] = {}
+    with SuppressedExceptions(OSError, NotPerunRepositoryException):
+        cache_file = os.path.join(SYMBOL_CACHE_DIR, f"{binary_key(binary_name)}.json")
+        if temp.exists_temp_file(cache_file):
+            cached = temp.read_temp(cache_file) or {}
+
+    build_demangle_cache(names, cached.get("demangle"))
+    build_address_to_line_cache(addresses, binary_name, cached.get("address_to_line"))
+
+    is_updated = len(demangle_cache) != len(cached.get("demangle", {})) or len(
+        address_to_line_cache
+    ) != len(cached.get("address_to_line", {}))
+    if cache_file is not None and is_updated:
+        with SuppressedExceptions(OSError, NotPerunRepositoryException):
+            temp.store_temp(
+                cache_file,
+                {"demangle": demangle_cache, "address_to_line": address_to_line_cache},
+                json_format=True,
+                compress=True,
+            )
+
+
+def binary_key(binary_name: str) -> str:
+    """Computes the key identifying the build of the binary in the persistent symbol caches
+
+    The GNU build ID of the binary is used if the binary has one, otherwise the key is the hash
+    of the binary content.
+
+    :param str binary_name: name of the binary
+    :returns str: the key of the binary build
+    """
+    with SuppressedExceptions(subprocess.CalledProcessError, OSError):
+        output = subprocess.check_output(["readelf", "-n", binary_name], stderr=subprocess.DEVNULL)
+        build_id = PATTERN_BUILD_ID.search(output.decode("utf-8", errors="ignore"))
+        if build_id:
+            return f"build-id-{build_id.group(1).lower()}"
+    binary_hash = hashlib.sha256()
+    with open(binary_name, "rb") as binary:
+        for chunk in iter(lambda: binary.read(2**20), b""):
+            binary_hash.update(chunk)
+    return f"sha256-{binary_hash.hexdigest()}"
+
+
+def _resolve_by_stdin(sys_call: list[str], queries: list[str]) -> list[str]:
+    """Resolves the queries by a single run of the tool, that reads them from its standard input
+
+    The queries are not passed as the arguments of the tool, since their number is limited.
+
+    :param list sys_call: the command of the tool, that outputs single line per each query
+    :param list queries: the queries, each on single line
+    :returns list: the output line of each query
+    """
+    if not queries:
+        return []
+    output = subprocess.check_output(sys_call, input="\n".join(queries).encode("utf-8") + b"\n")
+    return output.decode("utf-8").strip().split("\n")
+
+
 def run(executable: Executable) -> tuple[int, str]:
     """
     :param Executable executable: executable command
@@ -29,6 +29,7 @@ class Configuration:
     :ivar bool stap_cache_off: specifies if systemtap cache should be enabled or disabled
     :ivar bool generate_dynamic_cg: specifies whether dynamic CG should be reconstructed from trace
     :ivar bool no_profile: disables profile generation
+    :ivar int jobs: the number of processes transforming the raw performance data
     :ivar list run_optimizations: list of run-phase optimizations that are enabled
     :ivar dict run_optimization_parameters: optimization parameter name -> value mapping
     :ivar float or None timeout: the timeout for the profiled command or None if indefinite
@@ -60,6 +61,7 @@ class Configuration:
         self.stap_cache_off = cli_config.get("stap_cache_off", False)
         self.generate_dynamic_cg = cli_config.get("generate_dynamic_cg", False)
         self.no_profile = cli_config.get("no_profile", False)
+        self.jobs = max(cli_config.get("jobs", 1), 1)
         self.cg_extraction = cli_config.get("only_extract_cg", False)
         # TODO: temporary
         self.maximum_threads = cli_config.get("max_simultaneous_threads", 5)
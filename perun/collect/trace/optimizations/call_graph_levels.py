@@ -15,7 +15,9 @@ to seamlessly integrate into the Call Graph class.
 
 from enum import Enum
 
-import networkx as nx
+from perun.utils.common import common_kit
+
+nx = common_kit.lazy_import("networkx")
 
 
 class LevelEstimator(Enum):
@@ -16,7 +16,9 @@ import array
 import collections
 import dataclasses
 
-import numpy as np
+from perun.utils.common import common_kit
+
+np = common_kit.lazy_import("numpy")
 
 # The quartiles
 _Q1, _Q2, _Q3 = 25, 50, 75
@@ -5,11 +5,13 @@ incompatible with angr atm.
 
 
 import os
-import angr
 
 import perun.logic.stats as stats
+from perun.utils.common import common_kit
 from perun.utils.exceptions import StatsFileNotFoundException, SuppressedExceptions
 
+angr = common_kit.lazy_import("angr")
+
 
 def extract(stats_name, binary, cache, **kwargs):
     """Extract the Call Graph and Control Flow Graph representation using the angr framework.
@@ -328,6 +328,16 @@ def teardown(**kwargs):
     default=False,
     help="Tracer will not transform and save processed data into a perun profile.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help=(
+        "Sets the number of processes transforming the raw performance data. The threads of the"
+        " profiled command are distributed among the processes."
+    ),
+)
 # TODO: temporary
 @click.option(
     "--extract-mixed-cg",
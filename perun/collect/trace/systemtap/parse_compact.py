@@ -5,8 +5,12 @@
 import os
 import collections
 import array
+import heapq
+import operator
 from multiprocessing import Process
 
+import numpy as np
+
 import perun.collect.trace.processes as proc
 import perun.utils.metrics as metrics
 import perun.collect.trace.optimizations.resources.manager as resources
@@ -25,6 +29,119 @@ from perun.utils.exceptions import (
 )
 
 
+# The size of the blocks of the raw data that are parsed at once
+_BLOCK_SIZE = 2**22
+# The maximal number of digits of the numeric components parsed in bulk, longer numbers (that
+# could overflow the 64-bit integers) are parsed record by record
+_MAX_DIGITS = 18
+_POWERS_OF_TEN = 10 ** np.arange(_MAX_DIGITS, dtype=np.int64)
+_NEWLINE, _SPACE, _SEMICOLON, _ZERO, _NINE = (ord(char) for char in "\n ;09")
+# The number of blocks of the raw data, that are transformed by the shards ahead of the resources
+# merged from the shards
+_SHARD_BLOCKS_AHEAD = 2
+
+# The components of the parsed raw data records, where the probe is the index of the probe in the
+# ProbeTable and the corrupted records have negative probe index
+RECORD_DTYPE = np.dtype(
+    [
+        ("type", np.int64),
+        ("tid", np.int64),
+        ("pid", np.int64),
+        ("ppid", np.int64),
+        ("timestamp", np.int64),
+        ("probe", np.int64),
+        ("seq", np.int64),
+    ]
+)
+
+
+class ProbeTable:
+    """Class that maps the probe IDs of the raw data records to consecutive indices and keeps
+    the name, sampling step and library of each probe. The names and libraries are further mapped
+    to consecutive codes, so the records can be compared by their names in bulk.
+
+    :ivar dict probe_map: the probe ID -> name, sampling step and library of specified probes
+    :ivar dict indices: the raw probe ID -> index of the probe
+    :ivar list names: the name of each name code
+    :ivar dict name_codes: the name -> name code
+    :ivar list libs: the library of each library code
+    :ivar dict lib_codes: the library -> library code
+    :ivar list name_of: the name code of each probe index
+    :ivar list step_of: the sampling step of each probe index
+    :ivar list lib_of: the library code of each probe index
+    """
+
+    def __init__(self, probes, verbose_trace):
+        """
+        :param Probes probes: the probes specification
+        :param bool verbose_trace: flag indicating whether the raw data are verbose or not
+        """
+        # ID (numeric id or name) -> (NAME, SAMPLE, LIB)
+        dict_key = "name" if verbose_trace else "id"
+        self.probe_map = {
+            str(probe[dict_key]): (
+                probe["name"],
+                probe["sample"],
+                os.path.basename(probe["lib"]),
+            )
+            for probe in list(probes.func.values()) + list(probes.usdt.values())
+        }
+        self.indices = {}
+        self.names, self.name_codes = [], {}
+        self.libs, self.lib_codes = [], {}
+        self.name_of, self.step_of, self.lib_of = [], [], []
+
+    def index(self, probe_id):
+        """Returns the index of the raw probe ID, the unknown probes are named by their ID.
+
+        :param bytes probe_id: the probe ID as found in the raw data
+        :return int: the index of the probe
+        """
+        index = self.indices.get(probe_id)
+        if index is None:
+            decoded = probe_id.decode(errors="replace")
+            name, step, lib = self.probe_map.get(decoded, (decoded, 0, decoded))
+            index = len(self.name_of)
+            self.name_of.append(self.name_code(name))
+            self.step_of.append(step)
+            self.lib_of.append(self.lib_code(lib))
+            self.indices[probe_id] = index
+        return index
+
+    def name_code(self, name):
+        """Returns the code of the probe name.
+
+        :param str name: the name of the probe
+        :return int: the code of the name
+        """
+        code = self.name_codes.setdefault(name, len(self.names))
+        if code == len(self.names):
+            self.names.append(name)
+        return code
+
+    def lib_code(self, lib):
+        """Returns the code of the probe library.
+
+        :param str lib: the library of the probe
+        :return int: the code of the library
+        """
+        code = self.lib_codes.setdefault(lib, len(self.libs))
+        if code == len(self.libs):
+            self.libs.append(lib)
+        return code
+
+    def columns(self):
+        """Returns the name codes, sampling steps and library codes of the probe indices.
+
+        :return tuple: the arrays of name codes, sampling steps and library codes
+        """
+        return (
+            np.array(self.name_of, dtype=np.int64),
+            np.array(self.step_of, dtype=np.int64),
+            np.array(self.lib_of, dtype=np.int64),
+        )
+
+
 class ThreadContext:
     """Class that keeps track of function call stack, USDT hit stack, function call sequence
     map and bottom indicator per each active thread.
@@ -53,6 +170,7 @@ class TransformContext:
     :ivar set binaries: all profiled binaries (including libraries)
     :ivar str workload: the workload specification of the current run
     :ivar Probes probes: the probes specification
+    :ivar ProbeTable probe_table: the mapping of the probe IDs of the raw data records
     :ivar set probes_hit: a set of actually hit probes
     :ivar ThreadContext per_thread: per-thread context for function / usdt stacks, sequence maps etc
     :ivar dict bottom: summary of total elapsed time per bottom functions per thread
@@ -70,6 +188,7 @@ class TransformContext:
         self.binaries = binaries
         self.workload = workload
         self.probes = probes
+        self.probe_table = ProbeTable(probes, verbose_trace)
         self.probes_hit = set()
         self.per_thread = collections.defaultdict(ThreadContext)
         # Thread -> function -> total elapsed time
@@ -171,6 +290,9 @@ def process_records(data_file, config, probes):
     """Transforms the collection output into performance resources. The
     collected time data are paired and provided as resources dictionaries.
 
+    The raw data are parsed and transformed in blocks (see :func:`transform_record_blocks`), or
+    in shards of threads by multiple processes (see :func:`transform_record_shards`).
+
     :param str data_file: name of the collection output file
     :param Configuration config: the configuration object
     :param Probes probes: the Probes object
@@ -180,21 +302,13 @@ def process_records(data_file, config, probes):
     # Initialize the context
     binaries = set(map(os.path.basename, config.libs + [config.binary]))
     ctx = TransformContext(probes, binaries, config.verbose_trace, config.executable.workload)
-    # Get the handlers
-    handlers = _record_handlers()
 
     metrics.start_timer("data-processing")
-    record = None
     try:
-        for record in parse_records(data_file, probes, config.verbose_trace):
-            try:
-                # Invoke the correct handler based on the record type and return the
-                # resulting resource, if any
-                resource = handlers[record["type"]](record, ctx)
-                if resource:
-                    yield resource
-            except (KeyError, IndexError):
-                continue
+        if config.jobs > 1:
+            yield from transform_record_shards(data_file, ctx, config.jobs)
+        else:
+            yield from transform_record_blocks(data_file, ctx)
 
         # Register computed metrics
         metrics.end_timer("data-processing")
@@ -221,11 +335,560 @@ def process_records(data_file, config, probes):
 
     except Exception:
         WATCH_DOG.info("Error while processing the raw trace output")
-        WATCH_DOG.debug(f"Record: {record}")
         WATCH_DOG.debug(f"Context: {ctx}")
         raise
 
 
+def transform_record_blocks(data_file, ctx):
+    """Transforms the blocks of raw data records into performance resources.
+
+    :param str data_file: name of the collection output file
+    :param TransformContext ctx: the parsing context object
+
+    :return iterable: generator object that produces dictionaries representing the resources
+    """
+    handlers = _record_handlers()
+    for records in parse_record_blocks(data_file, ctx.probe_table):
+        yield from _transform_block(records, ctx, handlers)[1]
+
+
+def transform_record_shards(data_file, ctx, jobs):
+    """Transforms the raw data records into performance resources by the shard processes.
+
+    The records of different threads are independent of each other, hence the threads are split
+    into shards (see :func:`_split_into_shards`), each transformed by its own process with its own
+    context (see :func:`_transform_shard`). The raw data are still parsed and sent to the shards in
+    blocks and the resources of each block are merged in the order of the records that completed
+    them, i.e. the same as provided by :func:`transform_record_blocks`. At most
+    :data:`_SHARD_BLOCKS_AHEAD` blocks are transformed ahead of the merged resources, so the
+    resources are streamed as they are transformed. Finally, the contexts of the shards are merged
+    into the given context.
+
+    :param str data_file: name of the collection output file
+    :param TransformContext ctx: the parsing context object
+    :param int jobs: the number of shard processes
+
+    :return iterable: generator object that produces dictionaries representing the resources
+    """
+    if jobs <= 1:
+        # A single shard is transformed by the current process without the overhead of workers
+        yield from transform_record_blocks(data_file, ctx)
+        return
+
+    shard_args = (ctx.probes, ctx.binaries, ctx.verbose_trace, ctx.workload)
+    record_queues = [proc.SafeQueue() for _ in range(jobs)]
+    resource_queues = [proc.SafeQueue() for _ in range(jobs)]
+    shard_processes = [
+        Process(target=_transform_shard, args=(record_queue, resource_queue, *shard_args))
+        for record_queue, resource_queue in zip(record_queues, resource_queues)
+    ]
+
+    def merge_shard_resources():
+        """Merges the resources of the oldest block transformed by the shards"""
+        positions, resources = [], []
+        for resource_queue in resource_queues:
+            shard_resources = resource_queue.read()
+            if shard_resources is None:
+                raise RuntimeError("the shard process transforming the records terminated")
+            positions.append(shard_resources[0])
+            resources.extend(shard_resources[1])
+        order = np.argsort(np.concatenate(positions), kind="stable").tolist()
+        return map(resources.__getitem__, order)
+
+    try:
+        for shard_process in shard_processes:
+            shard_process.start()
+        shard_of, shard_loads = {}, [0] * jobs
+        first_position, blocks_ahead, shared_probes = 0, 0, -1
+        for records in parse_record_blocks(data_file, ctx.probe_table):
+            # The probes are indexed while parsing, hence the shards need the updated probe table
+            probe_table = None
+            if len(ctx.probe_table.name_of) != shared_probes:
+                probe_table, shared_probes = ctx.probe_table, len(ctx.probe_table.name_of)
+            shards = _split_into_shards(records, first_position, shard_of, shard_loads)
+            for record_queue, (shard_records, positions) in zip(record_queues, shards):
+                record_queue.write((shard_records, positions, probe_table))
+            first_position += len(records)
+            if blocks_ahead < _SHARD_BLOCKS_AHEAD:
+                blocks_ahead += 1
+            else:
+                yield from merge_shard_resources()
+        for record_queue in record_queues:
+            record_queue.end_of_input()
+        for _ in range(blocks_ahead):
+            yield from merge_shard_resources()
+        for resource_queue in resource_queues:
+            _merge_shard_summary(ctx, resource_queue.read_large())
+    finally:
+        # Cleanup the queues
+        for record_queue in record_queues:
+            record_queue.close_writer()
+        for resource_queue in resource_queues:
+            resource_queue.close_reader()
+        # Wait for the shard processes to finish
+        for shard_process in shard_processes:
+            shard_process.join(timeout=vals.CLEANUP_TIMEOUT)
+            if shard_process.exitcode is None:
+                WATCH_DOG.info(f"Failed to terminate the shard process PID {shard_process.pid}.")
+
+
+def _split_into_shards(records, first_position, shard_of, shard_loads):
+    """Splits the block of records into the shards of their threads.
+
+    The threads are never split between two shards. Each thread seen for the first time (from
+    the largest one in the block) is assigned to the shard with the least records so far, so the
+    shards have roughly the same number of records. The corrupted records are omitted, since they
+    do not contribute to the resources.
+
+    :param ndarray records: the block of parsed raw data records
+    :param int first_position: the position of the first record of the block in the raw data
+    :param dict shard_of: the mapping of threads to their shards, the new threads are added
+    :param list shard_loads: the number of records of each shard so far, updated by the block
+
+    :return list: the records of each shard and their positions in the raw data
+    """
+    positions = np.flatnonzero(records["probe"] >= 0)
+    records = records[positions]
+    tids, inverse, counts = np.unique(records["tid"], return_inverse=True, return_counts=True)
+    for thread in np.argsort(-counts, kind="stable").tolist():
+        tid = int(tids[thread])
+        if tid not in shard_of:
+            shard_of[tid] = min(range(len(shard_loads)), key=shard_loads.__getitem__)
+        shard_loads[shard_of[tid]] += int(counts[thread])
+    thread_shards = np.array([shard_of[tid] for tid in tids.tolist()], dtype=np.int64)
+    record_shards = thread_shards[inverse.ravel()]
+    positions += first_position
+    shards = []
+    for shard in range(len(shard_loads)):
+        in_shard = np.flatnonzero(record_shards == shard)
+        shards.append((records[in_shard], positions[in_shard]))
+    return shards
+
+
+def _transform_shard(record_queue, resource_queue, probes, binaries, verbose_trace, workload):
+    """Transforms the records of the shard. Should be run as a standalone process that obtains
+    the blocks of shard records from a queue and returns their resources through a queue.
+
+    Each block is accompanied by the probe table, if it was updated by parsing the block. For
+    each block, the positions of the records that completed the resources and the resources
+    are returned. After the last block, the summary of the shard context is returned as well (see
+    :func:`_summarize_shard`).
+
+    :param SafeQueue record_queue: a multiprocessing queue for obtaining the blocks of records
+    :param SafeQueue resource_queue: a multiprocessing queue for passing the resources
+    :param Probes probes: the probes specification
+    :param set binaries: all profiled binaries (including libraries)
+    :param bool verbose_trace: switches between verbose / compact trace output
+    :param str workload: the workload specification of the current run
+    """
+    try:
+        ctx = TransformContext(probes, binaries, verbose_trace, workload)
+        handlers = _record_handlers()
+        shard = record_queue.read()
+        while shard is not None:
+            records, positions, probe_table = shard
+            if probe_table is not None:
+                ctx.probe_table = probe_table
+            block_positions, block_resources = _transform_block(records, ctx, handlers)
+            resource_queue.write((positions[block_positions], block_resources))
+            shard = record_queue.read()
+        resource_queue.write(_summarize_shard(ctx))
+    except SignalReceivedException:
+        # Interrupt signals should cause the process to properly terminate
+        pass
+    finally:
+        # Regardless of type of termination, queue resources should be cleaned
+        record_queue.close_reader()
+        resource_queue.close_writer()
+
+
+def _summarize_shard(ctx):
+    """Extracts the results of the shard context, that are not part of the resources.
+
+    :param TransformContext ctx: the context of the shard
+
+    :return dict: the hit probes, dynamic call graph and the statistics of the shard
+    """
+    return {
+        "probes_hit": ctx.probes_hit,
+        "dyn_cg": ctx.dyn_cg,
+        "bottom": {tid: dict(bottom) for tid, bottom in ctx.bottom.items()},
+        "level_times_exclusive": {
+            tid: dict(level_times) for tid, level_times in ctx.level_times_exclusive.items()
+        },
+        "funcs": {tid: dict(funcs) for tid, funcs in ctx.funcs.items()},
+        "processes": dict(ctx.processes),
+        "threads": ctx.threads,
+    }
+
+
+def _merge_shard_summary(ctx, summary):
+    """Merges the results of the shard into the transformation context.
+
+    The statistics are kept per thread, hence the threads of the shards are simply added.
+
+    :param TransformContext ctx: the parsing context object
+    :param dict summary: the summary of the shard context
+    """
+    ctx.probes_hit |= summary["probes_hit"]
+    for caller, callees in summary["dyn_cg"].items():
+        ctx.dyn_cg[caller] |= callees
+    for tid, bottom in summary["bottom"].items():
+        ctx.bottom[tid].update(bottom)
+    for tid, level_times in summary["level_times_exclusive"].items():
+        ctx.level_times_exclusive[tid].update(level_times)
+    for tid, funcs in summary["funcs"].items():
+        ctx.funcs[tid].update(funcs)
+    for pid, processes in summary["processes"].items():
+        ctx.processes[pid].extend(processes)
+    ctx.threads.update(summary["threads"])
+
+
+def _transform_block(records, ctx, handlers):
+    """Transforms the block of raw data records into performance resources.
+
+    The function calls of the threads are paired in bulk by :func:`_pair_calls`. The remaining
+    records (i.e. the USDT, thread and process records and the function records of threads that
+    are not paired in bulk) are transformed record by record by their handlers.
+
+    :param ndarray records: the block of parsed raw data records
+    :param TransformContext ctx: the parsing context object
+    :param dict handlers: the mapping of the record types to their handlers
+
+    :return tuple: the positions of the records that completed the resources and the resources,
+        both in the order of the records
+    """
+    lifecycle_types = list(vals.THREAD_RECORDS | vals.PROCESS_RECORDS)
+    types, tids = records["type"], records["tid"]
+    funcs = np.flatnonzero(
+        (types == vals.RecordType.FUNC_BEGIN) | (types == vals.RecordType.FUNC_END)
+    )
+    # The thread and process records change the contexts of their threads, hence only the
+    # function records following the last such record of the thread are paired in bulk
+    lifecycle = np.flatnonzero(np.isin(types, lifecycle_types))
+    lifecycle_tids, inverse = np.unique(tids[lifecycle], return_inverse=True)
+    last_lifecycle = np.full(len(lifecycle_tids) + 1, -1)
+    np.maximum.at(last_lifecycle, inverse.ravel(), lifecycle)
+    candidates = funcs[funcs > last_lifecycle[_index_of(lifecycle_tids, tids[funcs])]]
+
+    sequential = np.ones(len(records), dtype=bool)
+    sequential[candidates] = False
+    resources = _handle_records(records, np.flatnonzero(sequential), ctx, handlers)
+    paired_tids, paired_positions, paired = _pair_calls(records, candidates, ctx)
+    unpaired = candidates[~np.isin(tids[candidates], paired_tids)]
+    unpaired_resources = _handle_records(records, unpaired, ctx, handlers)
+    # Insert the resources of the handled records among the paired calls
+    handled = list(heapq.merge(resources, unpaired_resources, key=operator.itemgetter(0)))
+    handled_positions = np.array([position for position, _ in handled], dtype=np.int64)
+    inserts = np.searchsorted(paired_positions, handled_positions)
+    ordered, start = [], 0
+    for insert, (_, resource) in zip(inserts.tolist(), handled):
+        ordered.extend(paired[start:insert])
+        ordered.append(resource)
+        start = insert
+    ordered.extend(paired[start:])
+    return np.insert(paired_positions, inserts, handled_positions), ordered
+
+
+def _index_of(keys, values):
+    """Finds the indices of the values in the sorted array of unique keys.
+
+    :param ndarray keys: the sorted unique keys
+    :param ndarray values: the searched values
+
+    :return ndarray: the indices of the values, the missing values have index of the length of keys
+    """
+    indices = np.searchsorted(keys, values)
+    found = indices < len(keys)
+    found[found] = keys[indices[found]] == values[found]
+    return np.where(found, indices, len(keys))
+
+
+def _handle_records(records, indices, ctx, handlers):
+    """Transforms the records one by one by their handlers.
+
+    :param ndarray records: the block of parsed raw data records
+    :param ndarray indices: the positions of the transformed records in the block
+    :param TransformContext ctx: the parsing context object
+    :param dict handlers: the mapping of the record types to their handlers
+
+    :return list: the positions of the records that completed a resource and the resources
+    """
+    resources = []
+    for index, components in zip(indices.tolist(), records[indices].tolist()):
+        record = _build_record(components, ctx.probe_table)
+        try:
+            # Invoke the correct handler based on the record type and return the
+            # resulting resource, if any
+            resource = handlers[record["type"]](record, ctx)
+            if resource:
+                resources.append((index, resource))
+        except (KeyError, IndexError):
+            continue
+    return resources
+
+
+def _pair_calls(records, candidates, ctx):
+    """Pairs the entry and exit function records of the threads in bulk.
+
+    The function stack of each thread in the context continues with the function records of the
+    block. The records are paired by their stack depth: the exit record pairs with the preceding
+    entry record of the same depth. A thread is paired in bulk only if all its exit records match
+    the top of the stack (i.e. there are no lost records), otherwise its records are left to the
+    record-by-record handlers, which look for the matching records deeper in the stack. The
+    resources, exclusive times and statistics of the paired calls are the same as computed by
+    :func:`_record_func_begin` and :func:`_record_func_end`.
+
+    :param ndarray records: the block of parsed raw data records
+    :param ndarray candidates: the positions of the function records of threads to pair
+    :param TransformContext ctx: the parsing context object
+
+    :return tuple: the TIDs of paired threads, positions of exit records of the paired calls and
+        their resources
+    """
+    if not len(candidates):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), []
+    table = ctx.probe_table
+    name_of, _, lib_of = table.columns()
+    thread_ids, threads = np.unique(records["tid"][candidates], return_inverse=True)
+    thread_ctxs = [ctx.per_thread[tid] for tid in thread_ids.tolist()]
+    rejected = np.zeros(len(thread_ids), dtype=bool)
+
+    # The entry records on the stacks of threads precede the records of the block, the exclusive
+    # time of the stack records assumes that each record awaits its callee on the stack
+    stacked = [
+        (thread, depth - len(thread_ctx.func_stack), record)
+        for thread, thread_ctx in enumerate(thread_ctxs)
+        for depth, record in enumerate(thread_ctx.func_stack)
+    ]
+    for thread, thread_ctx in enumerate(thread_ctxs):
+        stack = thread_ctx.func_stack
+        awaited = [callee["timestamp"] for callee in stack[1:]] + [0]
+        rejected[thread] = any(
+            record["callee_tmp"] != callee for record, callee in zip(stack, awaited)
+        )
+    stacked_columns = np.array(
+        [
+            (
+                stack_thread,
+                stack_position,
+                table.name_code(record["id"]),
+                table.lib_code(record["loc"]),
+                record["timestamp"],
+                record["seq"],
+                record["callee_time"],
+            )
+            for stack_thread, stack_position, record in stacked
+        ],
+        dtype=np.int64,
+    ).reshape(-1, 7)
+    probes = records["probe"][candidates]
+    thread, position, name, lib, timestamp, seq, callee_time = (
+        np.concatenate((stacked_column, block_column))
+        for stacked_column, block_column in zip(
+            stacked_columns.T,
+            (
+                threads,
+                candidates,
+                name_of[probes],
+                lib_of[probes],
+                records["timestamp"][candidates],
+                records["seq"][candidates],
+                np.zeros(len(candidates), dtype=np.int64),
+            ),
+        )
+    )
+    begin = np.concatenate(
+        (
+            np.ones(len(stacked), dtype=bool),
+            records["type"][candidates] == vals.RecordType.FUNC_BEGIN,
+        )
+    )
+
+    # Order the records of each thread and compute their stack depths
+    # The stacked records precede the block records and both are ordered by their positions
+    order = np.argsort(thread, kind="stable")
+    thread, position, begin, name = thread[order], position[order], begin[order], name[order]
+    lib, timestamp, seq, callee_time = lib[order], timestamp[order], seq[order], callee_time[order]
+    count = len(order)
+    indices = np.arange(count)
+    first = np.flatnonzero(np.diff(thread, prepend=-1))
+    last = np.append(first[1:], count) - 1
+    delta = np.where(begin, 1, -1)
+    depth = np.cumsum(delta)
+    depth -= np.repeat(depth[first] - delta[first], last - first + 1)
+    # Exit records without any entry record on the stack are lost
+    rejected[thread[depth < 0]] = True
+    call_level = np.where(begin, depth, depth + 1)
+    level = call_level - call_level.min()
+    span = int(level.max()) + 2
+
+    # The records of the same stack level alternate between the entry and exit records
+    by_level = np.argsort(thread * span + level, kind="stable")
+    new_level = np.ones(count, dtype=bool)
+    new_level[1:] = (np.diff(thread[by_level]) != 0) | (np.diff(level[by_level]) != 0)
+    rank = indices - np.maximum.accumulate(np.where(new_level, indices, 0))
+    rejected[thread[by_level[begin[by_level] != (rank % 2 == 0)]]] = True
+    exits = by_level[rank % 2 == 1]
+    entries = by_level[np.flatnonzero(rank % 2 == 1) - 1]
+    mismatched = (name[entries] != name[exits]) | (timestamp[exits] <= timestamp[entries])
+    rejected[thread[exits[mismatched]]] = True
+
+    # The caller of the entry record is the preceding entry record one level lower
+    if len(thread_ids) * span * count >= 2**62:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), []
+    keys = ((thread * span + level) * count + indices)[by_level]
+    entered = np.flatnonzero(begin)
+    found = np.searchsorted(keys, (thread[entered] * span + level[entered] - 1) * count + entered)
+    caller = by_level[np.maximum(found - 1, 0)]
+    has_caller = (
+        (found > 0) & (thread[caller] == thread[entered]) & (level[caller] == level[entered] - 1)
+    )
+    callers = np.full(count, -1)
+    callers[entered[has_caller]] = caller[has_caller]
+    # The callers have to be known functions to update the dynamic call graph
+    known = np.array([probe_name in ctx.dyn_cg for probe_name in table.names], dtype=bool)
+    called = np.flatnonzero((callers >= 0) & (position >= 0))
+    rejected[thread[called[~known[name[callers[called]]]]]] = True
+
+    # Compute the amounts and exclusive times of the calls
+    accepted = ~rejected
+    calls = accepted[thread[exits]]
+    entries, exits = entries[calls], exits[calls]
+    # The exit records of the accepted threads are block records, order the calls by them
+    calls = np.full(len(records), -1)
+    calls[position[exits]] = np.arange(len(exits))
+    calls = calls[calls >= 0]
+    entries, exits = entries[calls], exits[calls]
+    amount = timestamp[exits] - timestamp[entries]
+    nested = callers[entries] >= 0
+    np.add.at(callee_time, callers[entries][nested], amount[nested])
+    exclusive = amount - callee_time[entries]
+
+    # The depth of each call as tracked by the thread context
+    depth_offset = np.array(
+        [thread_ctx.depth - len(thread_ctx.func_stack) + 1 for thread_ctx in thread_ctxs],
+        dtype=np.int64,
+    )
+    call_thread = thread[exits]
+    tid = thread_ids[call_thread]
+    for call_thread_index, call_depth, total in _group_sums(
+        exclusive, call_thread, depth_offset[call_thread] + call_level[exits] - 1
+    ):
+        ctx.level_times_exclusive[int(thread_ids[call_thread_index])][call_depth] += total
+
+    # The bottom calls have no callees, i.e. the previous function record is their entry
+    follows_record = np.zeros(count, dtype=bool)
+    follows_record[1:] = (position[:-1] >= 0) & (np.diff(thread) == 0)
+    previous_begin = follows_record & np.concatenate(([False], begin[:-1]))
+    flags = np.array([thread_ctx.bottom_flag for thread_ctx in thread_ctxs], dtype=bool)
+    bottom = np.where(follows_record, previous_begin, flags[thread])[exits]
+    for call_thread_index, call_name, total in _group_sums(
+        amount[bottom], call_thread[bottom], name[exits][bottom]
+    ):
+        ctx.bottom[int(thread_ids[call_thread_index])][table.names[call_name]] += total
+
+    # Update the statistics of the functions in the order of the calls
+    function_key = call_thread * len(table.names) + name[exits]
+    by_function = np.argsort(function_key, kind="stable")
+    groups = np.flatnonzero(np.diff(function_key[by_function], prepend=-1))
+    for group, group_end in zip(groups.tolist(), np.append(groups[1:], len(exits)).tolist()):
+        group_calls = by_function[group:group_end]
+        call = group_calls[0]
+        func = ctx.funcs[int(tid[call])][table.names[name[exits[call]]]]
+        func["e"].frombytes(np.abs(exclusive[group_calls]).astype(np.uint64).tobytes())
+        func["i"].frombytes(np.abs(amount[group_calls]).astype(np.uint64).tobytes())
+
+    # Update the hit probes and dynamic call graph by the entry records of accepted threads
+    entered = entered[(position[entered] >= 0) & accepted[thread[entered]]]
+    for probe_name in np.unique(name[entered]).tolist():
+        ctx.probes_hit.add(table.names[probe_name])
+    called = entered[callers[entered] >= 0]
+    for edge in np.unique(name[callers[called]] * len(table.names) + name[called]).tolist():
+        caller_name, callee_name = divmod(edge, len(table.names))
+        ctx.dyn_cg[table.names[caller_name]].add(table.names[callee_name])
+
+    # The unpaired entry records remain on the stacks of the threads
+    unpaired = begin.copy()
+    unpaired[entries] = False
+    new_stacks = [[] for _ in thread_ctxs]
+    for index in np.flatnonzero(unpaired & accepted[thread]).tolist():
+        record_thread = int(thread[index])
+        if position[index] < 0:
+            stack = thread_ctxs[record_thread].func_stack
+            record = stack[len(stack) + int(position[index])]
+        else:
+            record = {
+                "type": int(vals.RecordType.FUNC_BEGIN),
+                "tid": int(thread_ids[record_thread]),
+                "timestamp": int(timestamp[index]),
+                "id": table.names[name[index]],
+                "seq": int(seq[index]),
+                "loc": table.libs[lib[index]],
+                "callee_tmp": 0,
+            }
+        record["callee_time"] = int(callee_time[index])
+        new_stacks[record_thread].append(record)
+    for record_thread in np.flatnonzero(accepted).tolist():
+        thread_ctx, stack = thread_ctxs[record_thread], new_stacks[record_thread]
+        for record, callee in zip(stack, stack[1:]):
+            record["callee_tmp"] = callee["timestamp"]
+        if stack:
+            stack[-1]["callee_tmp"] = 0
+        thread_ctx.func_stack = stack
+        thread_ctx.depth = int(depth_offset[record_thread]) + len(stack) - 1
+        thread_ctx.bottom_flag = bool(begin[last[record_thread]])
+
+    resources = [
+        {
+            "amount": call_amount,
+            "timestamp": call_timestamp,
+            "call-order": call_seq,
+            "uid": table.names[call_name],
+            "tid": call_tid,
+            "type": "mixed",
+            "subtype": "time delta",
+            "location": table.libs[call_lib],
+            "workload": ctx.workload,
+            "exclusive": call_exclusive,
+        }
+        for call_amount, call_timestamp, call_seq, call_name, call_tid, call_lib, call_exclusive in zip(
+            amount.tolist(),
+            timestamp[entries].tolist(),
+            seq[entries].tolist(),
+            name[entries].tolist(),
+            tid.tolist(),
+            lib[entries].tolist(),
+            exclusive.tolist(),
+        )
+    ]
+    return thread_ids[accepted], position[exits], resources
+
+
+def _group_sums(values, major, minor):
+    """Sums the values with the same pair of keys.
+
+    :param ndarray values: the summed values
+    :param ndarray major: the first keys of the values
+    :param ndarray minor: the second keys of the values
+
+    :return iterable: the triples of the first key, second key and sum of the values
+    """
+    if not len(values):
+        return []
+    major_base, minor_base = int(major.min()), int(minor.min())
+    width = int(minor.max()) - minor_base + 1
+    keys = (major - major_base) * width + (minor - minor_base)
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    groups = np.flatnonzero(np.diff(keys, prepend=-1))
+    sums = np.add.reduceat(values[order], groups)
+    keys = keys[groups]
+    return zip(
+        (keys // width + major_base).tolist(), (keys % width + minor_base).tolist(), sums.tolist()
+    )
+
+
 def _build_mixed_cg_tmp(config, ctx):
     cg_stats_name, _ = build_stats_names(config)
     static_cg = resources.extract(
@@ -562,7 +1225,8 @@ def _build_resource(record_entry, record_exit, uid, workload):
 
 
 def parse_records(file_name, probes, verbose_trace):
-    """Parse the raw data line by line, each line represented as a dictionary of components.
+    """Parse the raw data record by record, each record represented as a dictionary of components.
+    The raw data are parsed in blocks by :func:`parse_record_blocks`.
 
     :param str file_name: name of the file containing raw collection data
     :param Probes probes: class containing probed locations
@@ -570,67 +1234,238 @@ def parse_records(file_name, probes, verbose_trace):
 
     :return iterable: a generator object that returns parsed raw data lines
     """
-    # ID (numeric id or name) -> (NAME, SAMPLE)
-    dict_key = "name" if verbose_trace else "id"
-    probe_map = {
-        str(probe[dict_key]): (
-            probe["name"],
-            probe["sample"],
-            os.path.basename(probe["lib"]),
-        )
-        for probe in list(probes.func.values()) + list(probes.usdt.values())
+    probe_table = ProbeTable(probes, verbose_trace)
+    for records in parse_record_blocks(file_name, probe_table):
+        for components in records.tolist():
+            yield _build_record(components, probe_table)
+
+
+def parse_record_blocks(file_name, probe_table):
+    """Parse the raw data in large blocks of lines, each block represented as an array of records
+    (see :data:`RECORD_DTYPE`).
+
+    The numeric components of all lines of the block are parsed at once. The lines that do not
+    have the expected format are parsed one by one by :func:`_parse_record_components`, and the
+    lines that cannot be parsed at all are represented as corrupted records.
+
+    :param str file_name: name of the file containing raw collection data
+    :param ProbeTable probe_table: the mapping of the probe IDs of the raw data records
+
+    :return iterable: a generator object that returns the arrays of parsed records
+    """
+    # (TID, NAME) -> SEQUENCE
+    seq_map = collections.defaultdict(int)
+    cnt = 0
+    for block in _read_blocks(file_name):
+        records = _parse_block(block, cnt, probe_table)
+        _number_sequences(records, probe_table, seq_map)
+        cnt += len(records)
+        yield records
+    # Include also the last attempt to read the line, as was counted by the line-by-line parsing
+    WATCH_DOG.info(f"Parsed {cnt + 1} records")
+    metrics.add_metric("records_count", cnt + 1)
+
+
+def _read_blocks(file_name):
+    """Reads the file in blocks of whole lines, each block (except the last one) has at least
+    _BLOCK_SIZE bytes.
+
+    :param str file_name: name of the read file
+
+    :return iterable: a generator object that returns the blocks terminated by a newline
+    """
+    with open(file_name, "rb") as trace:
+        rest = b""
+        while data := trace.read(_BLOCK_SIZE):
+            end = data.rfind(b"\n") + 1
+            if not end:
+                rest += data
+                continue
+            yield rest + data[:end]
+            rest = data[end:]
+        if rest:
+            yield rest + b"\n"
+
+
+def _parse_block(block, first_line, probe_table):
+    """Parse the lines of the block into an array of records.
+
+    The line should contain the following values:
+    'type' 'tid' ['pid'] ['ppid'] 'timestamp';'probe id'
+    where thread records have 'pid' and process records have 'pid', 'ppid'. The numbers are
+    parsed in bulk as the runs of digits, if they are separated by single spaces.
+
+    :param bytes block: the lines of the raw data terminated by a newline
+    :param int first_line: the number of lines preceding the block
+    :param ProbeTable probe_table: the mapping of the probe IDs of the raw data records
+
+    :return ndarray: the parsed records of the lines
+    """
+    buffer = np.frombuffer(block, dtype=np.uint8)
+    ends = np.flatnonzero(buffer == _NEWLINE)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    records = np.zeros(len(ends), dtype=RECORD_DTYPE)
+
+    # The numeric components are separated from the probe id by a single semicolon
+    semicolons = np.flatnonzero(buffer == _SEMICOLON)
+    first_semicolon = np.searchsorted(semicolons, starts)
+    valid = np.searchsorted(semicolons, ends) - first_semicolon == 1
+    semicolon = np.where(valid, np.append(semicolons, 0)[first_semicolon], ends)
+    valid &= semicolon > starts
+    id_lengths = ends - semicolon - 1
+    numeric_ids = valid & (id_lengths > 0) & (id_lengths <= _MAX_DIGITS)
+    numeric_ids &= (buffer[np.minimum(semicolon + 1, len(buffer) - 1)] != _ZERO) | (id_lengths == 1)
+
+    # The numeric components contain digits separated by single spaces only
+    is_digit = (buffer >= _ZERO) & (buffer <= _NINE)
+    spaces = np.flatnonzero(buffer == _SPACE)
+    space_lines = np.searchsorted(ends, spaces)
+    in_numbers = spaces < semicolon[space_lines]
+    separating = (spaces > starts[space_lines]) & is_digit[spaces + 1]
+    valid[space_lines[in_numbers & ~separating]] = False
+    numeric_ids[space_lines[~in_numbers]] = False
+    others = np.flatnonzero(
+        ~is_digit & (buffer != _SPACE) & (buffer != _SEMICOLON) & (buffer != _NEWLINE)
+    )
+    other_lines = np.searchsorted(ends, others)
+    in_numbers = others < semicolon[other_lines]
+    valid[other_lines[in_numbers]] = False
+    numeric_ids[other_lines[~in_numbers]] = False
+
+    # The numbers are the runs of consecutive digits
+    digits = np.flatnonzero(is_digit)
+    runs = np.flatnonzero(np.diff(digits, prepend=-2) != 1)
+    run_lengths = np.diff(np.append(runs, len(digits)))
+    exponents = np.repeat(runs + run_lengths - 1, run_lengths) - np.arange(len(digits))
+    values = (buffer[digits] - _ZERO).astype(np.int64) * _POWERS_OF_TEN[
+        np.minimum(exponents, _MAX_DIGITS - 1)
+    ]
+    numbers = np.add.reduceat(values, runs) if len(runs) else np.empty(0, dtype=np.int64)
+    number_lines = np.searchsorted(ends, digits[runs])
+    is_id = digits[runs] > semicolon[number_lines]
+    valid[number_lines[~is_id & (run_lengths > _MAX_DIGITS)]] = False
+    probe_ids = np.zeros(len(ends), dtype=np.int64)
+    probe_ids[number_lines[is_id]] = numbers[is_id]
+    numbers, number_lines = numbers[~is_id], number_lines[~is_id]
+
+    # The type and tid are the first numbers and timestamp is the last number of the record
+    counts = np.bincount(number_lines, minlength=len(ends))
+    valid &= counts >= 3
+    firsts = np.cumsum(counts) - counts
+    lines = np.flatnonzero(valid)
+    first, last = firsts[lines], firsts[lines] + counts[lines] - 1
+    records["type"][lines] = numbers[first]
+    records["tid"][lines] = numbers[first + 1]
+    records["pid"][lines] = numbers[first + 2]
+    records["ppid"][lines] = numbers[np.minimum(first + 3, last)]
+    records["timestamp"][lines] = numbers[last]
+    # The process records without 'ppid' are corrupted
+    valid[lines[np.isin(numbers[first], list(vals.PROCESS_RECORDS)) & (counts[lines] < 4)]] = False
+
+    numeric_ids &= valid
+    unique_ids, inverse = np.unique(probe_ids[numeric_ids], return_inverse=True)
+    indices = [probe_table.index(str(probe_id).encode()) for probe_id in unique_ids.tolist()]
+    records["probe"][numeric_ids] = np.array(indices, dtype=np.int64)[inverse]
+    for line in np.flatnonzero(valid & ~numeric_ids).tolist():
+        records["probe"][line] = probe_table.index(block[semicolon[line] + 1 : ends[line]])
+
+    # The lines in other format are parsed one by one, as by the line-by-line parsing
+    for line in np.flatnonzero(~valid).tolist():
+        text = block[starts[line] : ends[line] + 1].decode(errors="replace")
+        # In case there is any issue with parsing, return corrupted trace record
+        # We want to catch any error since parsing should be bullet-proof and should not crash
+        try:
+            *components, probe_id = _parse_record_components(text)
+            records[line] = (*components, probe_table.index(probe_id.encode()), 0)
+        except Exception:
+            corrupted_line = text.rstrip("\n")
+            WATCH_DOG.info(f"Corrupted data record on ln {first_line + line + 1}: {corrupted_line}")
+            records[line] = (vals.RecordType.CORRUPT.value, -1, 0, 0, -1, -1, 0)
+    return records
+
+
+def _parse_record_components(line):
+    """Parse the components of single line of raw data.
+
+    :param str line: the line containing the following values:
+        'type' 'tid' ['pid'] ['ppid'] 'timestamp';'probe id'
+        where thread records have 'pid' and process records have 'pid', 'ppid'
+
+    :return tuple: type, tid, pid, ppid, timestamp and probe id of the record
+    """
+    major_components = line.split(";")
+    minor_components = major_components[0].split()
+    record_type = int(minor_components[0])
+    record_tid = int(minor_components[1])
+    probe_id = major_components[1].rstrip("\n")
+    timestamp = int(minor_components[-1])
+    pid, ppid = 0, 0
+    if record_type in vals.THREAD_RECORDS:
+        # TYPE TID PID TIMESTAMP ID
+        pid = int(minor_components[2])
+    elif record_type in vals.PROCESS_RECORDS:
+        # TYPE TID PID PPID TIMESTAMP ID
+        pid = int(minor_components[2])
+        ppid = int(minor_components[3])
+    return record_type, record_tid, pid, ppid, timestamp, probe_id
+
+
+def _number_sequences(records, probe_table, seq_map):
+    """Sets the sequence numbers of the sequenced records, which identify the order of records
+    of the same probe in the thread. The sequence number increases by the sampling step of the
+    probe.
+
+    :param ndarray records: the parsed records
+    :param ProbeTable probe_table: the mapping of the probe IDs of the raw data records
+    :param dict seq_map: the next sequence number of the thread and probe name
+    """
+    sequenced = np.flatnonzero(np.isin(records["type"], list(vals.SEQUENCED_RECORDS)))
+    if not len(sequenced):
+        return
+    name_of, step_of, _ = probe_table.columns()
+    probes = records["probe"][sequenced]
+    tids, names, steps = records["tid"][sequenced], name_of[probes], step_of[probes]
+    order = np.lexsort((names, tids))
+    tids, names, steps = tids[order], names[order], steps[order]
+    new_group = np.ones(len(order), dtype=bool)
+    new_group[1:] = (np.diff(tids) != 0) | (np.diff(names) != 0)
+    groups = np.flatnonzero(new_group)
+    totals = np.cumsum(steps)
+    # The sequence numbers continue from the previous blocks
+    group_keys = list(zip(tids[groups].tolist(), names[groups].tolist()))
+    offsets = np.array([seq_map[key] for key in group_keys], dtype=np.int64)
+    group_totals = np.append(totals[groups[1:] - 1], totals[-1]) - (totals[groups] - steps[groups])
+    for key, offset, total in zip(group_keys, offsets.tolist(), group_totals.tolist()):
+        seq_map[key] = offset + total
+    group_sizes = np.diff(np.append(groups, len(order)))
+    records["seq"][sequenced[order]] = (
+        totals - steps - np.repeat(totals[groups] - steps[groups] - offsets, group_sizes)
+    )
+
+
+def _build_record(components, probe_table):
+    """Builds the dictionary of components of the parsed record.
+
+    :param tuple components: the components of the parsed record (see :data:`RECORD_DTYPE`)
+    :param ProbeTable probe_table: the mapping of the probe IDs of the raw data records
+
+    :return dict: the components of the record
+    """
+    record_type, record_tid, pid, ppid, timestamp, probe, seq = components
+    if probe < 0:
+        return {"type": record_type, "tid": -1, "timestamp": -1, "id": -1}
+    # 'loc' default value is for process records
+    record = {
+        "type": record_type,
+        "tid": record_tid,
+        "timestamp": timestamp,
+        "id": probe_table.names[probe_table.name_of[probe]],
+        "seq": seq,
+        "loc": probe_table.libs[probe_table.lib_of[probe]],
     }
-    # TID -> UID -> SEQUENCE
-    seq_map = collections.defaultdict(lambda: collections.defaultdict(int))
-
-    with open(file_name, "r") as trace:
-        cnt = 0
-        while True:
-            try:
-                cnt += 1
-                line = trace.readline()
-                if not line:
-                    break
-                # The line should contain the following values:
-                # 'type' 'tid' ['pid'] ['ppid'] 'timestamp';'probe id'
-                # where thread records have 'pid' and process records have 'pid', 'ppid'
-                major_components = line.split(";")
-                minor_components = major_components[0].split()
-                record_type = int(minor_components[0])
-                record_tid = int(minor_components[1])
-                probe_id = major_components[1].rstrip("\n")
-                record_id, probe_step, probe_lib = probe_map.get(probe_id, (probe_id, 0, probe_id))
-                # 'loc' default value is for process records
-                record = {
-                    "type": record_type,
-                    "tid": record_tid,
-                    "timestamp": int(minor_components[-1]),
-                    "id": record_id,
-                    "seq": 0,
-                    "loc": probe_lib,
-                }
-                if record_type in vals.SEQUENCED_RECORDS:
-                    # Sequenced records need to update their sequence number
-                    record["seq"] = seq_map[record_tid][record_id]
-                    seq_map[record_tid][record_id] += probe_step
-                elif record_type in vals.THREAD_RECORDS:
-                    # TYPE TID PID TIMESTAMP ID
-                    record["pid"] = int(minor_components[2])
-                elif record_type in vals.PROCESS_RECORDS:
-                    # TYPE TID PID PPID TIMESTAMP ID
-                    record["pid"] = int(minor_components[2])
-                    record["ppid"] = int(minor_components[3])
-                yield record
-            # In case there is any issue with parsing, return corrupted trace record
-            # We want to catch any error since parsing should be bullet-proof and should not crash
-            except Exception:
-                corrupted_line = line.rstrip("\n")
-                WATCH_DOG.info(f"Corrupted data record on ln {cnt}: {corrupted_line}")
-                yield {
-                    "type": vals.RecordType.CORRUPT.value,
-                    "tid": -1,
-                    "timestamp": -1,
-                    "id": -1,
-                }
-        WATCH_DOG.info(f"Parsed {cnt} records")
-        metrics.add_metric("records_count", cnt)
+    if record_type in vals.THREAD_RECORDS:
+        record["pid"] = pid
+    elif record_type in vals.PROCESS_RECORDS:
+        record["pid"] = pid
+        record["ppid"] = ppid
+    return record
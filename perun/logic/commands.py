@@ -294,19 +294,11 @@ def add(
 
         # Remove origin from file
         unpacked_profile.pop("origin")
-        str_profile_content = profile.to_string(unpacked_profile)
-
-        # Append header to the content of the file
-        header = f"profile {unpacked_profile['header']['type']} {len(str_profile_content)}\0"
-        profile_content = (header + str_profile_content).encode("utf-8")
 
         # Transform to internal representation - file as sha1 checksum and content packed with zlib
-        profile_sum = store.compute_checksum(profile_content)
-        compressed_content = store.pack_content(profile_content)
-
-        # Add to control
+        # and add it to control
         object_dir = pcs.get_object_directory()
-        store.add_loose_object_to_dir(object_dir, profile_sum, compressed_content)
+        profile_sum = store.add_profile_object_to_dir(object_dir, unpacked_profile)
 
         # Register in the minor_version index
         index.register_in_minor_index(
@@ -1205,8 +1197,7 @@ def load_profile_from_args(profile_name: str, minor_version: str) -> Optional[Pr
         #   we return nothing otherwise we look up entries in index
         if os.path.exists(minor_index_file):
             with open(minor_index_file, "rb") as minor_handle:
-                lookup_pred = lambda entry: entry.path == profile_name
-                profiles.extend(index.lookup_all_entries_within_index(minor_handle, lookup_pred))
+                profiles.extend(index.lookup_entries_by_path(minor_handle, profile_name))
 
     # If there are more profiles we should choose
     if not profiles:
@@ -10,6 +10,7 @@ from enum import Enum
 from typing import Callable, BinaryIO, Any, Iterable, Collection, TYPE_CHECKING
 import binascii
 import json
+import mmap
 import os
 import struct
 import zlib
@@ -34,13 +35,21 @@ if TYPE_CHECKING:
 INDEX_ENTRIES_START_OFFSET: int = 12
 INDEX_NUMBER_OF_ENTRIES_OFFSET: int = 8
 INDEX_MAGIC_PREFIX: bytes = b"pidx"
-# Index Version 2.0 FastSloth
-INDEX_VERSION: int = 2
+# Index Version 3.0 SwiftCheetah
+INDEX_VERSION: int = 3
+
+# Layout of the SwiftCheetah index: header, fixed-width records, sorted checksums, hash table of
+# paths and string heap (see :func:`write_mapped_index_to_handle` for more details)
+MAPPED_INDEX_HEADER = struct.Struct("<4siiI")
+MAPPED_INDEX_RECORD = struct.Struct("<I20s12I")
+MAPPED_INDEX_CHECKSUM = struct.Struct("<20sI")
+MAPPED_INDEX_SLOT = struct.Struct("<I")
 
 
 class IndexVersion(Enum):
     SlowLorris = 1
     FastSloth = 2
+    SwiftCheetah = 3
 
 
 class BasicIndexEntry:
@@ -206,7 +215,9 @@ class ExtendedIndexEntry(BasicIndexEntry):
         """
         basic_entry = super().read_from(index_handle, index_version)
         _, profile_name = store.split_object_name(pcs.get_object_directory(), basic_entry.checksum)
-        profile = store.load_profile_from_file(profile_name, is_raw_profile=False)
+        profile = store.load_profile_from_file(
+            profile_name, is_raw_profile=False, use_cache=True, lazy=True
+        )
         return ExtendedIndexEntry(
             basic_entry.time,
             basic_entry.checksum,
@@ -277,6 +288,247 @@ class ExtendedIndexEntry(BasicIndexEntry):
         )
 
 
+class MappedIndex:
+    """Read-only view of the index in the SwiftCheetah format mapped to the memory.
+
+    Contrary to the older versions, the entries have fixed width, hence any entry can be accessed
+    in O(1) without parsing the preceding entries. All strings of the entries are stored in a
+    separate string heap and the entries refer to them by their offsets and lengths. Moreover,
+    the index contains a column of checksums sorted for binary search and a hash table of paths.
+
+    :ivar mmap _map: memory mapped contents of the index
+    :ivar int number_of_entries: number of entries registered in the index
+    :ivar int number_of_slots: number of slots in the hash table of paths
+    :ivar int checksums_offset: offset of the sorted column of checksums
+    :ivar int slots_offset: offset of the hash table of paths
+    :ivar int heap_offset: offset of the string heap
+    """
+
+    __slots__ = [
+        "_map",
+        "number_of_entries",
+        "number_of_slots",
+        "checksums_offset",
+        "slots_offset",
+        "heap_offset",
+    ]
+
+    def __init__(self, index_handle: BinaryIO) -> None:
+        """Maps the index to the memory and reads its header
+
+        :param file index_handle: opened handle of the index
+        """
+        self._map = mmap.mmap(index_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, number_of_entries, number_of_slots = MAPPED_INDEX_HEADER.unpack_from(self._map, 0)
+        self.number_of_entries: int = number_of_entries
+        self.number_of_slots: int = number_of_slots
+        self.checksums_offset: int = (
+            MAPPED_INDEX_HEADER.size + number_of_entries * MAPPED_INDEX_RECORD.size
+        )
+        self.slots_offset: int = (
+            self.checksums_offset + number_of_entries * MAPPED_INDEX_CHECKSUM.size
+        )
+        self.heap_offset: int = self.slots_offset + number_of_slots * MAPPED_INDEX_SLOT.size
+        if self.heap_offset > len(self._map):
+            self.close()
+            raise MalformedIndexFileException("read index file is truncated")
+
+    def __enter__(self) -> "MappedIndex":
+        """Context manager entry sentinel
+
+        :return: the mapped index
+        """
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Context manager exit sentinel, unmaps the index"""
+        self.close()
+
+    def __len__(self) -> int:
+        """Returns number of entries in the index
+
+        :return: number of entries
+        """
+        return self.number_of_entries
+
+    def close(self) -> None:
+        """Unmaps the index from the memory"""
+        self._map.close()
+
+    def _read_string(self, offset: int, length: int) -> str:
+        """Reads string from the string heap
+
+        :param int offset: offset of the string within the heap
+        :param int length: length of the string in bytes
+        :return: read string
+        """
+        start = self.heap_offset + offset
+        return self._map[start : start + length].decode("utf-8")
+
+    def _record_offset(self, position: int) -> int:
+        """Returns offset of the record of the entry at the given position
+
+        :param int position: position of the entry in the index
+        :return: offset of the record in the index
+        """
+        return MAPPED_INDEX_HEADER.size + position * MAPPED_INDEX_RECORD.size
+
+    def read_path(self, position: int) -> str:
+        """Reads only the path of the entry at the given position
+
+        :param int position: position of the entry in the index
+        :return: path of the entry
+        """
+        _, _, path_offset, path_length, *_ = MAPPED_INDEX_RECORD.unpack_from(
+            self._map, self._record_offset(position)
+        )
+        return self._read_string(path_offset, path_length)
+
+    def entry(self, position: int) -> ExtendedIndexEntry:
+        """Reads the entry at the given position
+
+        :param int position: position of the entry in the index
+        :return: read entry
+        """
+        record_offset = self._record_offset(position)
+        timestamp, checksum, *strings = MAPPED_INDEX_RECORD.unpack_from(self._map, record_offset)
+        path, profile_type, cmd, workload, collector, postprocessors = (
+            self._read_string(strings[i], strings[i + 1]) for i in range(0, len(strings), 2)
+        )
+        profile = {
+            "header": {"type": profile_type, "cmd": cmd, "workload": workload},
+            "collector_info": {"name": collector},
+            "postprocessors": [{"name": post} for post in postprocessors.split(" ") if post],
+        }
+        return ExtendedIndexEntry(
+            timestamps.timestamp_to_str(timestamp),
+            binascii.hexlify(checksum).decode("utf-8"),
+            path,
+            record_offset,
+            profile,
+        )
+
+    def entries(self) -> Iterable[ExtendedIndexEntry]:
+        """Iterates through all entries of the index in the order of the index
+
+        :return: stream of index entries
+        """
+        for position in range(self.number_of_entries):
+            yield self.entry(position)
+
+    def find_by_checksum(self, checksum: str) -> list[int]:
+        """Finds positions of all entries with the given checksum using binary search
+
+        :param str checksum: hexadecimal representation of the SHA-1 checksum
+        :return: sorted list of positions of the entries with the given checksum
+        """
+        binary_checksum = bytes.fromhex(checksum)
+        low, high = 0, self.number_of_entries
+        while low < high:
+            middle = (low + high) // 2
+            offset = self.checksums_offset + middle * MAPPED_INDEX_CHECKSUM.size
+            if self._map[offset : offset + 20] < binary_checksum:
+                low = middle + 1
+            else:
+                high = middle
+        positions = []
+        while low < self.number_of_entries:
+            found_checksum, position = MAPPED_INDEX_CHECKSUM.unpack_from(
+                self._map, self.checksums_offset + low * MAPPED_INDEX_CHECKSUM.size
+            )
+            if found_checksum != binary_checksum:
+                break
+            positions.append(position)
+            low += 1
+        return sorted(positions)
+
+    def find_by_path(self, path: str) -> list[int]:
+        """Finds positions of all entries with the given path using the hash table
+
+        :param str path: looked up path
+        :return: sorted list of positions of the entries with the given path
+        """
+        positions: list[int] = []
+        if not self.number_of_slots:
+            return positions
+        slot = zlib.crc32(path.encode("utf-8")) % self.number_of_slots
+        for _ in range(self.number_of_slots):
+            (stored,) = MAPPED_INDEX_SLOT.unpack_from(
+                self._map, self.slots_offset + slot * MAPPED_INDEX_SLOT.size
+            )
+            if stored == 0:
+                break
+            if self.read_path(stored - 1) == path:
+                positions.append(stored - 1)
+            slot = (slot + 1) % self.number_of_slots
+        return sorted(positions)
+
+
+def write_mapped_index_to_handle(index_handle: BinaryIO, entry_list: list[BasicIndexEntry]) -> None:
+    """Writes the list of entries in the SwiftCheetah format to the handle
+
+    The index is of following form:
+      - 16B header: magic prefix 'pidx', version, number of entries N, number of hash slots M
+      - N * 72B records: timestamp, 20B SHA-1 and offset/length pairs of path, type, cmd,
+        workload, collector and postprocessors within the string heap
+      - N * 24B column of SHA-1 and positions of the records sorted by SHA-1
+      - M * 4B hash table of paths (position of the record + 1, 0 for empty slot)
+      - ?B string heap
+
+    :param file index_handle: handle opened for writing
+    :param list entry_list: list of entries in the order in which they are stored
+    """
+    heap = bytearray()
+    heap_strings: dict[str, tuple[int, int]] = {}
+
+    def store_string(value: str) -> tuple[int, int]:
+        """Stores the string to the heap, reusing the already stored strings"""
+        if value not in heap_strings:
+            binary_value = value.encode("utf-8")
+            heap_strings[value] = (len(heap), len(binary_value))
+            heap.extend(binary_value)
+        return heap_strings[value]
+
+    number_of_entries = len(entry_list)
+    number_of_slots = 1 << (2 * number_of_entries).bit_length() if number_of_entries else 0
+    slots = [0] * number_of_slots
+    records = bytearray()
+    for position, entry in enumerate(entry_list):
+        strings = [
+            entry.path,
+            entry.type,
+            entry.cmd,
+            entry.workload,
+            entry.collector,
+            " ".join(entry.postprocessors),
+        ]
+        references = [item for string in strings for item in store_string(string)]
+        records.extend(
+            MAPPED_INDEX_RECORD.pack(
+                round(timestamps.str_to_timestamp(entry.time)),
+                bytes.fromhex(entry.checksum),
+                *references,
+            )
+        )
+        slot = zlib.crc32(entry.path.encode("utf-8")) % number_of_slots
+        while slots[slot]:
+            slot = (slot + 1) % number_of_slots
+        slots[slot] = position + 1
+
+    checksums = sorted(
+        (bytes.fromhex(entry.checksum), position) for position, entry in enumerate(entry_list)
+    )
+    index_handle.write(
+        MAPPED_INDEX_HEADER.pack(
+            INDEX_MAGIC_PREFIX, IndexVersion.SwiftCheetah.value, number_of_entries, number_of_slots
+        )
+    )
+    index_handle.write(records)
+    index_handle.write(b"".join(MAPPED_INDEX_CHECKSUM.pack(*pair) for pair in checksums))
+    index_handle.write(b"".join(MAPPED_INDEX_SLOT.pack(slot) for slot in slots))
+    index_handle.write(heap)
+
+
 def get_older_version(index_version: IndexVersion) -> IndexVersion:
     """Returns older version of the index
 
@@ -313,6 +565,11 @@ def walk_index(index_handle: BinaryIO) -> Iterable[BasicIndexEntry]:
             f"(read index file = {index_version}, supported = {INDEX_VERSION})"
         )
 
+    if index_version >= IndexVersion.SwiftCheetah.value:
+        with MappedIndex(index_handle) as mapped_index:
+            yield from mapped_index.entries()
+        return
+
     number_of_objects = store.read_int_from_handle(index_handle)
     loaded_objects = 0
     entry_constructor = INDEX_ENTRY_CONSTRUCTORS[INDEX_VERSION - 1]
@@ -369,6 +626,8 @@ def touch_index(index_path: str) -> None:
       -  ?B Variable length path
       -  ?B zero byte padding
 
+    The Version 3 index is described in :func:`write_mapped_index_to_handle`.
+
     :param str index_path: path to the index
     """
     if not os.path.exists(index_path):
@@ -388,6 +647,9 @@ def initialize_index_in_handle(index_handle: BinaryIO) -> None:
     :param index_handle:
     :return:
     """
+    if INDEX_VERSION >= IndexVersion.SwiftCheetah.value:
+        write_mapped_index_to_handle(index_handle, [])
+        return
     index_handle.write(INDEX_MAGIC_PREFIX)
     index_handle.write(struct.pack("i", INDEX_VERSION))
     index_handle.write(struct.pack("i", 0))
@@ -425,6 +687,10 @@ def write_entry_to_index(index_file: str, file_entry: BasicIndexEntry) -> None:
     :param str index_file: path to the index file
     :param BasicIndexEntry file_entry: index entry that will be written to the file
     """
+    if INDEX_VERSION >= IndexVersion.SwiftCheetah.value:
+        _insert_entry_to_mapped_index(index_file, file_entry)
+        return
+
     with open(index_file, "rb+") as index_handle:
         # Lookup the position of the registered file within the index
         if file_entry.offset == -1:
@@ -471,6 +737,39 @@ def write_entry_to_index(index_file: str, file_entry: BasicIndexEntry) -> None:
         update_index_version(index_handle)
 
 
+def _insert_entry_to_mapped_index(index_file: str, file_entry: BasicIndexEntry) -> None:
+    """Inserts the file_entry to its appropriate position within the SwiftCheetah index.
+
+    Since the entries are stored in fixed-width records, the whole index is rewritten. The index
+    in older format is upgraded to the SwiftCheetah format.
+
+    :param str index_file: path to the index file
+    :param BasicIndexEntry file_entry: index entry that will be written to the file
+    """
+    with open(index_file, "rb") as index_handle:
+        entry_list = list(walk_index(index_handle))
+
+    position = len(entry_list)
+    for i, entry in enumerate(entry_list):
+        if file_entry.offset == -1 and (
+            entry.path > file_entry.path
+            or (entry.path == file_entry.path and entry.time >= file_entry.time)
+        ):
+            # If there is an exact match, we do not add the entry to the index
+            if entry.path == file_entry.path and entry.time == file_entry.time:
+                perun_log.warn(
+                    f"{file_entry.path} ({file_entry.time}) already registered in {index_file}",
+                )
+                return
+            position = i
+            break
+        elif file_entry.offset != -1 and entry.offset >= file_entry.offset:
+            position = i
+            break
+    entry_list.insert(position, file_entry)
+    write_list_of_entries(index_file, entry_list)
+
+
 def write_list_of_entries(index_file: str, entry_list: list[BasicIndexEntry]) -> None:
     """Rewrites the index file to contain the list of entries only
 
@@ -482,11 +781,25 @@ def write_list_of_entries(index_file: str, entry_list: list[BasicIndexEntry]) ->
     # First delete the index
     with open(index_file, "wb+") as index_handle:
         index_handle.truncate(0)
-        initialize_index_in_handle(index_handle)
-        modify_number_of_entries_in_index(index_handle, lambda x: len(entry_list))
-        index_handle.seek(INDEX_ENTRIES_START_OFFSET)
-        for entry in entry_list:
-            entry.write_to(index_handle)
+        write_list_of_entries_to_handle(index_handle, entry_list)
+
+
+def write_list_of_entries_to_handle(
+    index_handle: BinaryIO, entry_list: list[BasicIndexEntry]
+) -> None:
+    """Writes the list of entries to the handle in the format of current version of index
+
+    :param file index_handle: handle opened for writing positioned at the start of the file
+    :param list of ExtendedIndexEntry entry_list:
+    """
+    if INDEX_VERSION >= IndexVersion.SwiftCheetah.value:
+        write_mapped_index_to_handle(index_handle, entry_list)
+        return
+    initialize_index_in_handle(index_handle)
+    modify_number_of_entries_in_index(index_handle, lambda x: len(entry_list))
+    index_handle.seek(INDEX_ENTRIES_START_OFFSET)
+    for entry in entry_list:
+        entry.write_to(index_handle)
 
 
 def lookup_entry_within_index(
@@ -508,6 +821,71 @@ def lookup_entry_within_index(
     raise EntryNotFoundException(looked_up_entry_name)
 
 
+def _read_index_version(index_handle: BinaryIO) -> int:
+    """Reads the version of the index and returns back to the beginning of the handle
+
+    :param file index_handle: file handle of the index
+    :return: version of the index or 0 if the handle does not contain an index
+    """
+    index_handle.seek(0)
+    magic_bytes = index_handle.read(4)
+    index_version = store.read_int_from_handle(index_handle) if magic_bytes else 0
+    index_handle.seek(0)
+    return index_version if magic_bytes == INDEX_MAGIC_PREFIX else 0
+
+
+def lookup_entries_by_checksum(index_handle: BinaryIO, checksum: str) -> list[BasicIndexEntry]:
+    """Looks up all entries with the given checksum in the index
+
+    For SwiftCheetah indexes, this uses binary search over the sorted column of checksums,
+    otherwise the whole index is walked.
+
+    :param file index_handle: file handle of the index
+    :param str checksum: checksum of the looked up object
+    :returns [BasicIndexEntry]: list of index entries with the given checksum
+    """
+    if _read_index_version(index_handle) >= IndexVersion.SwiftCheetah.value:
+        with MappedIndex(index_handle) as mapped_index:
+            return [
+                mapped_index.entry(position) for position in mapped_index.find_by_checksum(checksum)
+            ]
+    return lookup_all_entries_within_index(index_handle, lambda entry: entry.checksum == checksum)
+
+
+def lookup_entries_by_path(index_handle: BinaryIO, path: str) -> list[BasicIndexEntry]:
+    """Looks up all entries with the given path in the index
+
+    For SwiftCheetah indexes, this uses the hash table of paths, otherwise the whole index is
+    walked.
+
+    :param file index_handle: file handle of the index
+    :param str path: path of the looked up profile
+    :returns [BasicIndexEntry]: list of index entries with the given path
+    """
+    if _read_index_version(index_handle) >= IndexVersion.SwiftCheetah.value:
+        with MappedIndex(index_handle) as mapped_index:
+            return [mapped_index.entry(position) for position in mapped_index.find_by_path(path)]
+    return lookup_all_entries_within_index(index_handle, lambda entry: entry.path == path)
+
+
+def lookup_entry_by_checksum_or_path(
+    index_handle: BinaryIO, looked_up_entry_name: str
+) -> BasicIndexEntry:
+    """Looks up the first entry with the given checksum (if the name is SHA-1) or path
+
+    :param file index_handle: file handle of the index
+    :param str looked_up_entry_name: checksum or path of the looked up entry
+    :returns BasicIndexEntry: first index entry with the given checksum or path
+    """
+    if store.is_sha1(looked_up_entry_name):
+        entries = lookup_entries_by_checksum(index_handle, looked_up_entry_name)
+    else:
+        entries = lookup_entries_by_path(index_handle, looked_up_entry_name)
+    if not entries:
+        raise EntryNotFoundException(looked_up_entry_name)
+    return entries[0]
+
+
 def lookup_all_entries_within_index(
     index_handle: BinaryIO, predicate: Callable[[BasicIndexEntry], bool]
 ) -> list[BasicIndexEntry]:
@@ -633,17 +1011,9 @@ def remove_from_index(
         removed_entries = []
 
         for i, removed_file in enumerate(removed_file_generator):
-
-            def lookup_function(looked_entry: BasicIndexEntry) -> bool:
-                """Helper lookup function according to the type of the removed file"""
-                if store.is_sha1(removed_file):
-                    return looked_entry.checksum == removed_file
-                else:
-                    return looked_entry.path == removed_file
-
             count_status = f"{common_kit.format_counter_number(i + 1, removed_profile_number)}/{removed_profile_number}"
             try:
-                found_entry = lookup_entry_within_index(index_handle, lookup_function, removed_file)
+                found_entry = lookup_entry_by_checksum_or_path(index_handle, removed_file)
                 removed_entries.append(found_entry)
                 perun_log.minor_success(
                     f"{count_status} {perun_log.path_style(found_entry.path)}", "deregistered"
@@ -654,17 +1024,12 @@ def remove_from_index(
                 )
                 removed_profile_number -= 1
 
-        # Update number of entries
-        index_handle.seek(INDEX_NUMBER_OF_ENTRIES_OFFSET)
-        index_handle.write(struct.pack("i", len(all_entries) - len(removed_entries)))
-
-        # For each entry remove from the index, starting from the greatest offset
-        for entry in all_entries:
-            if entry in removed_entries:
-                continue
-            entry.write_to(index_handle)
-
+        # Rewrite the index with the remaining entries
+        index_handle.seek(0)
         index_handle.truncate()
+        write_list_of_entries_to_handle(
+            index_handle, [entry for entry in all_entries if entry not in removed_entries]
+        )
 
     perun_log.major_info("Summary")
     if removed_profile_number:
@@ -759,4 +1124,4 @@ def save_custom_index(index_path: str, records: list[Any] | dict[Any, Any]) -> N
         index_handle.write(compressed)
 
 
-INDEX_ENTRY_CONSTRUCTORS = [BasicIndexEntry, ExtendedIndexEntry]
+INDEX_ENTRY_CONSTRUCTORS = [BasicIndexEntry, ExtendedIndexEntry, ExtendedIndexEntry]
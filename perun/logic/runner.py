@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 # Standard Imports
-from typing import Any, Iterable, Optional, TYPE_CHECKING, cast, Callable, overload
-import distutils.util as dutils
+from typing import Any, Callable, Iterable, NamedTuple, Optional, TYPE_CHECKING, cast, overload
+import contextlib
+import copy
+import io
+import multiprocessing
 import os
 import signal
-import time
 import subprocess
+import sys
+import time
 
 # Third-Party Imports
 import click
@@ -441,7 +445,9 @@ def store_generated_profile(prof: Profile, job: Job, profile_name: Optional[str]
     log.minor_status(
         "stored generated profile ", status=f"{log.path_style(os.path.relpath(full_profile_path))}"
     )
-    if dutils.strtobool(str(config.lookup_key_recursively("profiles.register_after_run", "false"))):
+    if common_kit.strtobool(
+        str(config.lookup_key_recursively("profiles.register_after_run", "false"))
+    ):
         # We either store the profile according to the origin, or we use the current head
         dst = prof.get("origin", pcs.vcs().get_minor_head())
         # FIXME: consider removing this
@@ -510,6 +516,186 @@ def run_prephase_commands(phase: str) -> None:
             )
 
 
+class JobOutput(io.StringIO):
+    """Captured output of the job run in the worker process
+
+    The output is not readable, so the :class:`log.History` inherited by the worker does not
+    flush it to the terminal. Instead, the output is printed by the parent process, once the job
+    is finished.
+    """
+
+    def readable(self) -> bool:
+        """The captured output is not flushed by the :class:`log.History`
+
+        :return: always false
+        """
+        return False
+
+
+class JobTask(NamedTuple):
+    """Job of the job matrix, that is run by :func:`run_job`
+
+    :ivar Job job: job that is run
+    :ivar function generator: constructor of the workload generator of the job
+    :ivar dict params: parameters of the workload generator
+    :ivar int number_of_jobs: overall number of jobs that will be run
+    """
+
+    job: Job
+    generator: Callable[..., Any]
+    params: dict[str, Any]
+    number_of_jobs: int
+
+
+# Statuses with generated profiles and jobs, captured output, positions of the progress in the
+# output and exit code of the job run in worker
+JobResult = tuple[
+    list[tuple[CollectStatus, Optional["Profile"], Job]], str, list[int], Optional[Any]
+]
+
+
+def get_number_of_parallel_jobs() -> int:
+    """Returns the number of jobs run in parallel during ``perun run``
+
+    :return: number of worker processes used for running the jobs
+    """
+    return int(config.lookup_key_recursively("execute.parallel", "1"))
+
+
+def initialize_job_worker(free_cpus: Optional[Any]) -> None:
+    """Initializes the worker process running the jobs
+
+    The worker reopens the version control system, since it cannot share its connections with
+    the parent process. Optionally, the worker is pinned to the next free CPU, so the jobs run in
+    parallel do not interfere by migrating between the same CPUs.
+
+    :param SimpleQueue free_cpus: queue of the CPUs, that are not used by other workers, if None,
+        then the worker is not pinned
+    """
+    pcs.vcs().reopen()
+    if free_cpus is not None:
+        os.sched_setaffinity(0, {free_cpus.get()})
+
+
+def print_job_overview(job_counter: int, job: Job) -> None:
+    """Prints the overview of the job (i.e. its command, workload, collector and postprocessors)
+
+    :param int job_counter: order of the job in the job matrix
+    :param Job job: printed job
+    """
+    log.major_info(f"Job {job_counter} Overview")
+    log.minor_status("Command", status=log.cmd_style(job.executable.cmd))
+    log.minor_status("Workload", status=log.highlight(job.executable.workload))
+    log.minor_status("Collector", status=log.highlight(job.collector.name))
+    if job.postprocessors:
+        log.minor_status(
+            "Postprocessors",
+            status=log.highlight(", ".join(post.name for post in job.postprocessors)),
+        )
+
+
+def run_job(
+    task: JobTask, print_progress: Callable[[int], None] = log.print_job_progress
+) -> Iterable[tuple[CollectStatus, Optional[Profile], Job]]:
+    """Runs the collection and postprocessing of single job for all generated workloads
+
+    Note that the workload generators update the executable of the job to the generated workload.
+
+    :param JobTask task: job with its workload generator and parameters
+    :param function print_progress: function printing the progress of the jobs before each
+        postprocessing
+    :return: status, generated profile and the job for each generated workload, the failed runs
+        have no profile
+    """
+    job, number_of_jobs = task.job, task.number_of_jobs
+    for c_status, prof in task.generator(job, **task.params).generate(run_collector):
+        # Run the collector and check if the profile was successfully collected
+        # In case, the status was not OK, then we skip the postprocessing
+        if c_status != CollectStatus.OK or not prof:
+            yield CollectStatus.ERROR, None, job
+            continue
+
+        # Temporary nasty hack
+        prof = profile.finalize_profile_for_job(prof, job)
+
+        for postprocessor in job.postprocessors:
+            print_progress(number_of_jobs)
+            # Run postprocess and check if the profile was successfully postprocessed
+            p_status, prof = run_postprocessor(postprocessor, job, prof)
+            if p_status != PostprocessStatus.OK or not prof:
+                yield CollectStatus.ERROR, None, job
+                break
+        else:
+            yield CollectStatus.OK, prof, job
+
+
+def run_job_in_worker(task: JobTask) -> JobResult:
+    """Runs single job in the worker process with captured output
+
+    The progress of the jobs depends on the number of workloads generated by the preceding jobs,
+    hence it is not printed by the worker. Instead, its positions in the captured output are
+    recorded and the progress is printed by the parent process (see :func:`write_job_output`).
+
+    :param JobTask task: job with its workload generator and parameters
+    :return: statuses with generated profiles, the captured output, the positions of progress in
+        the output and exit code (if the job exited)
+    """
+    output = JobOutput()
+    progress_positions: list[int] = []
+    results: list[tuple[CollectStatus, Optional[Profile], Job]] = []
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            for status, prof, job in run_job(
+                task, lambda _: progress_positions.append(output.tell())
+            ):
+                # The job is copied, since its executable is updated by the workload generator
+                results.append((status, prof, copy.deepcopy(job)))
+        except SystemExit as exit_exception:
+            return results, output.getvalue(), progress_positions, exit_exception.code
+    return results, output.getvalue(), progress_positions, None
+
+
+def write_job_output(output: str, progress_positions: list[int], number_of_jobs: int) -> None:
+    """Writes the captured output of the job run in the worker, including its progress
+
+    :param str output: captured output of the job
+    :param list progress_positions: positions in the output, where the progress is printed
+    :param int number_of_jobs: overall number of jobs that will be run
+    """
+    last_position = 0
+    for position in progress_positions:
+        log.write(output[last_position:position], end="")
+        log.print_job_progress(number_of_jobs)
+        last_position = position
+    log.write(output[last_position:], end="")
+
+
+def run_jobs_in_parallel(tasks: list[JobTask], jobs: int) -> Iterable[JobResult]:
+    """Runs the jobs in the pool of worker processes
+
+    Each job is run in separate process, hence the jobs are isolated from each other (e.g. the
+    state of the collectors). The results are yielded in the order of the tasks as soon as they
+    are finished. If set by :ckey:`execute.pin_cpus`, each worker is pinned to different CPU.
+
+    :param list tasks: list of jobs with their workload generators, parameters and progress
+    :param int jobs: number of worker processes
+    :return: statuses with generated profiles and jobs, the captured output and the exit code of
+        each job
+    """
+    free_cpus: Optional[multiprocessing.SimpleQueue[int]] = None
+    if common_kit.strtobool(str(config.lookup_key_recursively("execute.pin_cpus", "false"))):
+        if hasattr(os, "sched_setaffinity"):
+            cpus = sorted(os.sched_getaffinity(0))
+            free_cpus = multiprocessing.SimpleQueue()
+            for worker in range(jobs):
+                free_cpus.put(cpus[worker % len(cpus)])
+        else:
+            log.warn("pinning of jobs to CPUs is not supported on this platform")
+
+    with common_kit.worker_pool(jobs, initialize_job_worker, (free_cpus,)) as pool_map:
+        yield from pool_map(run_job_in_worker, tasks)
+
+
 def generate_jobs_on_current_working_dir(
     job_matrix: dict[str, dict[str, list[Job]]], number_of_jobs: int
 ) -> Iterable[tuple[CollectStatus, Profile, Job]]:
@@ -518,6 +704,10 @@ def generate_jobs_on_current_working_dir(
     This function expects no changes not commited in the repo, it excepts correct version
     checked out and just runs the matrix.
 
+    If set by :ckey:`execute.parallel`, the jobs are run in parallel (see
+    :func:`run_jobs_in_parallel`), while their output is printed and the generated profiles are
+    yielded in the same order as for the sequential run.
+
     :param dict job_matrix: dictionary with jobs that will be run
     :param int number_of_jobs: number of jobs that will be run
     :return: status, generated profile, and associated job
@@ -529,8 +719,8 @@ def generate_jobs_on_current_working_dir(
 
     log.major_info("Running Jobs")
     log.increase_indent()
-    job_counter = 1
-    for job_cmd, workloads_per_cmd in job_matrix.items():
+    tasks: list[JobTask] = []
+    for workloads_per_cmd in job_matrix.values():
         for workload, jobs_per_workload in workloads_per_cmd.items():
             # Prepare the specification
             generator_spec = workload_generators_specs.get(
@@ -538,37 +728,33 @@ def generate_jobs_on_current_working_dir(
             )
             generator, params = generator_spec.constructor, generator_spec.params
             for job in jobs_per_workload:
-                log.major_info(f"Job {job_counter} Overview")
-                log.minor_status("Command", status=log.cmd_style(job_cmd))
-                log.minor_status("Workload", status=log.highlight(workload))
-                log.minor_status("Collector", status=log.highlight(job.collector.name))
-                if job.postprocessors:
-                    log.minor_status(
-                        "Postprocessors",
-                        status=log.highlight(", ".join(post.name for post in job.postprocessors)),
-                    )
-
-                for c_status, prof in generator(job, **params).generate(run_collector):
-                    # Run the collector and check if the profile was successfully collected
-                    # In case, the status was not OK, then we skip the postprocessing
-                    if c_status != CollectStatus.OK or not prof:
-                        collective_status = CollectStatus.ERROR
-                        continue
-
-                    # Temporary nasty hack
-                    prof = profile.finalize_profile_for_job(prof, job)
-
-                    for postprocessor in job.postprocessors:
-                        log.print_job_progress(number_of_jobs)
-                        # Run postprocess and check if the profile was successfully postprocessed
-                        p_status, prof = run_postprocessor(postprocessor, job, prof)
-                        if p_status != PostprocessStatus.OK or not prof:
-                            collective_status = CollectStatus.ERROR
-                            break
-                    else:
-                        # Store the computed profile inside the job directory
-                        yield collective_status, prof, job
-                job_counter += 1
+                tasks.append(JobTask(job, generator, params, number_of_jobs))
+
+    def run_tasks() -> Iterable[Iterable[tuple[CollectStatus, Optional[Profile], Job]]]:
+        """Prints the overview of each job and yields its results in the order of the jobs"""
+        parallel_jobs = min(get_number_of_parallel_jobs(), len(tasks))
+        if parallel_jobs > 1:
+            finished_tasks = run_jobs_in_parallel(tasks, parallel_jobs)
+            for job_counter, (task, (results, output, progress_positions, exit_code)) in enumerate(
+                zip(tasks, finished_tasks), start=1
+            ):
+                print_job_overview(job_counter, task.job)
+                write_job_output(output, progress_positions, number_of_jobs)
+                if exit_code is not None:
+                    sys.exit(exit_code)
+                yield results
+        else:
+            for job_counter, task in enumerate(tasks, start=1):
+                print_job_overview(job_counter, task.job)
+                yield run_job(task)
+
+    for job_results in run_tasks():
+        for status, prof, job in job_results:
+            if status != CollectStatus.OK or prof is None:
+                collective_status = CollectStatus.ERROR
+            else:
+                # Store the computed profile inside the job directory
+                yield collective_status, prof, job
 
     log.decrease_indent()
 
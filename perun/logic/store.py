@@ -6,20 +6,28 @@ or load and store into the directories or filenames.
 from __future__ import annotations
 
 # Standard Imports
-from typing import BinaryIO, Optional
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+import codecs
+import collections
+import functools
 import hashlib
+import itertools
 import json
 import os
+import pickle
 import re
 import string
 import struct
+import tempfile
 import zlib
 
 # Third-Party Imports
 
 # Perun Imports
+from perun.logic import config, pcs
+from perun.profile import binary
 from perun.profile.factory import Profile
-from perun.utils import log
+from perun.utils import log, metrics, streams
 from perun.utils.common import common_kit
 from perun.utils.exceptions import IncorrectProfileFormatException
 from perun.utils.structs import PerformanceChange, DegradationInfo
@@ -30,6 +38,111 @@ INDEX_TAG_RANGE_REGEX = re.compile(r"^(\d+)@i-(\d+)@i$")
 PENDING_TAG_REGEX = re.compile(r"^(\d+)@p$")
 PENDING_TAG_RANGE_REGEX = re.compile(r"^(\d+)@p-(\d+)@p$")
 
+# Default upper bound (in bytes of stored profile objects) of the in-memory profile cache
+DEFAULT_PROFILE_CACHE_SIZE = 32 * 1024 * 1024
+PROFILE_CACHE_DIR = "profile-cache"
+# Size of the chunks (in bytes) in which the profiles are read and deflated
+PROFILE_CHUNK_SIZE = 1024 * 1024
+# Sections of the stored profiles, that can be loaded on their first access
+LAZY_SECTIONS = ("resources", "models")
+
+
+class ProfileCache:
+    """Content-addressed LRU cache of already loaded profiles.
+
+    Profiles stored in the ``.perun/objects`` are immutable and identified by the SHA-1 of their
+    content, hence we can safely reuse the constructed profile, whenever the same object is loaded
+    again. The cache is bounded by the sum of the sizes of the cached profile objects; when the
+    bound is exceeded, the least recently used profiles are evicted.
+
+    Note that the cached profiles are shared among all callers, hence the callers must not modify
+    the returned profile (or they have to copy it first).
+
+    :ivar OrderedDict _profiles: map of object checksums to pairs of (profile, size)
+    :ivar int capacity: maximal sum of sizes of cached profiles
+    :ivar int size: current sum of sizes of cached profiles
+    :ivar int hits: number of lookups that were served from the cache
+    :ivar int misses: number of lookups that had to load the profile
+    """
+
+    __slots__ = ["_profiles", "capacity", "size", "hits", "misses"]
+
+    def __init__(self, capacity: int = DEFAULT_PROFILE_CACHE_SIZE) -> None:
+        """Initializes empty cache
+
+        :param capacity: maximal sum of sizes of cached profiles
+        """
+        self._profiles: collections.OrderedDict[
+            str, tuple[Profile, int]
+        ] = collections.OrderedDict()
+        self.capacity: int = capacity
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __contains__(self, checksum: str) -> bool:
+        """Checks whether the profile identified by @p checksum is cached
+
+        :param checksum: SHA-1 of the profile object
+        :return: true if the profile is in the cache
+        """
+        return checksum in self._profiles
+
+    def __len__(self) -> int:
+        """Returns the number of cached profiles
+
+        :return: number of cached profiles
+        """
+        return len(self._profiles)
+
+    def get(self, checksum: str) -> Optional[Profile]:
+        """Returns the cached profile and marks it as recently used
+
+        :param checksum: SHA-1 of the profile object
+        :return: cached profile or None, if the profile is not cached
+        """
+        cached = self._profiles.get(checksum)
+        if cached is None:
+            self.misses += 1
+            return None
+        self._profiles.move_to_end(checksum)
+        self.hits += 1
+        return cached[0]
+
+    def put(self, checksum: str, profile: Profile, size: int) -> None:
+        """Inserts the profile to the cache and evicts the least recently used profiles if the
+        capacity is exceeded.
+
+        Profiles that are bigger than the whole capacity of the cache are not cached at all.
+
+        :param checksum: SHA-1 of the profile object
+        :param profile: loaded profile
+        :param size: size of the profile (e.g. size of the stored object)
+        """
+        if size > self.capacity:
+            return
+        self.invalidate(checksum)
+        self._profiles[checksum] = (profile, size)
+        self.size += size
+        while self.size > self.capacity:
+            _, (_, evicted_size) = self._profiles.popitem(last=False)
+            self.size -= evicted_size
+
+    def invalidate(self, checksum: Optional[str] = None) -> None:
+        """Removes the profile from the cache, or clears the whole cache
+
+        :param checksum: SHA-1 of the profile object; if None, then the whole cache is cleared
+        """
+        if checksum is None:
+            self._profiles.clear()
+            self.size = 0
+        elif checksum in self._profiles:
+            _, size = self._profiles.pop(checksum)
+            self.size -= size
+
+
+PROFILE_CACHE = ProfileCache()
+
 
 def compute_checksum(content: bytes) -> str:
     """Compute the checksum of the content using the SHA-1 algorithm
@@ -116,6 +229,59 @@ def add_loose_object_to_dir(base_dir: str, object_name: str, object_content: byt
             object_handle.write(object_content)
 
 
+def add_profile_object_to_dir(base_dir: str, profile: Profile) -> str:
+    """Packs the profile and stores it as a loose object
+
+    The profile is serialized by chunks (see :func:`perun.utils.streams.iterate_json_chunks`),
+    hence its whole serialization is never held in the memory. Since the header of the object
+    contains the size of the serialized profile, the profile is serialized twice: first to compute
+    its size, and then to compute the checksum and pack it into a temporary file, that is finally
+    renamed to the object. The object is the same as when packing the whole serialized profile.
+
+    If :ckey:`profiles.object_format` is set to ``binary``, then the profile is stored in the
+    compact binary format instead (see :mod:`perun.profile.binary`).
+
+    :param str base_dir: path to the base directory
+    :param Profile profile: stored profile
+    :return: sha-1 string representing the object
+    """
+    if config.lookup_key_recursively("profiles.object_format", "json") == "binary":
+        object_name, object_content = binary.dump_profile(profile)
+        add_loose_object_to_dir(base_dir, object_name, object_content)
+        return object_name
+
+    body_size = sum(len(chunk) for chunk in streams.iterate_json_chunks(profile.serialize()))
+    header = f"profile {profile['header']['type']} {body_size}\0"
+    checksum = hashlib.sha1()
+    compressor = zlib.compressobj()
+
+    common_kit.touch_dir(base_dir)
+    with tempfile.NamedTemporaryFile("wb", dir=base_dir, delete=False) as object_handle:
+        try:
+            for chunk in itertools.chain(
+                [header], streams.iterate_json_chunks(profile.serialize())
+            ):
+                content = chunk.encode("utf-8")
+                checksum.update(content)
+                object_handle.write(compressor.compress(content))
+            object_handle.write(compressor.flush())
+        except BaseException:
+            # Do not leave the partially written object behind
+            object_handle.close()
+            os.remove(object_handle.name)
+            raise
+
+    object_name = checksum.hexdigest()
+    object_dir_full_path, object_file_full_path = split_object_name(base_dir, object_name)
+    common_kit.touch_dir(object_dir_full_path)
+    # Note: That in some universe, there may become some collision, but in reality it should not
+    if os.path.exists(object_file_full_path):
+        os.remove(object_handle.name)
+    else:
+        os.replace(object_handle.name, object_file_full_path)
+    return object_name
+
+
 def read_int_from_handle(file_handle: BinaryIO) -> int:
     """Helper function for reading one integer from handle
 
@@ -236,6 +402,85 @@ def save_degradation_list_for(
         write_handle.write("\n".join(to_be_stored_changes))
 
 
+def save_check_results_for(
+    base_dir: str,
+    minor_version: str,
+    check_results: dict[str, list[tuple[DegradationInfo, str, str]]],
+) -> None:
+    """Saves the results of checks of pairs of profiles to a minor version storage
+
+    Contrary to :func:`save_degradation_list_for`, the results are stored per each check, identified
+    by its fingerprint, so they can be reused by later checks of the same pairs. Each change is
+    stored as a changelog record together with its partial intervals. The already stored results
+    of other checks are kept.
+
+    :param str base_dir: base directory, where the results will be stored
+    :param str minor_version: minor version for which we are storing the results
+    :param dict check_results: map of fingerprints of checks to the list of detected changes
+    """
+    if not check_results:
+        return
+    _, minor_storage_file = split_object_name(base_dir, minor_version, ".checks")
+    stored_results = _load_raw_check_results(minor_storage_file)
+    for fingerprint, changes in check_results.items():
+        stored_results[fingerprint] = [
+            {
+                "record": " ".join([deg_info.to_storage_record(), source, cmdstr]),
+                "partial_intervals": [
+                    [PerformanceChange(change).name, float(error), float(start), float(end)]
+                    for change, error, start, end in deg_info.partial_intervals
+                ],
+            }
+            for deg_info, cmdstr, source in changes
+        ]
+
+    common_kit.touch_dir(os.path.dirname(minor_storage_file))
+    with open(minor_storage_file, "w") as write_handle:
+        json.dump(stored_results, write_handle, sort_keys=True)
+
+
+def load_check_results_for(
+    base_dir: str, minor_version: str
+) -> dict[str, list[tuple[DegradationInfo, str, str]]]:
+    """Loads the results of checks of pairs of profiles stored for the minor version
+
+    :param str base_dir: directory to the storage of the objects
+    :param str minor_version: minor version for which we are loading the results
+    :return: map of fingerprints of checks to the list of triples (DegradationInfo, command string,
+        minor version source)
+    """
+    _, minor_storage_file = split_object_name(base_dir, minor_version, ".checks")
+    check_results = {}
+    for fingerprint, records in _load_raw_check_results(minor_storage_file).items():
+        changes = []
+        for record in records:
+            deg_info, cmdstr, source = parse_changelog_line(record["record"])
+            deg_info.partial_intervals = [
+                (PerformanceChange[change], error, start, end)
+                for change, error, start, end in record["partial_intervals"]
+            ]
+            changes.append((deg_info, cmdstr, source))
+        check_results[fingerprint] = changes
+    return check_results
+
+
+def _load_raw_check_results(check_file: str) -> dict[str, list[dict[str, Any]]]:
+    """Loads the stored results of checks in the raw format
+
+    :param str check_file: file with the stored results of checks
+    :return: map of fingerprints to the list of stored records, empty if the file is missing or
+        malformed
+    """
+    if not os.path.exists(check_file):
+        return {}
+    try:
+        with open(check_file, "r") as read_handle:
+            return json.load(read_handle)
+    except ValueError:
+        log.warn(f"Malformed results of checks in {check_file}")
+        return {}
+
+
 def parse_changelog_line(line: str) -> tuple[DegradationInfo, str, str]:
     """Parses one changelog record into the triple of degradation info, command string and minor.
 
@@ -294,61 +539,265 @@ def load_degradation_list_for(
 
 
 def load_profile_from_file(
-    file_name: str, is_raw_profile: bool, unsafe_load: bool = False
+    file_name: str,
+    is_raw_profile: bool,
+    unsafe_load: bool = False,
+    use_cache: bool = False,
+    lazy: bool = False,
 ) -> Profile:
     """Loads profile w.r.t :ref:`profile-spec` from file.
 
+    If @p use_cache is set, then the profiles stored in the objects directory are looked up in
+    the :class:`ProfileCache` first (keyed by the SHA-1 of the object). The cached profiles are
+    shared, hence the caller must not modify the returned profile.
+
+    If @p lazy is set, then the sections of the stored profiles listed in :data:`LAZY_SECTIONS`
+    (i.e. resources and models) are not decoded, until they are accessed for the first time
+    (see :meth:`perun.profile.factory.Profile.add_lazy_section`). Hence, the callers that need
+    e.g. only the header of the profile do not pay for decoding of its resources.
+
     :param file_name: file path, where the profile is stored
     :param is_raw_profile: if set to true, then the profile was loaded
         from the file system and is thus in the JSON already and does not have
         to be decompressed and unpacked to JSON format.
     :param unsafe_load: if set to True, then we assume that the @p file_name exists and skip the check for existence
+    :param use_cache: if set to True, then the loaded profile is cached and reused
+    :param lazy: if set to True, then the resources and models are loaded on their first access
     :returns: JSON dictionary w.r.t. :ref:`profile-spec`
     :raises IncorrectProfileFormatException: raised, when **filename** contains
         data, which cannot be converted to valid :ref:`profile-spec`
-    Fixme: Add cache! Really badly!
     """
+    checksum = version_path_to_sha(file_name) if use_cache and not is_raw_profile else None
+    if checksum is not None:
+        cached_profile = PROFILE_CACHE.get(checksum)
+        metrics.add_metric("profile_cache_hits", PROFILE_CACHE.hits)
+        metrics.add_metric("profile_cache_misses", PROFILE_CACHE.misses)
+        if cached_profile is not None:
+            return cached_profile
+
     if not unsafe_load and not os.path.exists(file_name):
         raise IncorrectProfileFormatException(file_name, "file '{}' not found")
 
-    with open(file_name, "rb") as file_handle:
-        return load_profile_from_handle(file_name, file_handle, is_raw_profile)
+    if checksum is None:
+        with open(file_name, "rb") as file_handle:
+            return load_profile_from_handle(file_name, file_handle, is_raw_profile, lazy)
+
+    PROFILE_CACHE.capacity = int(
+        config.lookup_key_recursively("profiles.cache_size", str(DEFAULT_PROFILE_CACHE_SIZE))
+    )
+    on_disk = common_kit.strtobool(
+        str(config.lookup_key_recursively("profiles.cache_on_disk", "false"))
+    )
+    profile = load_profile_from_disk_cache(checksum) if on_disk else None
+    if profile is None:
+        # The profiles stored in the on-disk cache are pickled whole, hence they are not lazy
+        with open(file_name, "rb") as file_handle:
+            profile = load_profile_from_handle(
+                file_name, file_handle, is_raw_profile, lazy and not on_disk
+            )
+        if on_disk:
+            store_profile_to_disk_cache(checksum, profile)
+    PROFILE_CACHE.put(checksum, profile, os.stat(file_name).st_size)
+    return profile
+
+
+def load_profile_from_disk_cache(checksum: str) -> Optional[Profile]:
+    """Loads the pickled profile from the on-disk cache in ``.perun/tmp``
+
+    :param checksum: SHA-1 of the profile object
+    :return: loaded profile or None, if the profile is not cached or the cache is corrupted
+    """
+    cache_file = os.path.join(pcs.get_tmp_directory(), PROFILE_CACHE_DIR, checksum)
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file, "rb") as cache_handle:
+            profile = pickle.load(cache_handle)
+        return profile if isinstance(profile, Profile) else None
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def store_profile_to_disk_cache(checksum: str, profile: Profile) -> None:
+    """Stores the profile to the on-disk cache in ``.perun/tmp``
+
+    :param checksum: SHA-1 of the profile object
+    :param profile: loaded profile
+    """
+    cache_dir = os.path.join(pcs.get_tmp_directory(), PROFILE_CACHE_DIR)
+    common_kit.touch_dir(cache_dir)
+    with open(os.path.join(cache_dir, checksum), "wb") as cache_handle:
+        pickle.dump(profile, cache_handle, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def load_profile_from_handle(
-    file_name: str, file_handle: BinaryIO, is_raw_profile: bool
+    file_name: str, file_handle: BinaryIO, is_raw_profile: bool, lazy: bool = False
 ) -> Profile:
-    """
+    """Loads the profile from the opened handle
+
+    The binary objects are detected by their magic bytes and loaded by
+    :func:`perun.profile.binary.load_profile_from_handle`. Otherwise, the profile is read,
+    decompressed and decoded by chunks (see :func:`read_chunks_from_handle`)
+    and the resources are incrementally fed to the profile, hence neither the whole packed nor
+    the unpacked text of the profile is held in the memory.
+
     Fixme: Add check that the loaded profile is in valid format!!!
-    TODO: This should be broken into two parts
 
     :param str file_name: name of the file opened in the handle
     :param file file_handle: opened file handle
     :param bool is_raw_profile: true if the profile is in json format already
+    :param bool lazy: true if the :data:`LAZY_SECTIONS` of the stored profile (i.e. not the raw
+        one) are loaded on their first access (see :func:`load_profile_section`)
     :returns Profile: JSON representation of the profile
-    :raises IncorrectProfileFormatException: when the profile cannot be parsed by json.loads(body)
+    :raises IncorrectProfileFormatException: when the profile cannot be parsed as JSON
         or when the profile is not in correct supported format or when the profile is malformed
     """
-    if is_raw_profile:
-        body = file_handle.read().decode("utf-8")
-    else:
-        # Read deflated contents and split to header and body
-        contents = read_and_deflate_chunk(file_handle)
-        header, body = contents.split("\0")
-        prefix, profile_type, profile_size = header.split(" ")
-
-        # Check the header, if the body is not malformed
-        if (
-            prefix != "profile"
-            or profile_type not in common_kit.SUPPORTED_PROFILE_TYPES
-            or len(body) != int(profile_size)
-        ):
-            raise IncorrectProfileFormatException(file_name, "malformed profile '{}'")
-
-    # Try to load the json, if there is issue with the profile
+    if not is_raw_profile:
+        magic = file_handle.read(len(binary.BINARY_MAGIC))
+        file_handle.seek(0)
+        if binary.is_binary_profile(magic):
+            return binary.load_profile_from_handle(file_name, file_handle, lazy)
+    lazy = lazy and not is_raw_profile
+
+    chunks = read_chunks_from_handle(file_handle, not is_raw_profile)
+    body_size = 0
+
+    def count_body_size(body_chunks: Iterable[str]) -> Iterator[str]:
+        """Counts the size of the read body of the profile"""
+        nonlocal body_size
+        for chunk in body_chunks:
+            body_size += len(chunk)
+            yield chunk
+
     try:
-        return Profile(json.loads(body))
-    except ValueError:
+        profile_size = None
+        if not is_raw_profile:
+            # Read the header from the deflated contents
+            header, chunks = split_header_from_chunks(chunks)
+            prefix, profile_type, profile_size = (header.split(" ") + ["", "", ""])[:3]
+            if prefix != "profile" or profile_type not in common_kit.SUPPORTED_PROFILE_TYPES:
+                raise IncorrectProfileFormatException(file_name, "malformed profile '{}'")
+
+        body_chunks = count_body_size(chunks)
+        try:
+            profile: Optional[Profile] = load_profile_from_chunks(
+                body_chunks, file_name if lazy else None
+            )
+        except ValueError:
+            profile = None
+        # Read the rest of the body to check its size
+        collections.deque(body_chunks, maxlen=0)
+    except zlib.error:
+        raise IncorrectProfileFormatException(file_name, "malformed profile '{}'")
+
+    # Check the header, if the body is not malformed
+    if profile_size is not None and str(body_size) != profile_size:
+        raise IncorrectProfileFormatException(file_name, "malformed profile '{}'")
+    if profile is None:
         raise IncorrectProfileFormatException(
             file_name, f"profile '{file_name}' is not in profile format"
         )
+    return profile
+
+
+def read_chunks_from_handle(file_handle: BinaryIO, is_packed: bool) -> Iterator[str]:
+    """Reads the contents of the file by chunks, deflating and decoding them
+
+    :param file file_handle: opened file handle
+    :param bool is_packed: true if the contents are packed by :func:`pack_content`
+    :return: iterator of decoded chunks of the file
+    """
+    decompressor = zlib.decompressobj()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while read_chunk := file_handle.read(PROFILE_CHUNK_SIZE):
+        if not is_packed:
+            yield decoder.decode(read_chunk)
+            continue
+        # We limit the size of the deflated chunks, since the profiles are well compressible
+        while read_chunk:
+            yield decoder.decode(decompressor.decompress(read_chunk, PROFILE_CHUNK_SIZE))
+            read_chunk = decompressor.unconsumed_tail
+    yield decoder.decode(decompressor.flush() if is_packed else b"", final=True)
+
+
+def split_header_from_chunks(chunks: Iterator[str]) -> tuple[str, Iterator[str]]:
+    """Splits the header of the object (ended by the null character) from the chunks of its body
+
+    :param iterator chunks: iterator of chunks of the object
+    :return: pair of header and iterator of chunks of the body
+    """
+    header_chunks = []
+    for chunk in chunks:
+        header_end = chunk.find("\0")
+        if header_end != -1:
+            header_chunks.append(chunk[:header_end])
+            return "".join(header_chunks), itertools.chain([chunk[header_end + 1 :]], chunks)
+        header_chunks.append(chunk)
+    return "".join(header_chunks), iter([])
+
+
+def load_profile_from_chunks(chunks: Iterable[str], lazy_file: Optional[str] = None) -> Profile:
+    """Incrementally constructs the profile from the chunks of its JSON representation
+
+    The resources are decoded and added to the profile one resource type at a time (see
+    :func:`perun.utils.streams.iterate_json_members`). The result is the same as constructing
+    the profile from the whole decoded JSON.
+
+    :param iterable chunks: chunks of the JSON representation of profile
+    :param str lazy_file: if set, then the :data:`LAZY_SECTIONS` are skipped and loaded from
+        the given stored profile on their first access
+    :return: loaded profile
+    :raises ValueError: when the chunks do not form valid JSON object
+    """
+    profile = Profile()
+    has_models = False
+    skipped_keys = LAZY_SECTIONS if lazy_file is not None else ()
+    for keys, value in streams.iterate_json_members(chunks, ("resources",), None, skipped_keys):
+        key = keys[0]
+        if value is streams.SKIPPED_VALUE:
+            assert lazy_file is not None, "only the lazy sections are skipped"
+            has_models = has_models or key == "models"
+            profile.add_lazy_section(key, functools.partial(load_profile_section, lazy_file, key))
+        elif len(keys) == 2:
+            profile.update_resources({keys[1]: value}, key)
+        elif key in ("resources", "snapshots", "global"):
+            if key == "global" and not has_models:
+                profile["models"] = value.get("models", []) if isinstance(value, dict) else []
+            profile.update_resources(value, key)
+        else:
+            has_models = has_models or key == "models"
+            profile[key] = value
+    return profile
+
+
+def load_profile_section(file_name: str, section: str) -> Any:
+    """Loads single top-level section of the stored profile
+
+    The rest of the profile is only scanned (see :meth:`perun.utils.streams.JsonChunkScanner.skip`)
+    and the reading stops right after the loaded section.
+
+    :param str file_name: path to the stored profile object
+    :param str section: key of the loaded section (e.g. resources)
+    :return: decoded section of the profile
+    :raises IncorrectProfileFormatException: when the section cannot be loaded from the profile
+    """
+    value: Any = {}
+    is_found = False
+    try:
+        with open(file_name, "rb") as file_handle:
+            _, chunks = split_header_from_chunks(read_chunks_from_handle(file_handle, True))
+            for keys, member_value in streams.iterate_json_members(chunks, (section,), (section,)):
+                if keys[0] != section:
+                    if is_found:
+                        break
+                    continue
+                is_found = True
+                if len(keys) == 2:
+                    value[keys[1]] = member_value
+                else:
+                    value = member_value
+    except (zlib.error, ValueError, OSError):
+        raise IncorrectProfileFormatException(file_name, "malformed profile '{}'")
+    if not is_found:
+        raise IncorrectProfileFormatException(file_name, f"missing '{section}' in profile '{{}}'")
+    return value
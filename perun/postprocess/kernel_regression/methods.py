@@ -11,20 +11,25 @@ from __future__ import annotations
 from typing import Any, TYPE_CHECKING, Callable, Optional, Iterator, cast
 
 # Third-Party Imports
-from sklearn import metrics, base as sklearn
+from scipy import signal
+from sklearn import kernel_approximation, metrics, base as sklearn
 import click.exceptions as click_exp
 import numpy as np
 import sklearn.metrics.pairwise as kernels
 import statsmodels.nonparametric.api as nparam
 
 # Perun Imports
+from perun.logic import stats
 from perun.postprocess.regression_analysis import tools
+from perun.utils import exceptions
 import perun.thirdparty.pyqt_fit_port as pyqt_fit
 
 if TYPE_CHECKING:
     import numpy.typing as npt
     import click
 
+    from perun.profile.factory import Profile
+
 
 # set numpy variables to ignore warning messages at computation
 # - it is only temporary solution for clearly listings
@@ -37,6 +42,20 @@ BW_SELECTION_METHODS = ["scott", "silverman"]
 
 # Minimum points count to perform the regression
 _MIN_POINTS_COUNT = 3
+# Number of points, whose Nystroem features are held in the memory at once
+_NYSTROEM_CHUNK_SIZE = 8192
+# Name of the stats file with the bandwidths selected for the uids in the previous runs
+BANDWIDTH_STATS_FILE = "kernel_regression_bandwidths"
+# Maximal decrease of the coefficient of determination, for which the cached bandwidth is reused
+_BANDWIDTH_CACHE_TOLERANCE = 0.01
+# The errors of the stats, when the bandwidths cannot be cached (e.g. outside of perun repository)
+_BANDWIDTH_CACHE_ERRORS = (
+    exceptions.NotPerunRepositoryException,
+    exceptions.VersionControlSystemException,
+    exceptions.StatsFileNotFoundException,
+    ValueError,
+    OSError,
+)
 
 
 class KernelRidge(sklearn.BaseEstimator, sklearn.RegressorMixin):
@@ -134,6 +153,7 @@ def compute_kernel_regression(
     the kernel analysis by relevant mode. After the returning from the analysis methods
     add to obtained model relevant `uid` of current resources and the name of the analysis.
     After the analyzing whole profile returns the dictionary with created kernel models.
+    The uids are computed by :func:`compute_uid`, possibly in parallel.
 
     :param iter data_gen: the generator object with collected data (data provider generator)
     :param dict config: the perun and option context contains the entered options and commands
@@ -146,20 +166,134 @@ def compute_kernel_regression(
         [],
     )
 
-    # list of resulting models computed by kernel analysis
-    kernel_models = []
-    for x_pts, y_pts, uid in data_gen:
-        # calling the method, that ensures the calling the relevant mode of kernel regression
-        kernel_model = execute_kernel_regression(x_pts, y_pts, config)
-        kernel_model["uid"] = uid
-        kernel_model["model"] = "kernel_regression"
-        # add partial result to the model result list - create output dictionary with kernel models
-        kernel_models.append(kernel_model)
-    return kernel_models
+    # list of resulting models computed by kernel analysis (possibly in parallel)
+    return list(tools.compute_per_uid(compute_uid, data_gen, config))
+
+
+def compute_uid(
+    x_pts: list[float], y_pts: list[float], uid: str, config: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Computes the kernel model of single uid.
+
+    The bandwidth selected for the uid in the previous runs is looked up in the
+    `cached_bandwidths` of the config (see :func:`load_cached_bandwidths`).
+
+    :param list x_pts: the list of x points coordinates
+    :param list y_pts: the list of y points coordinates
+    :param str uid: the uid of the computed points
+    :param dict config: the perun and option context contains the entered options and commands
+    :return dict: the kernel model of the uid
+    """
+    # calling the method, that ensures the calling the relevant mode of kernel regression
+    kernel_model = execute_kernel_regression(
+        x_pts, y_pts, config, config.get("cached_bandwidths", {}).get(uid)
+    )
+    kernel_model["uid"] = uid
+    kernel_model["model"] = "kernel_regression"
+    return kernel_model
+
+
+def get_bandwidth_cache_id(profile: Profile, config: dict[str, Any]) -> Optional[str]:
+    """
+    Returns the identification of the bandwidths cached for the profile and the selected mode.
+
+    The bandwidths are cached only for the modes, which search for the bandwidth (i.e.
+    `estimator-settings` and `kernel-ridge`), since the rest of the modes either use the bandwidth
+    entered by the user or compute it cheaply by the rule of thumb. The bandwidths are identified
+    by the command and workload of the profile, the resource keys, the kernel and the method of
+    the selection. The uids are then the keys within the cached bandwidths.
+
+    :param Profile profile: the postprocessed profile
+    :param dict config: the perun and option context contains the entered options and commands
+    :return str: the identification of the cached bandwidths, or None if they are not cached
+    """
+    if config["kernel_mode"] == "estimator-settings":
+        kernel, method = config["reg_type"], config["bandwidth_method"]
+    elif config["kernel_mode"] == "kernel-ridge":
+        kernel, method = "rbf", "loo"
+    else:
+        return None
+    header = profile["header"]
+    return ";".join(
+        (header["cmd"], header["workload"], config["per_key"], config["of_key"], kernel, method)
+    )
+
+
+def load_cached_bandwidths(profile: Profile, config: dict[str, Any]) -> dict[str, dict[str, float]]:
+    """
+    Loads the bandwidths selected for the uids of the profile in the previous runs.
+
+    The bandwidths are looked up in the stats of the nearest minor version, that contains them,
+    starting at the minor version the profile originates from (see
+    :func:`perun.logic.stats.list_stat_versions`), hence the search of the bandwidth is
+    warm-started from the values selected e.g. in the previous commit. The cache is not used, if it
+    is turned off by `cache_bandwidths` option or if it cannot be accessed (e.g. outside of perun
+    repository).
+
+    :param Profile profile: the postprocessed profile
+    :param dict config: the perun and option context contains the entered options and commands
+    :return dict: the mapping of uids to their cached bandwidth and coefficient of determination
+    """
+    stats_id = get_bandwidth_cache_id(profile, config)
+    if stats_id is not None and config.get("cache_bandwidths", True):
+        with exceptions.SuppressedExceptions(*_BANDWIDTH_CACHE_ERRORS):
+            # The nearer versions may have the stats file with bandwidths of other profiles only
+            for version, _ in stats.list_stat_versions(profile.get("origin")):
+                with exceptions.SuppressedExceptions(exceptions.StatsFileNotFoundException):
+                    version_stats = stats.get_stats_of(BANDWIDTH_STATS_FILE, [stats_id], version)
+                    if stats_id in version_stats:
+                        return version_stats[stats_id]
+    return {}
+
+
+def store_cached_bandwidths(
+    profile: Profile, config: dict[str, Any], kernel_models: list[dict[str, Any]]
+) -> None:
+    """
+    Stores the bandwidths selected for the uids of the profile to the stats of the minor version
+    the profile originates from (or of HEAD, if the profile has no origin).
+
+    :param Profile profile: the postprocessed profile
+    :param dict config: the perun and option context contains the entered options and commands
+    :param list kernel_models: the computed kernel models
+    """
+    stats_id = get_bandwidth_cache_id(profile, config)
+    if stats_id is None or not config.get("cache_bandwidths", True):
+        return
+    bandwidths = {
+        model["uid"]: {
+            "bandwidth": float(model["bandwidth"]),
+            "r_square": float(model["r_square"]),
+        }
+        for model in kernel_models
+        if model["kernel_mode"] != "manually"
+        and np.isfinite(model["bandwidth"])
+        and np.isfinite(model["r_square"])
+    }
+    if bandwidths:
+        with exceptions.SuppressedExceptions(*_BANDWIDTH_CACHE_ERRORS):
+            stats.update_stats(
+                BANDWIDTH_STATS_FILE, [stats_id], [bandwidths], profile.get("origin")
+            )
+
+
+def is_cached_bandwidth_valid(r_square: float, cached_bandwidth: dict[str, float]) -> bool:
+    """
+    Checks whether the fit with the cached bandwidth is not worse than the cached fit.
+
+    :param float r_square: the coefficient of determination of the fit with cached bandwidth
+    :param dict cached_bandwidth: the cached bandwidth and coefficient of determination
+    :return bool: true if the cached bandwidth can be reused
+    """
+    return r_square >= cached_bandwidth["r_square"] - _BANDWIDTH_CACHE_TOLERANCE
 
 
 def kernel_regression(
-    x_pts: list[float], y_pts: list[float], config: dict[str, Any]
+    x_pts: list[float],
+    y_pts: list[float],
+    config: dict[str, Any],
+    cached_bandwidth: Optional[dict[str, float]] = None,
 ) -> dict[str, Any]:
     """
     This method executing the computation of three modes of kernel regression
@@ -175,9 +309,15 @@ def kernel_regression(
     the computation are setting the parameters in the resulting dictionary, that will
     be return.
 
+    In the `estimator-settings` mode, the @p cached_bandwidth selected in the previous runs is
+    tried first and the search of the bandwidth is executed only if the fit with the cached
+    bandwidth is worse than the cached one.
+
     :param list x_pts: the list of x points coordinates
     :param list y_pts: the list of y points coordinates
     :param dict config: the perun and option context contains the entered options and commands
+    :param dict cached_bandwidth: the bandwidth and coefficient of determination of the uid
+        selected in the previous runs
     :return dict: the output dictionary with result of kernel regression
     """
     estimator_settings_flag = config["kernel_mode"] == "estimator-settings"
@@ -185,17 +325,35 @@ def kernel_regression(
         # Set the method to determine kernel bandwidth with EstimatorSettings
         # - Possible values `bw` in this branch are: `cv_ls`, `aic`
         bw_value = config.get("bandwidth_method")
-    else:
+    elif "bandwidth_value" in config:
         # If was entered the bandwidth value by user, then will be set as `bw` value
-        # - If was entered the bandwidth method to determination, then will be computing
-        # -- Possible values of bandwidth method in this branch are: `scott`, `silverman`
-        bw_value = config.get(
-            "bandwidth_value",
-            nparam.bandwidths.select_bandwidth(
-                x_pts, config.get("method_name", BW_SELECTION_METHODS[0]), kernel=None
-            ),
+        bw_value = config["bandwidth_value"]
+    else:
+        # If was entered the bandwidth method to determination, then will be computing
+        # - Possible values of bandwidth method in this branch are: `scott`, `silverman`
+        bw_value = nparam.bandwidths.select_bandwidth(
+            x_pts, config.get("method_name", BW_SELECTION_METHODS[0]), kernel=None
         )
 
+    if estimator_settings_flag and cached_bandwidth is not None:
+        # Warm start with the bandwidth selected in the previous runs (without any search)
+        kernel_estimate = nparam.KernelReg(
+            endog=[y_pts],
+            exog=[x_pts],
+            reg_type=config["reg_type"],
+            var_type="c",
+            bw=np.array([cached_bandwidth["bandwidth"]]),
+        )
+        kernel_stats, _ = kernel_estimate.fit()
+        r_square = kernel_estimate.r_squared()
+        if is_cached_bandwidth_valid(r_square, cached_bandwidth):
+            return {
+                "bandwidth": kernel_estimate.bw[0],
+                "r_square": r_square,
+                "bucket_stats": list(kernel_stats),
+                "kernel_mode": "estimator",
+            }
+
     # Set specify settings for estimator object, if was selected the mode: `estimator-settings`
     # - When was not selected `estimator-settings` mode, then this object is not used at analysis
     estimator_settings = nparam.EstimatorSettings(
@@ -333,8 +491,161 @@ def kernel_smoothing(
     }
 
 
-def kernel_ridge(
+def select_bandwidth(x_pts: npt.NDArray[np.float64], config: dict[str, Any]) -> float:
+    """
+    Returns the kernel bandwidth entered by the user or computed by the selected method.
+
+    The bandwidth is the standard deviation of the kernel, i.e. the square root of the kernel
+    covariance computed by the Scott's or Silverman's rule of thumb.
+
+    :param np.ndarray x_pts: the array of x points coordinates
+    :param dict config: the perun and option context contains the entered options and commands
+    :return float: the kernel bandwidth
+    """
+    if config.get("bandwidth_value"):
+        return float(config["bandwidth_value"])
+    if config.get("bandwidth_method") == "silverman":
+        covariance = pyqt_fit.silverman_covariance(x_pts)
+    else:
+        covariance = pyqt_fit.scotts_covariance(x_pts)
+    return float(np.sqrt(covariance[0][0]))
+
+
+def binned_kernel_smoothing(
+    in_x_pts: list[float], in_y_pts: list[float], config: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    This method executing the computation of `binned-smoothing` mode.
+
+    Method computes the Nadaraya-Watson (spatial-average) kernel estimate on the regular grid
+    of bins instead of on the original points. The points are first linearly binned, i.e. each
+    point splits its weight (and its y-coordinate) between the two nearest bins according to
+    its distance from them. The sums of weights and of y-coordinates in the bins are then
+    convolved with the kernel sampled on the grid using the FFT. Finally, both convolutions are
+    linearly interpolated at the original points and their ratio gives the kernel estimate.
+
+    The time of the computation is linear in the number of points (plus the convolution of the
+    bins) and the memory is bounded by the number of bins regardless of the number of points.
+
+    :param list in_x_pts: the sorted list of x points coordinates
+    :param list in_y_pts: the list of y points coordinates
+    :param dict config: the perun and option context contains the entered options and commands
+    :return dict: the output dictionary with result of kernel regression
+    """
+    # Retype the coordinated list for requirements of computation
+    x_pts = np.asanyarray(in_x_pts, dtype=np.float_)
+    y_pts = np.asanyarray(in_y_pts, dtype=np.float_)
+    bandwidth = select_bandwidth(x_pts, config)
+
+    grid, delta = np.linspace(x_pts[0], x_pts[-1], config["bins_count"], retstep=True)
+    if delta <= 0 or bandwidth <= 0:
+        # All points share the same x-coordinate, hence the estimate is just their average
+        estimate = np.full_like(y_pts, y_pts.mean())
+    else:
+        # Linear binning of the points: each point is split between the neighbouring bins
+        positions = (x_pts - grid[0]) / delta
+        lower = np.minimum(positions.astype(np.int_), len(grid) - 2)
+        upper_weights = positions - lower
+        lower_weights = 1 - upper_weights
+
+        def bin_values(values: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+            """Sums the weighted values into the bins of the grid"""
+            return np.asarray(
+                np.bincount(lower, lower_weights * values, minlength=len(grid))
+                + np.bincount(lower + 1, upper_weights * values, minlength=len(grid)),
+                dtype=np.float64,
+            )
+
+        # Kernel sampled on the grid up to its cut (or over the whole grid for long kernels)
+        kernel: Any = _KERNEL_TYPES_MAPS[config["kernel_type"]]
+        radius = min(int(np.ceil(kernel.cut * bandwidth / delta)), len(grid) - 1)
+        kernel_weights = kernel.pdf(np.arange(-radius, radius + 1) * delta / bandwidth)
+
+        weights = signal.fftconvolve(bin_values(np.ones_like(y_pts)), kernel_weights, mode="same")
+        sums = signal.fftconvolve(bin_values(y_pts), kernel_weights, mode="same")
+        # Each point has non-zero weight in its own bins, hence the ratio is always defined
+        estimate = np.interp(x_pts, grid, sums) / np.interp(x_pts, grid, weights)
+
+    # Set parameter for resulting kernel model
+    return {
+        "bandwidth": bandwidth,
+        "r_square": metrics.r2_score(y_pts, estimate),
+        "bucket_stats": list(estimate),
+        "kernel_mode": "binned",
+    }
+
+
+def nystroem_kernel_ridge(
     in_x_pts: list[float], in_y_pts: list[float], config: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    This method executing the computation of `nystroem-ridge` mode.
+
+    Method computes the kernel ridge regression with the `rbf` kernel approximated by the
+    Nystroem method (see sklearn.kernel_approximation.Nystroem): the kernel is evaluated only
+    against the limited number of components (i.e. the landmark points sampled from the data),
+    which gives for each point the vector of features. The ridge regression is then solved in
+    the space of these features. The normal equations of the ridge regression are accumulated
+    by chunks of points, hence the memory is bounded by the number of components and the size of
+    the chunks regardless of the number of points.
+
+    If the <gamma> is not entered by the user, then it is derived from the bandwidth computed
+    by the Scott's rule as :math:`1 / (2h^2)`.
+
+    :param list in_x_pts: the sorted list of x points coordinates
+    :param list in_y_pts: the list of y points coordinates
+    :param dict config: the perun and option context contains the entered options and commands
+    :return dict: the output dictionary with result of kernel regression
+    """
+    # Retype the coordinated list for requirements of computational class
+    x_pts = np.asanyarray(in_x_pts, dtype=np.float_).reshape(-1, 1)
+    y_pts = np.asanyarray(in_y_pts, dtype=np.float_)
+    y_mean = y_pts.mean()
+
+    gamma = config.get("gamma")
+    if not gamma:
+        bandwidth = select_bandwidth(x_pts[:, 0], {"bandwidth_method": "scott"})
+        gamma = 1 / (2 * bandwidth**2) if bandwidth > 0 else 1.0
+    features_map = kernel_approximation.Nystroem(
+        kernel="rbf",
+        gamma=gamma,
+        n_components=min(config["components_count"], len(x_pts)),
+        random_state=0,
+    ).fit(x_pts)
+
+    # Accumulate the normal equations of the ridge regression by chunks of points
+    components = features_map.components_.shape[0]
+    features_gram = np.zeros((components, components))
+    features_targets = np.zeros(components)
+    for start in range(0, len(x_pts), _NYSTROEM_CHUNK_SIZE):
+        features = features_map.transform(x_pts[start : start + _NYSTROEM_CHUNK_SIZE])
+        features_gram += features.T @ features
+        features_targets += features.T @ (y_pts[start : start + _NYSTROEM_CHUNK_SIZE] - y_mean)
+    features_gram[np.diag_indices_from(features_gram)] += config["alpha"]
+    coefficients = np.linalg.lstsq(features_gram, features_targets, rcond=None)[0]
+
+    estimate = np.concatenate(
+        [
+            features_map.transform(x_pts[start : start + _NYSTROEM_CHUNK_SIZE]) @ coefficients
+            for start in range(0, len(x_pts), _NYSTROEM_CHUNK_SIZE)
+        ]
+    )
+    estimate += y_mean
+
+    # Set parameter for resulting kernel model
+    return {
+        "bandwidth": gamma,
+        "r_square": metrics.r2_score(y_pts, estimate),
+        "bucket_stats": list(estimate),
+        "kernel_mode": "nystroem",
+    }
+
+
+def kernel_ridge(
+    in_x_pts: list[float],
+    in_y_pts: list[float],
+    config: dict[str, Any],
+    cached_bandwidth: Optional[dict[str, float]] = None,
 ) -> dict[str, Any]:
     """
     This method executing the computation of `kernel-ridge` mode.
@@ -348,9 +659,15 @@ def kernel_ridge(
     `Kernel Regressor` class from `sklearn` package. For more details about
     this approach you can see class `KernelRidge` or Perun Documentation.
 
+    The @p cached_bandwidth selected in the previous runs is tried first (if it lies in the
+    given range) and the cross-validation is executed only if the fit with the cached bandwidth
+    is worse than the cached one.
+
     :param list in_x_pts: the list of x points coordinates
     :param list in_y_pts: the list of y points coordinates
     :param dict config: the perun and option context contains the entered options and commands
+    :param dict cached_bandwidth: the gamma and coefficient of determination of the uid
+        selected in the previous runs
     :return dict: the output dictionary with result of kernel regression
     """
     # Retype the coordinated list for requirements of computational class
@@ -360,6 +677,22 @@ def kernel_ridge(
     # Obtaining the edges of the given range
     low_boundary = config["gamma_range"][0]
     high_boundary = config["gamma_range"][1]
+    if (
+        cached_bandwidth is not None
+        and low_boundary <= cached_bandwidth["bandwidth"] <= high_boundary
+    ):
+        # Warm start with the gamma selected in the previous runs (without cross-validation)
+        kernel_estimate = KernelRidge(gamma=cached_bandwidth["bandwidth"]).fit(x_pts, y_pts)
+        kernel_values = kernel_estimate.predict(x_pts)
+        r_square = metrics.r2_score(y_pts, kernel_values)
+        if is_cached_bandwidth_valid(r_square, cached_bandwidth):
+            return {
+                "bandwidth": kernel_estimate.gamma,
+                "r_square": r_square,
+                "bucket_stats": list(kernel_values),
+                "kernel_mode": "ridge",
+            }
+
     # Executing the kernel regression with automatic bandwidth selection
     kernel_estimate = KernelRidge(
         gamma=np.arange(low_boundary, high_boundary, config["gamma_step"])
@@ -377,7 +710,10 @@ def kernel_ridge(
 
 
 def execute_kernel_regression(
-    x_pts: list[float], y_pts: list[float], config: dict[str, Any]
+    x_pts: list[float],
+    y_pts: list[float],
+    config: dict[str, Any],
+    cached_bandwidth: Optional[dict[str, float]] = None,
 ) -> dict[str, Any]:
     """
     This method serves to call the individual computing methods of a kernel regression.
@@ -392,6 +728,8 @@ def execute_kernel_regression(
     :param list x_pts: the list of x points coordinates
     :param list y_pts: the list of y points coordinates
     :param dict config: the perun and option context contains the entered options and commands
+    :param dict cached_bandwidth: the bandwidth and coefficient of determination of the points
+        selected in the previous runs (used only by the modes searching for the bandwidth)
     :return dict: the output dictionary with result of kernel regression
     """
     # Sort the points to the right order for computation
@@ -421,11 +759,15 @@ def execute_kernel_regression(
         "method-selection",
         "user-selection",
     ):
-        kernel_model.update(kernel_regression(x_pts, y_pts, config))
+        kernel_model.update(kernel_regression(x_pts, y_pts, config, cached_bandwidth))
     elif config["kernel_mode"] == "kernel-smoothing":
         kernel_model.update(kernel_smoothing(x_pts, y_pts, config))
     elif config["kernel_mode"] == "kernel-ridge":
-        kernel_model.update(kernel_ridge(x_pts, y_pts, config))
+        kernel_model.update(kernel_ridge(x_pts, y_pts, config, cached_bandwidth))
+    elif config["kernel_mode"] == "binned-smoothing":
+        kernel_model.update(binned_kernel_smoothing(x_pts, y_pts, config))
+    elif config["kernel_mode"] == "nystroem-ridge":
+        kernel_model.update(nystroem_kernel_ridge(x_pts, y_pts, config))
 
     return kernel_model
 
@@ -507,6 +849,8 @@ _MODES_REQUIRED_KEYS = {
         "polynomial_order",
     ],
     "kernel-ridge": ["gamma_range", "gamma_step"],
+    "binned-smoothing": ["kernel_type", "bandwidth_method", "bandwidth_value", "bins_count"],
+    "nystroem-ridge": ["gamma", "components_count", "alpha"],
     "user-selection": ["bandwidth_value", "reg_type"],
     "method-selection": ["bandwidth_method", "reg_type"],
     "common_keys": ["per_key", "of_key"],
@@ -57,6 +57,14 @@ _DEFAULT_POLYNOMIAL_ORDER: int = 3
 _DEFAULT_GAMMA_RANGE: tuple[float, float] = (1e-5, 1e-4)
 # Default size of step for iteration over given range in gamma parameter at `kernel-ridge`
 _DEFAULT_GAMMA_STEP: float = 1e-5
+# Set of kernels for use with `binned-smoothing` mode (only the non-negative kernels)
+_BINNED_KERNEL_TYPES: list[str] = _KERNEL_TYPES[:3]
+# Default number of bins of the grid at `binned-smoothing`
+_DEFAULT_BINS_COUNT: int = 1024
+# Default number of components (landmark points) of the kernel approximation at `nystroem-ridge`
+_DEFAULT_COMPONENTS_COUNT: int = 128
+# Default strength of the regularization at `nystroem-ridge`
+_DEFAULT_ALPHA: float = 1e-3
 
 
 def postprocess(
@@ -65,13 +73,20 @@ def postprocess(
     """
     Invoked from perun core, handles the postprocess actions
 
+    The bandwidths selected for the uids are cached in the stats, so the subsequent runs on the
+    same command and workload (e.g. in the next commit) can reuse them instead of the search (see
+    :func:`methods.load_cached_bandwidths`).
+
     :param dict profile: the profile to analyze
     :param configuration: the perun and options context
     """
     # Perform the non-parametric analysis using the kernel regression
+    cached_bandwidths = methods.load_cached_bandwidths(profile, configuration)
     kernel_models = methods.compute_kernel_regression(
-        data_provider.generic_profile_provider(profile, **configuration), configuration
+        data_provider.generic_profile_provider(profile, **configuration),
+        dict(configuration, cached_bandwidths=cached_bandwidths),
     )
+    methods.store_cached_bandwidths(profile, configuration, kernel_models)
 
     # Return the profile after the execution of kernel regression
     return (
@@ -649,8 +664,138 @@ def kernel_ridge(ctx: click.Context, **kwargs: Any) -> None:
     runner.run_postprocessor_on_profile(ctx.obj, "kernel_regression", kwargs)
 
 
+@click.command(name="binned-smoothing")
+@click.option(
+    "--kernel-type",
+    "-kt",
+    type=click.Choice(_BINNED_KERNEL_TYPES),
+    default=_BINNED_KERNEL_TYPES[0],
+    help=(
+        "Provides the set of kernels to execute the `binned-smoothing` with kernel selected by "
+        "the user. The kernels are the same as in the `kernel-smoothing` mode."
+    ),
+)
+@click.option(
+    "--bandwidth-method",
+    "-bm",
+    type=click.Choice(methods.BW_SELECTION_METHODS),
+    default=methods.BW_SELECTION_METHODS[0],
+    help=(
+        "Provides the helper method to determine the kernel bandwidth. Cannot be entered in "
+        "combination with <bandwidth-value>, then will be ignored and will be accepted value "
+        "from <bandwidth-value>."
+    ),
+)
+@click.option(
+    "--bandwidth-value",
+    "-bv",
+    type=click.FloatRange(min=1e-10, max=None),
+    help=(
+        "The float value of <bandwidth> defined by user, which will be used at kernel "
+        "regression. If is entered in the combination with <bandwidth-method>, then method "
+        "will be ignored."
+    ),
+)
+@click.option(
+    "--bins",
+    "-b",
+    "bins_count",
+    type=click.IntRange(min=2, max=None),
+    default=_DEFAULT_BINS_COUNT,
+    help=(
+        "Provides the number of bins of the regular grid, on which the kernel estimate is "
+        "computed. Default value is 1024. More bins give more precise estimate at the cost of "
+        "longer computation."
+    ),
+)
+@click.pass_context
+def binned_smoothing(ctx: click.Context, **kwargs: Any) -> None:
+    """
+    Nadaraya-Watson kernel regression computed on the grid of bins.
+
+    .. _FFT: https://en.wikipedia.org/wiki/Fast_Fourier_transform
+
+    This mode computes the same estimate as the `spatial-average` method of
+    :ref:`postprocessors-kernel-regression-kernel_smoothing`, however, it approximates the
+    estimate on a regular grid of <bins> bins, hence it is suitable for large number of resources.
+    The resources are first *linearly binned*, i.e. each resource splits its weight between the
+    two nearest bins of the grid. The binned weights and values are then convolved with the
+    selected kernel using the FFT_ and the resulting estimate is linearly interpolated back to the
+    original resources. The time of the computation grows linearly with the number of resources
+    and the memory is bounded by the number of bins. The kernel bandwidth is either entered by
+    <bandwidth-value> or computed by one of the methods described in
+    :ref:`postprocessors-kernel-regression-method_selection`.
+    """
+    assert ctx.parent is not None and f"impossible happened: {ctx} has no parent"
+    # update the current set of params with the selected mode of kernel regression
+    kwargs.update({"kernel_mode": "binned-smoothing"})
+    # update the current set of params with the params entered at `kernel regression` command
+    kwargs.update(ctx.parent.params)
+    runner.run_postprocessor_on_profile(ctx.obj, "kernel_regression", kwargs)
+
+
+@click.command(name="nystroem-ridge")
+@click.option(
+    "--gamma",
+    "-g",
+    type=click.FloatRange(min=1e-10, max=None),
+    help=(
+        "Provides the gamma parameter of the `rbf` kernel, i.e. the kernel bandwidth. If it is "
+        "not entered, then it is derived from the bandwidth computed by the Scott's rule."
+    ),
+)
+@click.option(
+    "--components",
+    "-nc",
+    "components_count",
+    type=click.IntRange(min=1, max=None),
+    default=_DEFAULT_COMPONENTS_COUNT,
+    help=(
+        "Provides the number of components (i.e. sampled resources) used to approximate the "
+        "kernel. Default value is 128."
+    ),
+)
+@click.option(
+    "--alpha",
+    "-a",
+    type=click.FloatRange(min=0, max=None),
+    default=_DEFAULT_ALPHA,
+    help="Provides the strength of the regularization of the ridge regression.",
+)
+@click.pass_context
+def nystroem_ridge(ctx: click.Context, **kwargs: Any) -> None:
+    """
+    Kernel ridge regression with the kernel approximated by the Nystroem method.
+
+    .. _Nystroem: https://scikit-learn.org/stable/modules/kernel_approximation.html
+
+    This mode computes the kernel ridge regression with *gaussian* kernel
+    :math:`K(x, y) = exp(-gamma * ||x-y||^2)`, however, the kernel matrix over all pairs of
+    resources is never constructed. Instead, the kernel is approximated by the Nystroem_ method
+    using only <components> resources sampled from the data and the ridge regression is solved in
+    the space of the resulting features with the regularization <alpha>. The features are
+    computed by chunks of resources, hence the memory is bounded by the number of components
+    regardless of the number of resources.
+    """
+    assert ctx.parent is not None and f"impossible happened: {ctx} has no parent"
+    # update the current set of params with the selected mode of kernel regression
+    kwargs.update({"kernel_mode": "nystroem-ridge"})
+    # update the current set of params with the params entered at `kernel regression` command
+    kwargs.update(ctx.parent.params)
+    runner.run_postprocessor_on_profile(ctx.obj, "kernel_regression", kwargs)
+
+
 @click.group(invoke_without_command=True)
 @cli_kit.resources_key_options
+@click.option(
+    "--cache-bandwidths/--no-cache-bandwidths",
+    default=True,
+    help=(
+        "Caches the bandwidths selected by the `estimator-settings` and `kernel-ridge` modes in "
+        "the stats, so the subsequent runs on the same command and workload first try the "
+        "previously selected bandwidth and search for a new one only if the fit degrades."
+    ),
+)
 @click.pass_context
 def kernel_regression(ctx: click.Context, **_: Any) -> None:
     """
@@ -693,7 +838,7 @@ def kernel_regression(ctx: click.Context, **_: Any) -> None:
         are **scott** and **silverman** method. More information about these methods and its
         definition you cas see in the part :ref:`postprocessors-kernel-regression-method_selection`.
 
-    This postprocessor in summary offers five different modes, which does not differ in the
+    This postprocessor in summary offers seven different modes, which does not differ in the
     resulting estimate, but in the way of computation the resulting estimate. Better said, it
     means, that the result of each mode is the **kernel estimate** with relevant parameters,
     selected according to the concrete mode. In short, we will describe the individual methods, for
@@ -707,6 +852,17 @@ def kernel_regression(ctx: click.Context, **_: Any) -> None:
         | * **Kernel-Smoothing**: Kernel regression with different types of kernel and
                 regression methods
         | * **Kernel-Ridge**: Nadaraya-Watson kernel regression with automatic bandwidth selection
+        | * **Binned-Smoothing**: Nadaraya-Watson kernel regression computed on the grid of bins
+        | * **Nystroem-Ridge**: Kernel ridge regression with the kernel approximated by the
+                Nystroem method
+
+    The search for the bandwidth is the most expensive part of the **estimator-settings** and
+    **kernel-ridge** modes. Hence, the selected bandwidths are stored in the stats of the minor
+    version the profile originates from for each command, workload, uid, kernel and method of the
+    selection. The next run (e.g. in the next
+    commit) first fits the model with the bandwidth selected previously and searches for the new
+    bandwidth only if the coefficient of determination of the fit decreases. The cache can be
+    turned off by the <no-cache-bandwidths> option.
 
     For more details about this approach of non-parametric analysis refer
     to :ref:`postprocessors-kernel-regression`.
@@ -722,12 +878,16 @@ def kernel_regression(ctx: click.Context, **_: Any) -> None:
 # - bandwidth_methods: bandwidth computed by helper method for its determine
 # - kernel-smoothing: provides the ability to choose a kernel and other methods
 # - kernel-ridge: set bandwidth by minimizing MSE in leave-one-out cross validation from given range
+# - binned-smoothing: approximates the kernel-smoothing on the grid of bins for large data
+# - nystroem-ridge: kernel ridge regression with the Nystroem approximation of the kernel
 _SUPPORTED_MODES = [
     estimator_settings,
     user_selection,
     method_selection,
     kernel_smoothing,
     kernel_ridge,
+    binned_smoothing,
+    nystroem_ridge,
 ]
 # addition of sub-commands (supported modes) to main command represents by kernel_regression
 for mode in _SUPPORTED_MODES:
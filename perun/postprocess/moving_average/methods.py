@@ -5,10 +5,11 @@ auxiliary methods at executing of this method.
 from __future__ import annotations
 
 # Standard Imports
-from typing import Callable, Iterator, Any, cast
+from typing import Callable, Iterator, Any, Optional, TYPE_CHECKING, cast
 import dataclasses
 
 # Third-Party Imports
+from scipy import signal
 import click
 import numpy as np
 import pandas as pd
@@ -17,6 +18,14 @@ import sklearn.metrics
 # Perun Imports
 from perun.postprocess.regression_analysis import tools
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    # computation of the values of moving average models for the batch of window widths
+    BatchComputation = Callable[
+        [npt.NDArray[np.float64], npt.NDArray[np.int_], dict[str, Any]], npt.NDArray[np.float64]
+    ]
+
 
 @dataclasses.dataclass()
 class DecayParamInfo:
@@ -31,6 +40,10 @@ _MIN_R_SQUARE: float = 0.88
 _WINDOW_WIDTH_INCREASE: float = 0.15
 # starting window width as the part of the length from the whole current interval
 _INTERVAL_LENGTH: float = 0.05
+# number of consecutive window widths evaluated at once, when the window width changes slowly
+_WINDOW_WIDTHS_BATCH: int = 16
+# maximal number of values of the moving average models computed at once by the batch evaluation
+_BATCH_VALUES_LIMIT: int = 2**21
 
 
 def get_supported_decay_params() -> list[str]:
@@ -71,6 +84,7 @@ def compute_moving_average(
 ) -> list[dict[str, Any]]:
     """
     The moving average wrapper to execute the analysis on the individual chunks of resources.
+    The chunks are computed by :func:`compute_uid`, possibly in parallel.
 
     :param iter data_gen: the generator object with collected data (data provider generators)
     :param dict configuration: the perun and option context
@@ -81,18 +95,31 @@ def compute_moving_average(
         configuration, _METHOD_REQUIRED_KEYS[configuration["moving_method"]], []
     )
 
-    # list of resulting models of the analysis
-    moving_average_models = []
-    for x_pts, y_pts, uid in data_gen:
-        moving_average_model = moving_average(x_pts, y_pts, configuration)
-        moving_average_model["uid"] = uid
-        moving_average_model["model"] = "moving_average"
-        # add partial result to the model result list - create output dictionaries
-        moving_average_models.append(moving_average_model)
-    return moving_average_models
+    # list of resulting models of the analysis (possibly computed in parallel)
+    return list(tools.compute_per_uid(compute_uid, data_gen, configuration))
+
+
+def compute_uid(
+    x_pts: list[float], y_pts: list[float], uid: str, configuration: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Computes the moving average model of single uid.
+
+    :param list x_pts: the list of x points coordinates
+    :param list y_pts: the list of y points coordinates
+    :param str uid: the uid of the computed points
+    :param dict configuration: the perun and option context
+    :return dict: the moving average model of the uid
+    """
+    moving_average_model = moving_average(x_pts, y_pts, configuration)
+    moving_average_model["uid"] = uid
+    moving_average_model["model"] = "moving_average"
+    return moving_average_model
 
 
-def execute_computation(y_pts: list[float], config: dict[str, Any]) -> tuple[Any, float]:
+def execute_computation(
+    y_pts: list[float] | npt.NDArray[np.float64], config: dict[str, Any]
+) -> tuple[Any, float]:
     """
     The computation wrapper of supported methods of moving average approach.
 
@@ -186,6 +213,139 @@ def moving_average(
     }
 
 
+def compute_r_squares(
+    y_pts: npt.NDArray[np.float64], window_widths: list[int], config: dict[str, Any]
+) -> list[float]:
+    """
+    Computes the coefficients of determination (R^2) for the batch of window widths.
+
+    The models are not materialised as pandas.Series, only their values are computed for
+    all the window widths at once: Simple Moving Average by the cumulative sums of the y points
+    and Exponential Moving Average by the linear filter of its recurrence. The rest of the
+    methods (i.e. Simple Moving Median, Simple Moving Average with window type and Exponential
+    Moving Average specified by `alpha`) are computed by :func:`execute_computation`.
+
+    The values missing due to the minimal number of observations are considered as zeros
+    as in :func:`execute_computation`.
+
+    :param np.ndarray y_pts: the array of sorted y points coordinates
+    :param list window_widths: the list of window widths to evaluate
+    :param dict config: the perun and option context with needed parameters
+    :return list: the coefficients of determination of the window widths
+    """
+    compute_values = _get_batch_computation(window_widths, config)
+    if compute_values is None:
+        return [
+            execute_computation(y_pts, dict(config, window_width=width))[1]
+            for width in window_widths
+        ]
+
+    r_squares: list[float] = []
+    # the values are computed by chunks of window widths to bound the used memory
+    chunk_size = max(1, _BATCH_VALUES_LIMIT // len(y_pts))
+    total_sum_squares = ((y_pts - y_pts.mean()) ** 2).sum()
+    for start in range(0, len(window_widths), chunk_size):
+        values = compute_values(y_pts, np.array(window_widths[start : start + chunk_size]), config)
+        residual_sum_squares = ((np.nan_to_num(values) - y_pts) ** 2).sum(axis=1)
+        if total_sum_squares == 0:
+            # the same convention as sklearn.metrics.r2_score for the constant y points
+            r_squares.extend(np.where(residual_sum_squares == 0, 1.0, 0.0))
+        else:
+            r_squares.extend(1 - residual_sum_squares / total_sum_squares)
+    return [float(r_square) for r_square in r_squares]
+
+
+def _get_batch_computation(
+    window_widths: list[int], config: dict[str, Any]
+) -> Optional[BatchComputation]:
+    """
+    Returns the function computing the values of moving average models for batch of window widths.
+
+    :param list window_widths: the list of window widths to evaluate
+    :param dict config: the perun and option context with needed parameters
+    :return function: the batch computation of the models or None, if the method is not supported
+    """
+    # the minimal number of observations greater than the window width is rejected by pandas
+    min_periods = config["min_periods"] or 0
+    if (
+        config["moving_method"] == "sma"
+        and not config.get("window_type")
+        and min_periods <= min(window_widths)
+    ):
+        return _simple_moving_averages
+    elif config["moving_method"] == "ema" and config["decay"] in _EMA_SMOOTHING_FACTORS:
+        return _exponential_moving_averages
+    return None
+
+
+def _simple_moving_averages(
+    y_pts: npt.NDArray[np.float64], window_widths: npt.NDArray[np.int_], config: dict[str, Any]
+) -> npt.NDArray[np.float64]:
+    """
+    Computes the Simple Moving Average of the y points for each window width.
+
+    The sums of the windows are computed as differences of the cumulative sums of y points,
+    which are shifted by their mean to limit the cancellation errors. The windows, that lie
+    within the points, are computed by slices of the cumulative sums, the rest of the windows
+    (at the edges) only if they can have the minimal number of observations.
+
+    :param np.ndarray y_pts: the array of sorted y points coordinates
+    :param np.ndarray window_widths: the array of window widths
+    :param dict config: the perun and option context with needed parameters
+    :return np.ndarray: 2D array with the moving averages (row per window width), the values
+        without the minimal number of observations are NaN
+    """
+    points_count, y_mean = len(y_pts), y_pts.mean()
+    cumulative_sums = np.concatenate(([0.0], np.cumsum(y_pts - y_mean)))
+    values = np.full((len(window_widths), points_count), np.nan)
+    for row, width in enumerate(window_widths):
+        # the window of each label starts the offset before it (or half of the width if centered)
+        offset = width // 2 if config["center"] else width - 1
+        first, last = offset, points_count - width + offset
+        if first <= last:
+            values[row, first : last + 1] = (
+                cumulative_sums[width:] - cumulative_sums[:-width]
+            ) / width + y_mean
+        if (config["min_periods"] or width) < width:
+            labels = np.concatenate(
+                (
+                    np.arange(min(first, points_count)),
+                    np.arange(max(last + 1, min(first, points_count)), points_count),
+                )
+            )
+            starts = np.maximum(labels - offset, 0)
+            ends = np.minimum(labels - offset + width - 1, points_count - 1)
+            counts = ends - starts + 1
+            edge_values = (cumulative_sums[ends + 1] - cumulative_sums[starts]) / counts + y_mean
+            values[row, labels] = np.where(counts >= config["min_periods"], edge_values, np.nan)
+    return values
+
+
+def _exponential_moving_averages(
+    y_pts: npt.NDArray[np.float64], window_widths: npt.NDArray[np.int_], config: dict[str, Any]
+) -> npt.NDArray[np.float64]:
+    """
+    Computes the (adjusted) Exponential Moving Average of the y points for each window width.
+
+    The weighted sums of the observations are computed by the linear filter of the recurrence
+    :math:`s_t = y_t + (1 - \\alpha)s_{t-1}` and the sums of the weights by the same filter of ones.
+
+    :param np.ndarray y_pts: the array of sorted y points coordinates
+    :param np.ndarray window_widths: the array of window widths (i.e. the decay values)
+    :param dict config: the perun and option context with needed parameters
+    :return np.ndarray: 2D array with the moving averages (row per window width), the values
+        without the minimal number of observations are NaN
+    """
+    values = np.empty((len(window_widths), len(y_pts)))
+    for row, width in enumerate(window_widths):
+        decay = 1 - _EMA_SMOOTHING_FACTORS[config["decay"]](width)
+        weighted_sums = signal.lfilter([1.0], [1.0, -decay], y_pts)
+        weights = signal.lfilter([1.0], [1.0, -decay], np.ones_like(y_pts))
+        values[row] = weighted_sums / weights
+        values[row, : int(config["min_periods"] or width) - 1] = np.nan
+    return values
+
+
 def iterative_analysis(
     x_pts: list[float], y_pts: list[float], config: dict[str, Any]
 ) -> tuple[pd.Series[Any], float, int]:
@@ -200,6 +360,11 @@ def iterative_analysis(
     given dataset, which runs until the value of `coefficient of determination`
     will not reach the required level.
 
+    The iterations only evaluate the coefficients of determination (see
+    :func:`compute_r_squares`). When the window width decreases slowly, the batch of following
+    window widths is evaluated at once. The resulting model is materialised only once for the
+    last evaluated window width.
+
     :param list x_pts: the list of x points coordinates
     :param list y_pts: the list of y points coordinates
     :param dict config: the perun and option context with needed parameters
@@ -209,17 +374,30 @@ def iterative_analysis(
     # set the initial value of window width by a few percents of the length of the interval
     # - minimal window width is equal to 1
     config["window_width"] = max(1, int(_INTERVAL_LENGTH * (max(x_pts) - min(x_pts))))
-    r_square, window_new_change = 0.0, 1
+    y_values = np.asarray(y_pts, dtype=np.float_)
+    r_squares: dict[int, float] = {}
+    r_square, window_new_change, batch_size = 0.0, 1, 1
+    window_width = config["window_width"]
     # executing the iterative analysis until the value of R^2 will not reach the required level
-    bucket_stats: pd.Series[Any] = pd.Series()
     while r_square < _MIN_R_SQUARE and window_new_change:
-        # obtaining new results from moving average analysis
-        bucket_stats, r_square = execute_computation(y_pts, config)
+        window_width = config["window_width"]
+        # obtaining new results from moving average analysis (possibly for following widths too)
+        if window_width not in r_squares:
+            widths = list(range(window_width, max(0, window_width - batch_size), -1))
+            r_squares.update(zip(widths, compute_r_squares(y_values, widths, config)))
+        r_square = r_squares[window_width]
         # check whether the window width is still changing
-        new_window_width = compute_window_width_change(config["window_width"], r_square)
-        window_new_change = config["window_width"] - new_window_width
+        new_window_width = compute_window_width_change(window_width, r_square)
+        window_new_change = window_width - new_window_width
+        # the window width changes slowly, hence the following widths are evaluated in batch
+        batch_size = 1
+        if 4 * window_new_change <= _WINDOW_WIDTHS_BATCH and _get_batch_computation(
+            [max(1, new_window_width - _WINDOW_WIDTHS_BATCH)], config
+        ):
+            batch_size = _WINDOW_WIDTHS_BATCH
         # computation of the new window width, if yet have not been achieved the desired smoothness
         config["window_width"] = new_window_width
+    bucket_stats, r_square = execute_computation(y_pts, dict(config, window_width=window_width))
     return bucket_stats, r_square, config["window_width"]
 
 
@@ -263,6 +441,14 @@ _METHOD_REQUIRED_KEYS: dict[str, list[str]] = {
     "ema": ["decay", "min_periods", "per_key"],
 }
 
+# dictionary contains the smoothing factors (alpha) of Exponential Moving Average for `decay` values
+# - the `alpha` decay is not included, since its values are used directly (and validated by pandas)
+_EMA_SMOOTHING_FACTORS: dict[str, Callable[[float], float]] = {
+    "com": lambda value: 1 / (1 + value),
+    "span": lambda value: 2 / (value + 1),
+    "halflife": lambda value: 1 - np.exp(np.log(0.5) / value),
+}
+
 # dictionary serves for validation values at `decay` parameter - validation of acceptable range
 # - dictionary contains the recognized `decay` method names as key
 # -- dictionary contains the validate condition and warning message as value
@@ -6,21 +6,87 @@ from operator import itemgetter
 from typing import Iterator, Any, TYPE_CHECKING
 
 # Third-Party Imports
+import numpy as np
 
 # Perun Imports
 from perun.profile import convert
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from perun.profile.convert import Column
     from perun.profile.factory import Profile
 
 
-def resource_sort_key(resource: dict[str, Any]) -> str:
-    """Extracts the key from resource used for sorting
+def group_columns_by_uid(
+    profile: Profile, of_key: str, per_key: str
+) -> list[tuple[str, list[tuple[npt.NDArray[Any], npt.NDArray[Any]]]]]:
+    """Groups the columns of x and y points of resource types by their uid
+
+    The uid is a persistent property, hence all resources of one resource type share the same uid.
+    The points are thus grouped per resource type (see :meth:`Profile.resource_columns`) instead
+    of per resource, and only the distinct uids are sorted. The points of each uid are kept in
+    the order of the resources in the profile.
+
+    :param Profile profile: the trace profile dictionary
+    :param str of_key: key for which we are finding the model
+    :param str per_key: key of the independent variable
+    :returns list: sorted pairs of uid and list of columns of x and y points of its resource types
+    :raises KeyError: if some of the resources does not have the of_key or per_key
+    """
+    groups: dict[str, list[tuple[npt.NDArray[Any], npt.NDArray[Any]]]] = {}
+    for _, persistent_properties, columns in profile.resource_columns():
+        # Types without collectable values still contribute one resource of persistent values
+        size = min((len(column) for column in columns.values()), default=1)
+        if size:
+            groups.setdefault(convert.flatten(persistent_properties["uid"]), []).append(
+                (
+                    _get_column(persistent_properties, columns, per_key, size),
+                    _get_column(persistent_properties, columns, of_key, size),
+                )
+            )
+    return sorted(groups.items(), key=itemgetter(0))
+
+
+def _get_column(
+    persistent_properties: dict[str, Any], columns: dict[str, Column], key: str, size: int
+) -> npt.NDArray[Any]:
+    """Returns the column of values of the key in the resource type
+
+    :param dict persistent_properties: persistent properties of the resource type
+    :param dict columns: collectable properties of the resource type converted to columns
+    :param str key: key of the returned values
+    :param int size: number of resources of the resource type
+    :return: column of values of the key
+    :raises KeyError: if the resource type does not have the key
+    """
+    if key in persistent_properties:
+        return convert.repeat_value(persistent_properties[key], size)
+    column = columns[key]
+    column = column.decode() if isinstance(column, convert.DictionaryColumn) else column
+    return column[:size]
+
+
+def columnar_profile_provider(
+    profile: Profile, of_key: str, per_key: str, **_: Any
+) -> Iterator[tuple[npt.NDArray[Any], npt.NDArray[Any], str]]:
+    """Data provider of NumPy arrays of x and y points of each uid of the profile.
+
+    The arrays are concatenated from the columns of resource types (see
+    :func:`group_columns_by_uid`), without constructing the individual resources.
 
-    :param dict resource: profiling resource
-    :return: key used for sorting
+    :param Profile profile: the trace profile dictionary
+    :param str of_key: key for which we are finding the model
+    :param str per_key: key of the independent variable
+    :param dict _: rest of the key arguments
+    :returns generator: each subsequent call returns tuple: x points array, y points array,
+        function name
     """
-    return convert.flatten(resource["uid"])
+    for uid, parts in group_columns_by_uid(profile, of_key, per_key):
+        if len(parts) == 1:
+            yield parts[0][0], parts[0][1], uid
+        else:
+            yield np.concatenate([x for x, _ in parts]), np.concatenate([y for _, y in parts]), uid
 
 
 def generic_profile_provider(
@@ -28,6 +94,9 @@ def generic_profile_provider(
 ) -> Iterator[tuple[list[float], list[float], str]]:
     """Data provider for trace collector profiling output.
 
+    The points are grouped by uids on the columns of resource types (see
+    :func:`group_columns_by_uid`) and converted to lists of values of each uid.
+
     :param Profile profile: the trace profile dictionary
     :param str of_key: key for which we are finding the model
     :param str per_key: key of the independent variable
@@ -35,27 +104,10 @@ def generic_profile_provider(
     :returns generator: each subsequent call returns tuple: x points list, y points list, function
         name
     """
-    # Get the file resources contents
-    resources = list(map(itemgetter(1), profile.all_resources()))
-
-    # Sort the dictionaries by function name for easier traversing
-    resources = sorted(resources, key=resource_sort_key)
-    x_points_list: list[float] = []
-    y_points_list: list[float] = []
-    function_name = convert.flatten(resources[0]["uid"])
-    # Store all the points until the function name changes
-    for resource in resources:
-        if convert.flatten(resource["uid"]) != function_name:
-            if x_points_list:
-                # Function name changed, yield the list of data points
-                yield x_points_list, y_points_list, function_name
-                x_points_list = [resource[per_key]]
-                y_points_list = [resource[of_key]]
-                function_name = convert.flatten(resource["uid"])
-        else:
-            # Add the data points
-            x_points_list.append(resource[per_key])
-            y_points_list.append(resource[of_key])
-    # End of resources, yield the current lists
-    if x_points_list:
-        yield x_points_list, y_points_list, function_name
+    for uid, parts in group_columns_by_uid(profile, of_key, per_key):
+        x_points_list: list[float] = []
+        y_points_list: list[float] = []
+        for x_column, y_column in parts:
+            x_points_list.extend(x_column.tolist())
+            y_points_list.extend(y_column.tolist())
+        yield x_points_list, y_points_list, uid
@@ -19,6 +19,7 @@ from typing import Any, Iterable, Callable
 import math
 
 # Third-Party Imports
+import numpy as np
 
 # Perun Imports
 from perun.postprocess.regression_analysis import tools
@@ -134,6 +135,55 @@ def generic_regression_data(
         yield data
 
 
+def generic_batch_regression_data(
+    points: tools.TransformedPoints, t_x: str, t_y: str, **_: Any
+) -> Iterable[dict[str, float]]:
+    """The vectorised version of the generic data generator.
+
+    Produces the same data dictionary as :func:`generic_regression_data` in a single step, however
+    the sums are computed by NumPy over the coordinates transformed by 't_x' and 't_y' (which are
+    shared among the models, see :class:`tools.TransformedPoints`). The points, for which the
+    transformation is not defined, are skipped.
+
+    :param TransformedPoints points: the regression points
+    :param str t_x: name of the transformation of x values (e.g. log10) as specified by the model
+        formula
+    :param str t_y: name of the transformation of y values (e.g. log10) as specified by the model
+        formula
+    :raises TypeError: if the required function arguments are not in the unpacked dictionary input
+    :returns iterable: generator object which produces the results in a data dictionary
+    """
+    x_tmp, x_valid = points.transform("x", t_x)
+    y_tmp, y_valid = points.transform("y", t_y)
+    valid = x_valid if y_valid is None else (y_valid if x_valid is None else x_valid & y_valid)
+    x_pts = points.x
+    if valid is not None:
+        x_tmp, y_tmp, x_pts = x_tmp[valid], y_tmp[valid], x_pts[valid]
+
+    # The min and max values are initialized by the first point, as in the generic generator
+    x_min = x_max = points.x_pts[0]
+    if len(x_pts):
+        min_idx, max_idx = int(np.argmin(x_pts)), int(np.argmax(x_pts))
+        if valid is not None:
+            indices = np.flatnonzero(valid)
+            min_idx, max_idx = int(indices[min_idx]), int(indices[max_idx])
+        x_min = min(x_min, points.x_pts[min_idx])
+        x_max = max(x_max, points.x_pts[max_idx])
+
+    pts_num = len(x_tmp)
+    yield dict(
+        x_sum=float(x_tmp.sum()),
+        y_sum=float(y_tmp.sum()),
+        xy_sum=float(np.dot(x_tmp, y_tmp)),
+        x_sq_sum=float(np.dot(x_tmp, x_tmp)),
+        y_sq_sum=float(np.dot(y_tmp, y_tmp)),
+        pts_num=pts_num,
+        num_sqrt=math.sqrt(pts_num),
+        x_start=x_min,
+        x_end=x_max,
+    )
+
+
 def generic_regression_coefficients(
     f_a: Callable[[float], float],
     f_b: Callable[[float], float],
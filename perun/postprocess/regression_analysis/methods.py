@@ -38,6 +38,9 @@ def compute(
 ) -> list[dict[str, Any]]:
     """The regression analysis wrapper for various computation methods.
 
+    The standard models of each uid are computed by :func:`compute_uid`, possibly in parallel
+    (see :func:`perun.postprocess.tools.compute_per_uid`).
+
     :param iter data_gen: the generator object with collected data (data provider generators)
     :param str method: the _METHODS key value indicating requested computation method
     :param tuple of str models: tuple of requested regression models to compute
@@ -51,17 +54,11 @@ def compute(
     # Split the models into derived and standard ones
     derived, models = regression_models.filter_derived(models)
     analysis = []
-    for chunk in data_gen:
-        try:
-            # First compute all the standard models
-            for result in _METHODS[method](chunk[0], chunk[1], models, **kwargs):
-                result["uid"] = chunk[2]
-                result["method"] = method
-                analysis.append(result)
-        except exceptions.GenericRegressionExceptionBase as exc:
-            log.minor_info(
-                f"unable to perform regression analysis on function '{chunk[2]} due to: {exc}",
-            )
+    # First compute all the standard models
+    for results, error in tools.compute_per_uid(compute_uid, data_gen, method, models, kwargs):
+        if error is not None:
+            log.minor_info(error)
+        analysis.extend(results)
     # Compute the derived models
     for der in compute_derived(derived, analysis, **kwargs):
         analysis.append(der)
@@ -69,6 +66,39 @@ def compute(
     return list(map(_transform_to_output_data, analysis))
 
 
+def compute_uid(
+    x_pts: list[float],
+    y_pts: list[float],
+    uid: str,
+    method: str,
+    models: tuple[str],
+    kwargs: dict[str, Any],
+) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """Computes the standard regression models of single uid.
+
+    The computed models are reduced to the keys in :data:`_RESULT_KEYS`, i.e. without the
+    computational details (such as the model functions), so they can be passed between processes.
+
+    :param list x_pts: the list of x points coordinates
+    :param list y_pts: the list of y points coordinates
+    :param str uid: the uid of the computed points
+    :param str method: the _METHODS key value indicating requested computation method
+    :param tuple of str models: tuple of requested standard regression models to compute
+    :param dict kwargs: various additional configuration arguments for specific models
+    :returns tuple: list of computed models and the error message, if the computation failed
+    """
+    analysis = []
+    try:
+        for result in _METHODS[method](x_pts, y_pts, models, **kwargs):
+            result = {key: result[key] for key in _RESULT_KEYS if key in result}
+            result["uid"] = uid
+            result["method"] = method
+            analysis.append(result)
+    except exceptions.GenericRegressionExceptionBase as exc:
+        return analysis, f"unable to perform regression analysis on function '{uid} due to: {exc}"
+    return analysis, None
+
+
 def compute_derived(
     derived_models: tuple[str], analysis: list[dict[str, Any]], **kwargs: Any
 ) -> Iterator[dict[str, Any]]:
@@ -90,7 +120,9 @@ def full_computation(
 ) -> Iterator[dict[str, Any]]:
     """The full computation method which fully computes every specified regression model.
 
-    The method might have performance issues in case of too many models or data points.
+    The models are computed by their vectorised data generators (if they have any), which share
+    the points converted to NumPy arrays and their transformations (see
+    :class:`tools.TransformedPoints`).
 
     :param list x_pts: the list of x points coordinates
     :param list y_pts: the list of y points coordinates
@@ -102,11 +134,12 @@ def full_computation(
     :returns iterable: the generator object which produces computed models one by one as a
         transformed output data dictionary
     """
+    points = tools.TransformedPoints(x_pts, y_pts)
     # Get all the models properties
     for model in regression_models.map_keys_to_models(computation_models):
         # Update the properties accordingly
         model["steps"] = 1
-        model = _build_uniform_regression_data_format(x_pts, y_pts, model)
+        model = _build_uniform_regression_data_format(x_pts, y_pts, model, points)
         # Compute each model
         for result in model["computation"](**model):
             yield result
@@ -466,7 +499,10 @@ def _transform_to_output_data(
 
 
 def _build_uniform_regression_data_format(
-    x_pts: list[float], y_pts: list[float], model: dict[str, Any]
+    x_pts: list[float],
+    y_pts: list[float],
+    model: dict[str, Any],
+    points: Optional[tools.TransformedPoints] = None,
 ) -> dict[str, Any]:
     """Creates the uniform regression data dictionary from the model properties and regression
     data points.
@@ -474,9 +510,13 @@ def _build_uniform_regression_data_format(
     The uniform data dictionary is used in the regression computation as it allows to build
     generic and easily extensible computational methods and models.
 
+    If the transformed @p points are given, then the vectorised data generator of the model is
+    used (if the model has any).
+
     :param list x_pts: the list of x points coordinates
     :param list y_pts: the list of y points coordinates
     :param dict model: the regression model properties
+    :param TransformedPoints points: the regression points converted for vectorised computation
     :raises InvalidPointsException: if the points count is too low or their coordinates list have
         different lengths
     :raises DictionaryKeysValidationFailed: in case the data format dictionary is incorrect
@@ -489,10 +529,25 @@ def _build_uniform_regression_data_format(
     model["x_pts"] = x_pts
     model["y_pts"] = y_pts
     # Initialize the data generator
-    model["data_gen"] = model["data_gen"](**model)
+    if points is not None and "batch_data_gen" in model:
+        model["data_gen"] = model["batch_data_gen"](points=points, **model)
+    else:
+        model["data_gen"] = model["data_gen"](**model)
     return model
 
 
+# Keys of the computed models, that are used in the output data and by the derived models
+_RESULT_KEYS: tuple[str, ...] = (
+    "model",
+    "coeffs",
+    "r_square",
+    "x_start",
+    "x_end",
+    "y_sum",
+    "pts_num",
+    "tss",
+)
+
 # supported methods mapping
 # - every method must be called with proper argument signature in 'compute' function
 # -- the signature: x, y, models, **kwargs
@@ -157,6 +157,9 @@ def filter_derived(regression_models_keys: tuple[str]) -> tuple[tuple[str], tupl
 # - f_a: function that modifies b0 (a) coefficient in model computation according to formulae
 # - f_b: function that modifies b1 (b) coefficient in model computation according to formulae
 # - data_gen: function that generates intermediate values from points for model computation
+# - batch_data_gen: vectorised version of data_gen used by the full computation
+# - t_x: name of the vectorised transformation of x values (see tools.TRANSFORMATIONS)
+# - t_y: name of the vectorised transformation of y values (see tools.TRANSFORMATIONS)
 # - computation: core function that controls the model computation
 # - func_list: functions that are applied to the generated values
 # -------------------------------------------------------------------------------------
@@ -191,6 +194,9 @@ MODEL_MAP: dict[str, dict[str, Any]] = {
         "f_a": lambda a: a,
         "f_b": lambda b: b,
         "data_gen": generic.generic_regression_data,
+        "batch_data_gen": generic.generic_batch_regression_data,
+        "t_x": "identity",
+        "t_y": "identity",
         "computation": generic.generic_compute_regression,
         "func_list": [
             generic.generic_regression_coefficients,
@@ -212,6 +218,9 @@ MODEL_MAP: dict[str, dict[str, Any]] = {
         "f_a": lambda a: a,
         "f_b": lambda b: b,
         "data_gen": generic.generic_regression_data,
+        "batch_data_gen": generic.generic_batch_regression_data,
+        "t_x": "log",
+        "t_y": "identity",
         "computation": generic.generic_compute_regression,
         "func_list": [
             generic.generic_regression_coefficients,
@@ -231,6 +240,7 @@ MODEL_MAP: dict[str, dict[str, Any]] = {
     "quadratic": {
         "model": "quadratic",
         "data_gen": specific.specific_quad_data,
+        "batch_data_gen": specific.specific_quad_batch_data,
         "computation": generic.generic_compute_regression,
         "func_list": [
             specific.specific_quad_coefficients,
@@ -252,6 +262,9 @@ MODEL_MAP: dict[str, dict[str, Any]] = {
         "f_a": lambda a: 10**a,
         "f_b": lambda b: b,
         "data_gen": generic.generic_regression_data,
+        "batch_data_gen": generic.generic_batch_regression_data,
+        "t_x": "log10",
+        "t_y": "log10",
         "computation": generic.generic_compute_regression,
         "func_list": [
             generic.generic_regression_coefficients,
@@ -273,6 +286,9 @@ MODEL_MAP: dict[str, dict[str, Any]] = {
         "f_a": lambda a: 10**a,
         "f_b": lambda b: 10**b,
         "data_gen": generic.generic_regression_data,
+        "batch_data_gen": generic.generic_batch_regression_data,
+        "t_x": "identity",
+        "t_y": "log10",
         "computation": generic.generic_compute_regression,
         "func_list": [
             generic.generic_regression_coefficients,
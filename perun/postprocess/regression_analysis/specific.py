@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import Any, Iterable
 
 # Third-Party Imports
+import numpy as np
 
 # Perun Imports
 from perun.postprocess.regression_analysis import tools
@@ -80,6 +81,33 @@ def specific_quad_data(
         yield data
 
 
+def specific_quad_batch_data(points: tools.TransformedPoints, **_: Any) -> Iterable[dict[str, Any]]:
+    """The vectorised version of the quadratic data generator.
+
+    Produces the same data dictionary as :func:`specific_quad_data` in a single step, with the
+    sums computed by NumPy.
+
+    :param TransformedPoints points: the regression points
+    :raises TypeError: if the required function arguments are not in the unpacked dictionary input
+    :returns iterable: generator object which produces the results in a data dictionary
+    """
+    x, y = points.x, points.y
+    x_sq = x * x
+    yield {
+        "x_sum": float(x.sum()),
+        "y_sum": float(y.sum()),
+        "xy_sum": float(np.dot(x, y)),
+        "x_sq_sum": float(x_sq.sum()),
+        "y_sq_sum": float(np.dot(y, y)),
+        "x_cube_sum": float(np.dot(x_sq, x)),
+        "x4_sum": float(np.dot(x_sq, x_sq)),
+        "x_sq_y_sum": float(np.dot(x_sq, y)),
+        "pts_num": len(x),
+        "x_start": points.x_pts[int(np.argmin(x))],
+        "x_end": points.x_pts[int(np.argmax(x))],
+    }
+
+
 def specific_quad_coefficients(
     x_sum: float,
     y_sum: float,
@@ -5,14 +5,16 @@ from __future__ import annotations
 
 # Standard Imports
 from operator import itemgetter
-from typing import Any, Iterable, TYPE_CHECKING
+from typing import Any, Callable, Iterable, Iterator, Optional, TYPE_CHECKING
 import random
 
 # Third-Party Imports
 import numpy as np
 
 # Perun Imports
-from perun.utils import exceptions
+from perun.logic import config
+from perun.utils import exceptions, log
+from perun.utils.common import common_kit
 
 if TYPE_CHECKING:
     import numpy.typing as npt
@@ -25,6 +27,85 @@ MIN_POINTS_COUNT: int = 3
 R_SQUARE_DEFAULT: float = 0.0
 # Zero approximation to avoid zero division etc.
 APPROX_ZERO: float = 0.000001
+# Each worker computing the models of uids gets roughly this number of chunks (to balance them)
+CHUNKS_PER_JOB: int = 4
+# Function computing the models of single uid and its additional arguments, set in each worker
+_WORKER_TASK: tuple[Callable[..., Any], tuple[Any, ...]] = (lambda *_: None, ())
+
+
+class TransformedPoints:
+    """Regression points converted to NumPy arrays with cached transformations of coordinates
+
+    The coordinates are transformed only once per transformation (e.g. log10 of x values) and
+    shared by all the regression models that use the transformation. The points, for which the
+    transformation is not defined (e.g. log10 of non-positive values), are masked out.
+
+    :ivar list x_pts: the original list of x points coordinates
+    :ivar list y_pts: the original list of y points coordinates
+    :ivar ndarray x: the x points coordinates
+    :ivar ndarray y: the y points coordinates
+    """
+
+    __slots__ = ["x_pts", "y_pts", "x", "y", "_transformed"]
+
+    def __init__(self, x_pts: list[float], y_pts: list[float]) -> None:
+        """Converts the points to the NumPy arrays
+
+        :param list x_pts: the list of x points coordinates
+        :param list y_pts: the list of y points coordinates
+        """
+        self.x_pts: list[float] = x_pts
+        self.y_pts: list[float] = y_pts
+        self.x: npt.NDArray[np.float64] = np.asarray(x_pts, dtype=np.float64)
+        self.y: npt.NDArray[np.float64] = np.asarray(y_pts, dtype=np.float64)
+        self._transformed: dict[
+            tuple[str, str], tuple[npt.NDArray[np.float64], Optional[npt.NDArray[np.bool_]]]
+        ] = {}
+
+    def transform(
+        self, axis: str, transformation: str
+    ) -> tuple[npt.NDArray[np.float64], Optional[npt.NDArray[np.bool_]]]:
+        """Transforms the coordinates of the given axis
+
+        :param str axis: either 'x' or 'y'
+        :param str transformation: name of the transformation from :data:`TRANSFORMATIONS`
+        :returns tuple: transformed coordinates and the mask of points, for which the
+            transformation is defined (None if it is defined for all points)
+        """
+        key = (axis, transformation)
+        if key not in self._transformed:
+            values = self.x if axis == "x" else self.y
+            func, domain = TRANSFORMATIONS[transformation]
+            valid = domain(values) if domain is not None else None
+            if valid is not None and valid.all():
+                valid = None
+            if valid is not None:
+                values = np.where(valid, values, 1.0)
+            self._transformed[key] = (func(values), valid)
+        return self._transformed[key]
+
+
+def _positive(values: npt.NDArray[np.float64]) -> npt.NDArray[np.bool_]:
+    """Returns the mask of positive values
+
+    :param ndarray values: the checked values
+    :returns ndarray: mask of positive values
+    """
+    return values > 0
+
+
+# Transformations of the coordinates used by the regression models, with their domain check
+TRANSFORMATIONS: dict[
+    str,
+    tuple[
+        Callable[[npt.NDArray[np.float64]], npt.NDArray[np.float64]],
+        Optional[Callable[[npt.NDArray[np.float64]], npt.NDArray[np.bool_]]],
+    ],
+] = {
+    "identity": (lambda values: values, None),
+    "log": (np.log, _positive),
+    "log10": (np.log10, _positive),
+}
 
 
 def validate_dictionary_keys(
@@ -172,3 +253,98 @@ def add_models_to_profile(
     else:
         profile["models"].extend(models)
     return profile
+
+
+def get_number_of_jobs() -> int:
+    """Returns the number of worker processes used for computing the models of uids
+
+    The postprocessors can be run also from the removed working directory (e.g. as a library),
+    in which case the local configuration cannot be located and only the runtime one is used.
+
+    :return: number of jobs, by default 1 (i.e. the uids are computed sequentially)
+    """
+    try:
+        return max(int(config.lookup_key_recursively("postprocess.jobs", "1")), 1)
+    except OSError as os_error:
+        log.warn(f"could not look up 'postprocess.jobs' in local configuration: {os_error}")
+        return max(int(config.runtime().safe_get("postprocess.jobs", "1")), 1)
+
+
+def split_uids_into_chunks(
+    data_gen: Iterable[tuple[list[float], list[float], str]], jobs: int
+) -> list[list[tuple[list[float], list[float], str]]]:
+    """Splits the points of uids into chunks with roughly the same number of points
+
+    The uids are never split between two chunks and their order is kept.
+
+    :param iter data_gen: the generator of x points, y points and uid
+    :param int jobs: number of worker processes, that will compute the chunks
+    :return: list of chunks of points of uids
+    """
+    uids = list(data_gen)
+    chunk_points = sum(len(x_pts) for x_pts, _, _ in uids) // (jobs * CHUNKS_PER_JOB)
+    chunks: list[list[tuple[list[float], list[float], str]]] = []
+    points = chunk_points
+    for uid_points in uids:
+        if points >= chunk_points:
+            chunks.append([])
+            points = 0
+        chunks[-1].append(uid_points)
+        points += len(uid_points[0])
+    return chunks
+
+
+def initialize_uid_worker(func: Callable[..., Any], args: tuple[Any, ...]) -> None:
+    """Sets the computed function and its arguments in the worker process
+
+    The arguments (e.g. the configuration of postprocessor) are passed only once per worker,
+    instead of with each chunk.
+
+    :param function func: function computing the models of single uid
+    :param tuple args: additional arguments of the function
+    """
+    global _WORKER_TASK
+    _WORKER_TASK = (func, args)
+
+
+def compute_uid_chunk(chunk: list[tuple[list[float], list[float], str]]) -> list[Any]:
+    """Computes the models of uids in the chunk in the worker process
+
+    :param list chunk: the points of uids
+    :return: list of results of the computed function for each uid
+    """
+    func, args = _WORKER_TASK
+    return [func(x_pts, y_pts, uid, *args) for x_pts, y_pts, uid in chunk]
+
+
+def compute_per_uid(
+    func: Callable[..., Any],
+    data_gen: Iterable[tuple[list[float], list[float], str]],
+    *args: Any,
+) -> Iterator[Any]:
+    """Computes the function for each uid, possibly in the pool of worker processes
+
+    This is the shared layer of postprocessors, that compute the models of each uid separately.
+    The points of uids are split into chunks (see :func:`split_uids_into_chunks`), which are
+    computed by :ckey:`postprocess.jobs` worker processes. The function is called as
+    ``func(x_pts, y_pts, uid, *args)``; it has to be defined on the top level of module and its
+    results have to be picklable. The results are yielded in the order of uids regardless of the
+    number of jobs (see :func:`get_number_of_jobs`).
+
+    :param function func: function computing the models of single uid
+    :param iter data_gen: the generator of x points, y points and uid (data provider generator)
+    :param args: additional arguments of the function
+    :return: iterator of the results of the function for each uid
+    """
+    jobs = get_number_of_jobs()
+    if jobs > 1:
+        chunks = split_uids_into_chunks(data_gen, jobs)
+        jobs = min(jobs, len(chunks))
+        if jobs > 1:
+            with common_kit.worker_pool(jobs, initialize_uid_worker, (func, args)) as pool_map:
+                for results in pool_map(compute_uid_chunk, chunks):
+                    yield from results
+            return
+        data_gen = (uid_points for chunk in chunks for uid_points in chunk)
+    for x_pts, y_pts, uid in data_gen:
+        yield func(x_pts, y_pts, uid, *args)
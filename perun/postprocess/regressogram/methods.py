@@ -4,7 +4,8 @@ Module with regressogram computational method and auxiliary methods at executing
 from __future__ import annotations
 
 # Standard Imports
-from typing import Iterator, Any
+from typing import Callable, Iterator, Any, TYPE_CHECKING
+import functools
 import inspect
 
 # Third-Party Imports
@@ -16,6 +17,9 @@ import sklearn.metrics
 # Perun Imports
 from perun.postprocess.regression_analysis import tools
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
 # required arguments at regressogram post-processor
 _REQUIRED_KEYS = ["bucket_method", "statistic_function"]
 
@@ -39,11 +43,16 @@ def get_supported_selectors() -> list[str]:
 
 
 def compute_regressogram(
-    data_gen: Iterator[tuple[list[float], list[float], str]], config: dict[str, Any]
+    data_gen: Iterator[tuple[list[float] | npt.NDArray[Any], list[float] | npt.NDArray[Any], str]],
+    config: dict[str, Any],
 ) -> list[dict[str, Any]]:
     """
     The regressogram wrapper to execute the analysis on the individual chunks of resources.
 
+    The points of all uids are concatenated into single arrays and the regressograms of all uids
+    are computed at once by :func:`batched_regressogram`, which yields the same models as
+    :func:`regressogram` computed for each uid separately.
+
     :param iter data_gen: the generator object with collected data (data provider generators)
     :param dict config: the perun and option context
     :return: list of dict: the computation results
@@ -51,14 +60,27 @@ def compute_regressogram(
     # checking the presence of specific keys in individual methods
     tools.validate_dictionary_keys(config, _REQUIRED_KEYS, [])
 
-    # list of result of the analysis
-    analysis = []
+    uids, x_parts, y_parts = [], [], []
     for x_pts, y_pts, uid in data_gen:
-        # Check whether the user gives as own number of buckets or select the method to its estimate
-        buckets = (
-            config["bucket_number"] if config.get("bucket_number") else config["bucket_method"]
-        )
-        result = regressogram(x_pts, y_pts, config["statistic_function"], buckets)
+        # The uids without points have no regressogram (binned_statistic fails on them as well)
+        if len(x_pts):
+            uids.append(uid)
+            x_parts.append(np.asarray(x_pts))
+            y_parts.append(np.asarray(y_pts))
+    if not uids:
+        return []
+
+    # Check whether the user gives as own number of buckets or select the method to its estimate
+    buckets = config["bucket_number"] if config.get("bucket_number") else config["bucket_method"]
+    offsets = np.concatenate(([0], np.cumsum([len(x_part) for x_part in x_parts])))
+    results = batched_regressogram(
+        np.concatenate(x_parts),
+        np.concatenate(y_parts),
+        offsets,
+        config["statistic_function"],
+        buckets,
+    )
+    for uid, result in zip(uids, results):
         result.update(
             {
                 "uid": uid,
@@ -67,9 +89,7 @@ def compute_regressogram(
                 "of_key": config["of_key"],
             }
         )
-        # add partial result to the result list - create output dictionaries
-        analysis.append(result)
-    return analysis
+    return results
 
 
 def regressogram(
@@ -96,21 +116,9 @@ def regressogram(
     :param str/int buckets: the number of buckets to calculate or the name of computational method
     :return dict: the output dictionary with result of analysis
     """
-    # Check whether the buckets is given by number or by name of method to its compute
-    if isinstance(buckets, int):
-        buckets_num = buckets
-    else:
-        if len(inspect.signature(_BUCKET_SELECTORS[buckets]).parameters):
-            # This is workaround for backward compatibility between numpy 1.15.1 and 1.16.X+
-            # In that version, new bucket selector method is introduced that requires additional,
-            # parameter, however, our supported methods do not use this parameter at all.
-            buckets_num = _BUCKET_SELECTORS[buckets](np.array(x_pts), None)
-        else:
-            buckets_num = _BUCKET_SELECTORS[buckets](np.array(x_pts))
-
     # Compute a binned statistic for the given data
     bucket_stats, bucket_edges, bucket_numbers = scipy.stats.binned_statistic(
-        x_pts, y_pts, statistic_function, max(1, buckets_num)
+        x_pts, y_pts, statistic_function, max(1, get_buckets_number(np.array(x_pts), buckets))
     )
     # Replace the NaN in empty buckets with 0 for plotting
     bucket_stats = np.nan_to_num(bucket_stats)
@@ -128,6 +136,126 @@ def regressogram(
     }
 
 
+def get_buckets_number(x_pts: npt.NDArray[Any], buckets: str | int) -> float:
+    """Returns the number of buckets given by the user or estimated by the bucket selector
+
+    :param ndarray x_pts: the array of x points coordinates
+    :param str/int buckets: the number of buckets or the name of computational method
+    :return: the number of buckets (the bucket selectors may return a non-integral number)
+    """
+    # Check whether the buckets is given by number or by name of method to its compute
+    if isinstance(buckets, int):
+        return buckets
+    if _requires_range(_BUCKET_SELECTORS[buckets]):
+        # This is workaround for backward compatibility between numpy 1.15.1 and 1.16.X+
+        # In that version, new bucket selector method is introduced that requires additional,
+        # parameter, however, our supported methods do not use this parameter at all.
+        return _BUCKET_SELECTORS[buckets](x_pts, None)
+    return _BUCKET_SELECTORS[buckets](x_pts)
+
+
+@functools.lru_cache(maxsize=None)
+def _requires_range(selector: Callable[..., float]) -> bool:
+    """Checks whether the bucket selector requires the range parameter
+
+    :param function selector: the numpy bucket selector
+    :return: true if the selector has the range parameter
+    """
+    return len(inspect.signature(selector).parameters) > 1
+
+
+def batched_regressogram(
+    x_pts: npt.NDArray[Any],
+    y_pts: npt.NDArray[Any],
+    offsets: npt.NDArray[np.int_],
+    statistic_function: str,
+    buckets: str | int,
+) -> list[dict[str, Any]]:
+    """
+    Compute the regressograms of several groups of points at once.
+
+    The points of the i-th group are ``x_pts[offsets[i]:offsets[i + 1]]``. Only the edges of
+    buckets are computed for each group separately, exactly as by :func:`regressogram`. The
+    points are assigned to the buckets of their group by binary search within the group, and
+    the statistics of all buckets of all groups are computed by single :func:`numpy.bincount`
+    (mean) or single sort of the values (median), the same way as in ``binned_statistic``.
+
+    :param ndarray x_pts: the concatenated x points coordinates of all groups
+    :param ndarray y_pts: the concatenated y points coordinates of all groups
+    :param ndarray offsets: the starts of the groups followed by the number of all points
+    :param str statistic_function: the statistic_function to compute
+    :param str/int buckets: the number of buckets to calculate or the name of computational method
+    :return list: the output dictionaries with result of analysis of each group
+    """
+    x_pts = np.asarray(x_pts, dtype=float)
+    values = np.asarray(y_pts, dtype=float)
+    sizes = np.diff(offsets)
+    groups = np.repeat(np.arange(len(sizes)), sizes)
+
+    # The edges of the buckets of each group: binned_statistic truncates the estimated number of
+    # buckets and widens the range of the same x points to have buckets of a finite width. Each
+    # point follows the edges lower or equal to it (as in numpy.digitize), while the points on the
+    # last edge belong to the last bucket.
+    edges_parts = []
+    bucket_numbers = np.empty(len(x_pts), dtype=int)
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        group_x = x_pts[start:end]
+        buckets_number = int(max(1, get_buckets_number(group_x, buckets)) + 2) - 2
+        x_min, x_max = group_x.min(), group_x.max()
+        if x_min == x_max:
+            x_min, x_max = x_min - 0.5, x_max + 0.5
+        edges_parts.append(np.linspace(x_min, x_max, buckets_number + 1))
+        bucket_numbers[start:end] = np.searchsorted(edges_parts[-1], group_x, side="right")
+    buckets_counts = np.array([len(edges) - 1 for edges in edges_parts])
+    edges = np.concatenate(edges_parts)
+    edges_offsets = np.concatenate(([0], np.cumsum(buckets_counts + 1)))
+    bucket_numbers = np.minimum(bucket_numbers, buckets_counts[groups])
+
+    # The buckets of all groups are numbered consecutively
+    buckets_offsets = np.concatenate(([0], np.cumsum(buckets_counts)))
+    bucket_ids = buckets_offsets[groups] + bucket_numbers - 1
+    bucket_stats = np.full(buckets_offsets[-1], np.nan)
+    counts = np.bincount(bucket_ids, minlength=len(bucket_stats))
+    nonempty = counts.nonzero()
+    if statistic_function == "median":
+        order = np.lexsort((values, bucket_ids))
+        starts = np.concatenate(([0], np.cumsum(counts)))[:-1][nonempty]
+        middles = starts + (counts[nonempty] - 1) / 2
+        bucket_stats[nonempty] = (
+            values[order][np.floor(middles).astype(int)]
+            + values[order][np.ceil(middles).astype(int)]
+        ) / 2
+    else:
+        sums = np.bincount(bucket_ids, values, minlength=len(bucket_stats))
+        bucket_stats[nonempty] = sums[nonempty] / counts[nonempty]
+    # Replace the NaN in empty buckets with 0 for plotting
+    bucket_stats = np.nan_to_num(bucket_stats)
+
+    # The coefficient of determination of each group, with the special cases as in sklearn
+    residuals = np.bincount(groups, (values - bucket_stats[bucket_ids]) ** 2)
+    means = np.bincount(groups, values) / sizes
+    deviations = np.bincount(groups, (values - means[groups]) ** 2)
+    computed = (residuals != 0) & (deviations != 0)
+    r_squares = np.ones(len(sizes))
+    r_squares[computed] = 1 - residuals[computed] / deviations[computed]
+    r_squares[(residuals != 0) & (deviations == 0)] = 0.0
+    r_squares[sizes < 2] = np.nan
+
+    y_starts = np.minimum.reduceat(np.asarray(y_pts), offsets[:-1])
+    return [
+        {
+            "buckets_method": "user" if isinstance(buckets, int) else buckets,
+            "statistic_function": statistic_function,
+            "bucket_stats": bucket_stats[buckets_offsets[i] : buckets_offsets[i + 1]].tolist(),
+            "x_start": edges[edges_offsets[i]],
+            "x_end": edges[edges_offsets[i + 1] - 1],
+            "y_start": y_starts[i].item(),
+            "r_square": float(r_squares[i]),
+        }
+        for i in range(len(sizes))
+    ]
+
+
 # Code for calculating number of buckets for regressogram can be got from SciPy:
 # https://docs.scipy.org/doc/numpy/reference/generated/numpy.histogram_bin_edges.html#numpy.histogram_bucket_edges
 
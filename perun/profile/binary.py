@@ -0,0 +1,283 @@
+"""``perun.profile.binary`` is a module which specifies the compact binary format of profiles
+stored as objects in the ``.perun/objects`` directory.
+
+Contrary to the JSON objects (i.e. the packed ``profile <type> <size>\\0`` header followed by the
+JSON of the profile), the binary objects store the resources in columns, that are decoded
+directly to the lists of values, instead of parsing the JSON of every value. The object has the
+following layout::
+
+    magic (4B) | version (2B) | reserved (2B) | size of metadata (4B) | metadata | blocks
+
+The metadata is packed JSON containing the profile without its resources (i.e. header, models,
+resource type map, etc.) and the table of blocks. The blocks follow the metadata and each of
+them is packed independently: the first block contains the dictionary of strings, while the
+rest of the blocks contain the collectable columns of single resource type. Columns of integers,
+floats and booleans are stored as little endian NumPy arrays (integers in the narrowest type that
+fits), columns of strings are stored as indexes to the dictionary of strings and other columns
+are stored as JSON. The bytes of the arrays are shuffled, so they are better compressed.
+
+The objects are detected by the magic bytes (see :func:`is_binary_profile`), hence both the
+binary and JSON objects can be stored in the same repository.
+"""
+from __future__ import annotations
+
+# Standard Imports
+from typing import Any, BinaryIO, TYPE_CHECKING
+import functools
+import hashlib
+import json
+import struct
+import zlib
+
+# Third-Party Imports
+
+# Perun Imports
+from perun.profile.factory import Profile
+from perun.utils.common import common_kit
+from perun.utils.exceptions import IncorrectProfileFormatException
+
+if TYPE_CHECKING:
+    import numpy
+else:
+    # Only the commands that load or store the binary profiles pay for the import
+    numpy = common_kit.lazy_import("numpy")
+
+
+BINARY_MAGIC = b"PRFB"
+BINARY_VERSION = 1
+# Magic bytes, version, reserved and size of metadata
+BINARY_HEADER = struct.Struct("<4sHHI")
+# Mapping of types of collectable values to the types of NumPy arrays of the columns
+NUMERIC_ENCODINGS: dict[type, str] = {int: "<i8", float: "<f8", bool: "|b1"}
+INTEGER_ENCODINGS: list[str] = ["<i1", "<i2", "<i4", "<i8"]
+STRING_ENCODING = "<u4"
+
+
+def is_binary_profile(prefix: bytes) -> bool:
+    """Checks whether the prefix of stored object corresponds to binary profile
+
+    :param bytes prefix: first bytes of the object
+    :return: true if the object is binary profile
+    """
+    return prefix[: len(BINARY_MAGIC)] == BINARY_MAGIC
+
+
+def shuffle_bytes(column: numpy.ndarray[Any, Any]) -> bytes:
+    """Converts the column to bytes, where the bytes of the same significance are stored together
+
+    The shuffled bytes (e.g. the upper bytes of small integers, that are mostly zero) are much
+    better compressed than the bytes of the values stored one after another.
+
+    :param ndarray column: numeric column
+    :return: shuffled bytes of the column
+    """
+    return column.view(numpy.uint8).reshape(-1, column.dtype.itemsize).T.tobytes()
+
+
+def unshuffle_bytes(
+    block: bytes, dtype: numpy.dtype[Any], start: int, end: int
+) -> numpy.ndarray[Any, Any]:
+    """Converts the shuffled bytes (see :func:`shuffle_bytes`) back to the column
+
+    :param bytes block: unpacked block of resource type
+    :param dtype dtype: type of the values of the column
+    :param int start: start of the column in the block
+    :param int end: end of the column in the block
+    :return: numeric column
+    """
+    shuffled_bytes = numpy.frombuffer(block, dtype=numpy.uint8, count=end - start, offset=start)
+    return shuffled_bytes.reshape(dtype.itemsize, -1).T.copy().view(dtype).ravel()
+
+
+def encode_column(values: list[Any], strings: dict[str, int]) -> tuple[str, bytes]:
+    """Encodes the list of collectable values to bytes
+
+    The encoding keeps the exact types of the values, i.e. only the lists of values of the same
+    numeric type are stored in NumPy arrays.
+
+    :param list values: list of collectable values of one resource type
+    :param dict strings: dictionary of strings mapping strings to their indexes, the new strings
+        are registered in the dictionary
+    :return: pair of encoding of the column and its bytes
+    """
+    value_types = {type(value) for value in values}
+    if len(value_types) == 1:
+        value_type = value_types.pop()
+        if value_type in NUMERIC_ENCODINGS:
+            try:
+                column = numpy.array(values, dtype=NUMERIC_ENCODINGS[value_type])
+            except OverflowError:
+                pass
+            else:
+                if value_type == int and len(column):
+                    # Integers are stored in the narrowest type that fits all the values
+                    low, high = column.min(), column.max()
+                    column = column.astype(
+                        next(
+                            encoding
+                            for encoding in INTEGER_ENCODINGS
+                            if numpy.iinfo(encoding).min <= low
+                            and high <= numpy.iinfo(encoding).max
+                        )
+                    )
+                return column.dtype.str, shuffle_bytes(column)
+        elif value_type == str:
+            codes = [strings.setdefault(value, len(strings)) for value in values]
+            return STRING_ENCODING, shuffle_bytes(numpy.array(codes, dtype=STRING_ENCODING))
+    return "json", json.dumps(values).encode("utf-8")
+
+
+def decode_column(
+    block: bytes, encoding: str, start: int, end: int, strings: numpy.ndarray[Any, Any]
+) -> list[Any]:
+    """Decodes the list of collectable values from the block
+
+    :param bytes block: unpacked block of resource type
+    :param str encoding: encoding of the column (see :func:`encode_column`)
+    :param int start: start of the column in the block
+    :param int end: end of the column in the block
+    :param ndarray strings: dictionary of strings
+    :return: list of collectable values
+    """
+    if encoding == "json":
+        return json.loads(block[start:end].decode("utf-8"))
+    column = unshuffle_bytes(block, numpy.dtype(encoding), start, end)
+    if encoding == STRING_ENCODING:
+        return strings[column].tolist()
+    return column.tolist()
+
+
+def dump_profile(profile: Profile) -> tuple[str, bytes]:
+    """Dumps the profile to the binary object
+
+    The checksum of the object is computed from the unpacked contents of the object, so it does
+    not depend on the packing.
+
+    :param Profile profile: dumped profile
+    :return: pair of the checksum and the contents of the object
+    """
+    checksum = hashlib.sha1(BINARY_MAGIC + struct.pack("<H", BINARY_VERSION))
+    strings: dict[str, int] = {}
+    block_table: list[list[Any]] = []
+    packed_blocks: list[bytes] = []
+
+    for resource_type, resources in profile["resources"].items():
+        columns, raw_columns, start = [], [], 0
+        for key, values in resources.items():
+            encoding, raw_column = encode_column(values, strings)
+            columns.append([key, encoding, start, start + len(raw_column)])
+            raw_columns.append(raw_column)
+            start += len(raw_column)
+        raw_block = b"".join(raw_columns)
+        checksum.update(json.dumps([resource_type, columns]).encode("utf-8"))
+        checksum.update(raw_block)
+        block_table.append([resource_type, columns])
+        packed_blocks.append(zlib.compress(raw_block))
+
+    raw_strings = json.dumps(list(strings.keys())).encode("utf-8")
+    checksum.update(raw_strings)
+    packed_blocks.insert(0, zlib.compress(raw_strings))
+
+    stored_profile = {
+        key: value for key, value in profile.serialize().items() if key != "resources"
+    }
+    raw_profile = json.dumps(stored_profile).encode("utf-8")
+    checksum.update(raw_profile)
+
+    metadata = {
+        "profile": stored_profile,
+        "blocks": block_table,
+        "block_sizes": [len(packed_block) for packed_block in packed_blocks],
+    }
+    packed_metadata = zlib.compress(json.dumps(metadata).encode("utf-8"))
+    header = BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, len(packed_metadata))
+    return checksum.hexdigest(), b"".join([header, packed_metadata] + packed_blocks)
+
+
+def load_profile_from_handle(file_name: str, file_handle: BinaryIO, lazy: bool = False) -> Profile:
+    """Loads the profile from the opened binary object
+
+    The blocks are read and unpacked one by one, hence only the metadata and single block are
+    held in the memory (besides the loaded profile). If @p lazy is set, then the blocks are not
+    read at all, until the resources are accessed for the first time (see
+    :func:`load_resources_from_file`).
+
+    :param str file_name: name of the file opened in the handle
+    :param file file_handle: opened file handle, positioned at the start of the object
+    :param bool lazy: if set to true, then the resources are loaded on their first access
+    :return: loaded profile
+    :raises IncorrectProfileFormatException: when the object is malformed or of unsupported version
+    """
+    try:
+        magic, version, _, metadata_size = BINARY_HEADER.unpack(
+            file_handle.read(BINARY_HEADER.size)
+        )
+        if magic != BINARY_MAGIC or version > BINARY_VERSION:
+            raise IncorrectProfileFormatException(file_name, "unsupported binary profile '{}'")
+        metadata = json.loads(zlib.decompress(file_handle.read(metadata_size)).decode("utf-8"))
+        stored_profile, block_sizes = metadata["profile"], metadata["block_sizes"]
+        if stored_profile["header"]["type"] not in common_kit.SUPPORTED_PROFILE_TYPES:
+            raise IncorrectProfileFormatException(file_name, "malformed profile '{}'")
+
+        profile = Profile()
+        for key, value in stored_profile.items():
+            profile[key] = value
+        if lazy:
+            profile.add_lazy_section(
+                "resources",
+                functools.partial(
+                    load_resources_from_file,
+                    file_name,
+                    file_handle.tell(),
+                    metadata["blocks"],
+                    block_sizes,
+                ),
+            )
+        else:
+            profile["resources"] = load_resources(file_handle, metadata["blocks"], block_sizes)
+        return profile
+    except (struct.error, zlib.error, ValueError, KeyError, IndexError, TypeError):
+        raise IncorrectProfileFormatException(file_name, "malformed profile '{}'")
+
+
+def load_resources(
+    file_handle: BinaryIO, block_table: list[list[Any]], block_sizes: list[int]
+) -> dict[str, dict[str, list[Any]]]:
+    """Loads the resources from the blocks of the binary object
+
+    :param file file_handle: opened file handle, positioned at the start of the blocks
+    :param list block_table: table of blocks with the columns of resource types
+    :param list block_sizes: sizes of the packed blocks (the first one is the dictionary of strings)
+    :return: resources of the profile
+    """
+    raw_strings = zlib.decompress(file_handle.read(block_sizes[0]))
+    strings = numpy.array(json.loads(raw_strings.decode("utf-8")), dtype=object)
+
+    resources = {}
+    for (resource_type, columns), block_size in zip(block_table, block_sizes[1:]):
+        block = zlib.decompress(file_handle.read(block_size))
+        resources[resource_type] = {
+            key: decode_column(block, encoding, start, end, strings)
+            for key, encoding, start, end in columns
+        }
+    return resources
+
+
+def load_resources_from_file(
+    file_name: str, offset: int, block_table: list[list[Any]], block_sizes: list[int]
+) -> dict[str, dict[str, list[Any]]]:
+    """Loads the resources from the blocks of the binary object stored in the file
+
+    :param str file_name: name of the binary object
+    :param int offset: offset of the blocks in the object
+    :param list block_table: table of blocks with the columns of resource types
+    :param list block_sizes: sizes of the packed blocks (the first one is the dictionary of strings)
+    :return: resources of the profile
+    :raises IncorrectProfileFormatException: when the blocks are malformed
+    """
+    try:
+        with open(file_name, "rb") as file_handle:
+            file_handle.seek(offset)
+            return load_resources(file_handle, block_table, block_sizes)
+    except (OSError, zlib.error, ValueError, KeyError, IndexError, TypeError):
+        raise IncorrectProfileFormatException(file_name, "malformed profile '{}'")
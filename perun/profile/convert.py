@@ -15,21 +15,79 @@ complex queries and statistical tests over the profiles.
 from __future__ import annotations
 
 # Standard Imports
-from typing import TYPE_CHECKING, Any
-import array
+from typing import TYPE_CHECKING, Any, Union
+import dataclasses
 import operator
 
 # Third-Party Imports
-import numpy
-import pandas
 
 # Perun Imports
-from perun.postprocess.regression_analysis import transform
 from perun.profile import query
 from perun.utils.common import common_kit
 
 if TYPE_CHECKING:
+    import numpy
+    import numpy.typing as npt
+    import pandas
+
     from perun.profile.factory import Profile
+else:
+    # The profiles are converted by few commands only, hence the heavy modules are lazy
+    numpy = common_kit.lazy_import("numpy")
+    pandas = common_kit.lazy_import("pandas")
+
+
+@dataclasses.dataclass(frozen=True)
+class DictionaryColumn:
+    """Dictionary encoded column of (mostly repeating) strings
+
+    :ivar ndarray codes: indexes of the values within the categories
+    :ivar ndarray categories: sorted unique values of the column
+    """
+
+    codes: npt.NDArray[numpy.intp]
+    categories: npt.NDArray[Any]
+
+    def __len__(self) -> int:
+        """Returns number of values in the column
+
+        :return: number of values
+        """
+        return len(self.codes)
+
+    def decode(self) -> npt.NDArray[Any]:
+        """Decodes the column to array of the original values
+
+        :return: array of decoded values
+        """
+        return self.categories[self.codes]
+
+
+Column = Union["npt.NDArray[Any]", DictionaryColumn]
+
+
+def values_to_column(values: list[Any]) -> Column:
+    """Converts the list of collectable values to typed column
+
+    Numeric values are converted to numeric NumPy array, strings are dictionary encoded and
+    the rest (e.g. mixed or nested values) is stored in array of objects.
+
+    :param list values: list of collectable values of one resource type
+    :return: typed column of values
+    """
+    try:
+        column = numpy.asarray(values)
+    except (ValueError, OverflowError):
+        column = numpy.empty(0)
+    else:
+        if column.dtype.kind in "biuf" and column.ndim == 1:
+            return column
+        if column.dtype.kind == "U" and all(isinstance(value, str) for value in values):
+            categories, codes = numpy.unique(column, return_inverse=True)
+            return DictionaryColumn(codes, categories.astype(object))
+    column = numpy.empty(len(values), dtype=object)
+    column[:] = values
+    return column
 
 
 def resources_to_pandas_dataframe(profile: Profile) -> pandas.DataFrame:
@@ -59,24 +117,74 @@ def resources_to_pandas_dataframe(profile: Profile) -> pandas.DataFrame:
         0  main:../memo...:22         main        22   ../memory_collect_test.c
         1  main:../memo...:27         main        27   ../memory_collect_test.c
 
+    The resulting dataframe is built directly from the columns of the resource types (see
+    :meth:`perun.profile.factory.Profile.resource_columns`) and is cached within the profile
+    until its resources are modified; each call returns a fresh copy of the cached dataframe.
+
     :param Profile profile: dictionary with profile w.r.t. :ref:`profile-spec`
     :returns: converted profile to ``pandas.DataFramelist`` with resources
         flattened as a pandas dataframe
     """
-    # Since some keys may be missing in the resources, we consider the possible fields
-    resource_keys = list(profile.all_resource_fields())
-    values: dict[str, list[Any] | array.array[float] | array.array[int]] = {
-        key: [] for key in resource_keys
+    dataframe = profile.cached_conversion("resources", _build_resources_dataframe)
+    return dataframe.copy()
+
+
+def _build_resources_dataframe(profile: Profile) -> pandas.DataFrame:
+    """Builds the dataframe of resources from the columns of the resource types
+
+    For each resource type, the collectable columns are taken as they are, while the persistent
+    properties are repeated for each resource of the type; fields missing in the resource type
+    are filled with ``NaN``. The parts of all resource types are then concatenated.
+
+    :param Profile profile: dictionary with profile w.r.t. :ref:`profile-spec`
+    :return: resources flattened as a pandas dataframe
+    """
+    parts: dict[str, list[npt.NDArray[Any]]] = {}
+    snapshots: list[npt.NDArray[Any]] = []
+    rows = 0
+
+    for _, persistent_properties, columns in profile.resource_columns(True):
+        # Types without collectable values still contribute one resource of persistent values
+        size = min((len(column) for column in columns.values()), default=1)
+        type_columns = {
+            key: column.decode()[:size] if isinstance(column, DictionaryColumn) else column[:size]
+            for key, column in columns.items()
+        }
+        type_columns.update(
+            {key: repeat_value(value, size) for key, value in persistent_properties.items()}
+        )
+        snapshots.append(type_columns.get("snapshot", numpy.zeros(size, dtype=numpy.int64)))
+
+        for key in type_columns.keys() - parts.keys():
+            # Fields that were missing in the previous resource types
+            parts[key] = [numpy.full(rows, numpy.nan)] if rows else []
+        for key, key_parts in parts.items():
+            key_parts.append(type_columns.get(key, numpy.full(size, numpy.nan)))
+        rows += size
+
+    values: dict[str, npt.NDArray[Any]] = {
+        key: numpy.concatenate(key_parts) for key, key_parts in parts.items()
     }
-    values["snapshots"] = array.array("I")
+    values["snapshots"] = (
+        numpy.concatenate(snapshots).astype(numpy.int64)
+        if snapshots
+        else numpy.empty(0, dtype=numpy.int64)
+    )
+    return pandas.DataFrame(values, copy=False)
 
-    # All resources at this point should be flat
-    for snapshot, resource in profile.all_resources(True):
-        values["snapshots"].append(snapshot)
-        for resource_key in resource_keys:
-            values[resource_key].append(resource.get(resource_key, numpy.nan))
 
-    return pandas.DataFrame(values)
+def repeat_value(value: Any, size: int) -> npt.NDArray[Any]:
+    """Repeats the persistent value into the column of given size
+
+    :param object value: persistent value of the resource type
+    :param int size: number of resources of the resource type
+    :return: column with repeated value
+    """
+    if isinstance(value, (bool, int, float)):
+        return numpy.full(size, value)
+    column = numpy.empty(size, dtype=object)
+    column.fill(value)
+    return column
 
 
 def models_to_pandas_dataframe(profile: Profile) -> pandas.DataFrame:
@@ -165,6 +273,8 @@ def plot_data_from_coefficients_of(model: dict[str, Any]) -> dict[str, Any]:
     :returns dict: updated models dictionary extended with `plot_x` and
         `plot_y` lists
     """
+    from perun.postprocess.regression_analysis import transform
+
     model.update(transform.coefficients_to_points(**model))
     return model
 
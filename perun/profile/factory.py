@@ -9,7 +9,7 @@ from __future__ import annotations
 
 # Standard Imports
 from collections.abc import MutableMapping
-from typing import Any, Iterator, Iterable, TYPE_CHECKING
+from typing import Any, Callable, Iterator, Iterable, TYPE_CHECKING
 import collections
 import itertools
 import operator
@@ -19,28 +19,79 @@ import click
 
 # Perun Imports
 from perun.logic import config
-from perun.postprocess.regression_analysis import regression_models
 from perun.profile import convert, query
 from perun.utils import log
-import perun.check.detection_kit as detection
-import perun.postprocess.regressogram.methods as nparam_methods
 
 if TYPE_CHECKING:
     from perun.utils.structs import ModelRecord
 
 
+class ProfileStorage(dict[str, Any]):
+    """Internal storage of the profile, where some sections can be loaded lazily
+
+    The lazy sections are stored as :attr:`PENDING` placeholders (so the order of the sections is
+    kept), until they are accessed for the first time; then they are loaded by the registered
+    loader and stored as any other section.
+
+    :ivar dict lazy_sections: map of not yet loaded sections to the functions that load them
+    """
+
+    __slots__ = ["lazy_sections"]
+    PENDING: Any = object()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initializes the storage without any lazy sections
+
+        :param list args: positional arguments for dictionary
+        :param kwargs kwargs: keyword arguments for dictionary
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_sections: dict[str, Callable[[], Any]] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        """Returns the section of the storage, the lazy sections are loaded on their first access
+
+        :param str key: key of the accessed section
+        :return: (loaded) section
+        """
+        value = super().__getitem__(key)
+        if value is ProfileStorage.PENDING:
+            value = self.lazy_sections.pop(key)()
+            super().__setitem__(key, value)
+        return value
+
+    def materialize(self) -> None:
+        """Loads all the pending lazy sections"""
+        for key in list(self.lazy_sections):
+            self.__getitem__(key)
+
+    def __reduce__(self) -> tuple[type, tuple[dict[str, Any]]]:
+        """Reduces the storage with all the sections loaded, i.e. without any lazy sections
+
+        :return: reduced storage for pickle and copy
+        """
+        self.materialize()
+        return ProfileStorage, (dict(self),)
+
+
 class Profile(MutableMapping[str, Any]):
     """
-    :ivar dict _storage: internal storage of the profile
+    :ivar ProfileStorage _storage: internal storage of the profile
     :ivar dict _tuple_to_resource_type_map: map of tuple of persistent records of resources to
         unique identifier of those resources
     :ivar Counter _uid_counter: counter of how many resources type uid has
+    :ivar dict _resource_type_to_columns_map: cache of resources of resource types converted to
+        typed columns (see :meth:`resource_columns`)
+    :ivar dict _conversion_cache: cache of the results of conversions of the whole resources
+        (see :meth:`cached_conversion`)
     """
 
     __slots__ = [
         "_storage",
         "_tuple_to_resource_type_map",
         "_resource_type_to_flattened_resources_map",
+        "_resource_type_to_columns_map",
+        "_conversion_cache",
         "_uid_counter",
     ]
 
@@ -52,6 +103,7 @@ class Profile(MutableMapping[str, Any]):
         "address",
         "timestamp",
         "exclusive",
+        "repeat-amounts",
     }
     persistent = {"trace", "type", "subtype", "uid", "location"}
 
@@ -75,13 +127,17 @@ class Profile(MutableMapping[str, Any]):
         super().__init__()
         initialization_data = dict(*args, **kwargs)
         global_data = initialization_data.get("global", {"models": []})
-        self._storage = {
-            "resources": {},
-            "resource_type_map": {},
-            "models": global_data.get("models", []) if isinstance(global_data, dict) else [],
-        }
+        self._storage = ProfileStorage(
+            {
+                "resources": {},
+                "resource_type_map": {},
+                "models": global_data.get("models", []) if isinstance(global_data, dict) else [],
+            }
+        )
         self._tuple_to_resource_type_map: dict[str, str] = {}
         self._resource_type_to_flattened_resources_map: dict[str, dict[str, Any]] = {}
+        self._resource_type_to_columns_map: dict[str, tuple[int, dict[str, convert.Column]]] = {}
+        self._conversion_cache: dict[str, tuple[tuple[int, int], Any]] = {}
         self._uid_counter: collections.Counter[str] = collections.Counter()
 
         for key, value in initialization_data.items():
@@ -96,6 +152,7 @@ class Profile(MutableMapping[str, Any]):
         resource_list: Any,
         resource_type: str = "list",
         clear_existing_resources: bool = False,
+        first_snapshot: int = 0,
     ) -> None:
         """Given by @p resource_type updates the storage with new flattened resources
 
@@ -108,8 +165,11 @@ class Profile(MutableMapping[str, Any]):
             (then it is old type of profile) or it can be resource l
         :param bool clear_existing_resources: if set to true then the actual storage will be cleared
             before updating the resources
+        :param int first_snapshot: number of the first of the snapshots, used when the snapshots
+            are updated in several batches
         :return:
         """
+        self._clear_resource_caches()
         if clear_existing_resources:
             self._storage["resources"].clear()
         if resource_type == "global" and isinstance(resource_list, dict) and resource_list:
@@ -119,7 +179,7 @@ class Profile(MutableMapping[str, Any]):
             )
         elif resource_type == "snapshots":
             # Resources are in type of [{'time': _, 'resources': []}
-            for i, snapshot in enumerate(resource_list):
+            for i, snapshot in enumerate(resource_list, first_snapshot):
                 self._translate_resources(
                     snapshot["resources"],
                     {"snapshot": i, "time": snapshot.get("time", "0.0")},
@@ -141,17 +201,7 @@ class Profile(MutableMapping[str, Any]):
         :param resource_list: list of dictionaries, i.e. actual resources
         :param additional_params: additional information that are added to resources in the list
         """
-        ctx = config.runtime().safe_get("context.workload", {})
-        ctx_persistent_properties = [
-            (key, value) for (key, value) in ctx.items() if isinstance(value, str)
-        ]
-        ctx_collectable_properties = [
-            (key, value) for (key, value) in ctx.items() if not isinstance(value, str)
-        ]
-
-        # Update collectable and persistent keys (needed for merge)
-        Profile.persistent.update({key for key, val in ctx.items() if isinstance(val, str)})
-        Profile.collectable.update({key for key, val in ctx.items() if not isinstance(val, str)})
+        ctx_persistent_properties, ctx_collectable_properties = self._get_workload_properties()
 
         for resource in resource_list:
             persistent_properties = [
@@ -172,6 +222,59 @@ class Profile(MutableMapping[str, Any]):
             for key, value in collectable_properties:
                 self._storage["resources"][resource_type][key].append(value)
 
+    def update_resource_columns(
+        self,
+        persistent_properties: dict[str, Any],
+        collectable_columns: dict[str, list[Any]],
+        additional_params: dict[str, Any],
+    ) -> None:
+        """Updates the storage with resources of single resource type given by columns
+
+        Unlike :meth:`update_resources`, the resources are not translated one by one, instead
+        whole columns of collectable properties are appended to the storage at once.
+
+        :param persistent_properties: persistent properties shared by all the resources
+        :param collectable_columns: map of collectable properties to lists of their values
+        :param additional_params: additional information that are added to resources
+        """
+        self._clear_resource_caches()
+        ctx_persistent_properties, ctx_collectable_properties = self._get_workload_properties()
+
+        persistent = list(persistent_properties.items()) + ctx_persistent_properties
+        persistent.extend(list(additional_params.items()))
+        persistent.sort(key=operator.itemgetter(0))
+        resources_count = len(next(iter(collectable_columns.values()), []))
+        columns = dict(collectable_columns)
+        columns.update(
+            {key: [value] * resources_count for key, value in ctx_collectable_properties}
+        )
+
+        resource_type = self.register_resource_type(persistent_properties["uid"], tuple(persistent))
+        stored_columns = self._storage["resources"].setdefault(
+            resource_type, {key: [] for key in columns}
+        )
+        for key, values in columns.items():
+            stored_columns[key].extend(values)
+
+    @staticmethod
+    def _get_workload_properties() -> tuple[list[tuple[str, Any]], list[tuple[str, Any]]]:
+        """Splits the properties of the current workload context to persistent and collectable
+
+        :return: persistent and collectable properties of the workload context
+        """
+        ctx = config.runtime().safe_get("context.workload", {})
+        ctx_persistent_properties = [
+            (key, value) for (key, value) in ctx.items() if isinstance(value, str)
+        ]
+        ctx_collectable_properties = [
+            (key, value) for (key, value) in ctx.items() if not isinstance(value, str)
+        ]
+
+        # Update collectable and persistent keys (needed for merge)
+        Profile.persistent.update({key for key, val in ctx.items() if isinstance(val, str)})
+        Profile.collectable.update({key for key, val in ctx.items() if not isinstance(val, str)})
+        return ctx_persistent_properties, ctx_collectable_properties
+
     def register_resource_type(self, uid: str, persistent_properties: tuple[Any, ...]) -> str:
         """Registers tuple of persistent properties under new key or return existing one
 
@@ -212,6 +315,9 @@ class Profile(MutableMapping[str, Any]):
         :param object value:  object we are setting in the profile
         :return:
         """
+        if key == "resources":
+            self._clear_resource_caches()
+        self._storage.lazy_sections.pop(key, None)
         self._storage[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -219,6 +325,9 @@ class Profile(MutableMapping[str, Any]):
 
         :param str key: key to be deleted
         """
+        if key == "resources":
+            self._clear_resource_caches()
+        self._storage.lazy_sections.pop(key, None)
         del self._storage[key]
 
     def __iter__(self) -> Iterator[str]:
@@ -235,11 +344,37 @@ class Profile(MutableMapping[str, Any]):
         """
         return len(self._storage)
 
+    def __contains__(self, key: object) -> bool:
+        """Checks whether the key is in storage without loading the lazy sections
+
+        :param object key: checked key
+        :return: true if the key is in the storage
+        """
+        return key in self._storage
+
+    def add_lazy_section(self, key: str, loader: Callable[[], Any]) -> None:
+        """Registers the section of the profile, that is loaded on its first access
+
+        This is used by partial loading of profiles (see
+        :func:`perun.logic.store.load_profile_from_file`), where e.g. resources are not loaded,
+        unless they are really needed.
+
+        :param str key: key of the section
+        :param function loader: function that loads the value of the section
+        """
+        if key == "resources":
+            self._clear_resource_caches()
+        self._storage.lazy_sections[key] = loader
+        self._storage[key] = ProfileStorage.PENDING
+
     def serialize(self) -> dict[str, Any]:
         """Returns serializable representation of the profile
 
+        All the lazy sections are loaded before.
+
         :return: serializable representation (i.e. the actual storage)
         """
+        self._storage.materialize()
         return self._storage
 
     def _get_flattened_persistent_values_for(self, resource_type: str) -> dict[str, Any]:
@@ -313,6 +448,83 @@ class Profile(MutableMapping[str, Any]):
                 # In case we have only persistent properties
                 yield persistent_properties.get("snapshot", 0), persistent_properties
 
+    def resource_columns(
+        self, flatten_values: bool = False
+    ) -> Iterable[tuple[str, dict[str, Any], dict[str, convert.Column]]]:
+        """Generator for iterating through the resources grouped by resource types in columnar
+        format.
+
+        Contrary to :meth:`all_resources`, this does not construct a dictionary for every
+        resource. Instead, for each resource type it yields its persistent properties (shared by
+        all resources of the type) and its collectable properties converted to typed columns:
+        numeric values are stored in NumPy arrays and strings are dictionary encoded (see
+        :class:`perun.profile.convert.DictionaryColumn`).
+
+        The columns are computed once and cached until the resources of the profile are updated.
+
+        :param bool flatten_values: if set to true, then the persistent values will
+            be flattened to one level.
+        :returns: iterable stream of triples of resource type, its persistent properties and
+            dictionary of its collectable properties converted to columns
+        """
+        for resource_type, resources in self._storage["resources"].items():
+            if flatten_values:
+                persistent_properties = self._get_flattened_persistent_values_for(resource_type)
+            else:
+                persistent_properties = self._storage["resource_type_map"][resource_type]
+            yield resource_type, persistent_properties, self._get_columns_for(
+                resource_type, resources
+            )
+
+    def _get_columns_for(
+        self, resource_type: str, resources: dict[str, list[Any]]
+    ) -> dict[str, convert.Column]:
+        """Converts the collectable properties of the resource type to typed columns
+
+        The converted columns are cached; since the lists of resources can be modified directly,
+        the cache is also invalidated if the number of resources changes.
+
+        :param str resource_type: type of the resource
+        :param dict resources: collectable properties of the resource type
+        :return: map of collectable properties to their columns
+        """
+        resources_count = sum(len(values) for values in resources.values())
+        cached_count, columns = self._resource_type_to_columns_map.get(resource_type, (-1, {}))
+        if cached_count != resources_count:
+            columns = {key: convert.values_to_column(values) for key, values in resources.items()}
+            self._resource_type_to_columns_map[resource_type] = (resources_count, columns)
+        return columns
+
+    def cached_conversion(self, name: str, conversion: Callable[[Profile], Any]) -> Any:
+        """Returns the result of the conversion of the profile resources, cached under the name
+
+        The result is computed once and cached until the resources of the profile are updated
+        (or until the number of resources changes, since they can be modified directly). Note
+        that the cached result is shared, hence callers should not modify it.
+
+        :param str name: name under which the conversion is cached
+        :param function conversion: function converting the profile into other format
+        :return: result of the conversion
+        """
+        signature = (
+            len(self._storage["resources"]),
+            sum(
+                len(values)
+                for resources in self._storage["resources"].values()
+                for values in resources.values()
+            ),
+        )
+        cached_signature, converted = self._conversion_cache.get(name, ((-1, -1), None))
+        if cached_signature != signature:
+            converted = conversion(self)
+            self._conversion_cache[name] = (signature, converted)
+        return converted
+
+    def _clear_resource_caches(self) -> None:
+        """Clears all the caches computed from the resources of the profile"""
+        self._resource_type_to_columns_map.clear()
+        self._conversion_cache.clear()
+
     def all_resource_fields(self) -> set[str]:
         """Generator for iterating through all the fields (both flattened and
         original) that are occurring in the resources.
@@ -357,6 +569,9 @@ class Profile(MutableMapping[str, Any]):
         :param str models_strategy: name of detection models strategy to obtains relevant models
         :return ModelRecord: required models
         """
+        # The detection pulls in the heavy numerical modules, hence it is imported only when needed
+        import perun.check.detection_kit as detection
+
         group = models_strategy.rsplit("-")[1]
         if models_strategy in ("all-param", "all-nonparam"):
             return detection.get_filtered_best_models_of(self, group=group, model_filter=None)
@@ -395,6 +610,9 @@ class Profile(MutableMapping[str, Any]):
             record (for more details about models refer to :pkey:`models` or
             :ref:`postprocessors-regression-analysis`)
         """
+        from perun.postprocess.regression_analysis import regression_models
+        import perun.postprocess.regressogram.methods as nparam_methods
+
         for model_idx, model in enumerate(self._storage["models"]):
             if (
                 group == "model"
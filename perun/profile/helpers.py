@@ -244,14 +244,7 @@ def find_profile_entry(profile: str, minor_version: str) -> index.BasicIndexEntr
     # Search the minor index for the requested profile
     with open(minor_index, "rb") as index_handle:
         # The profile can be only sha value or source path now
-        if store.is_sha1(profile):
-            return index.lookup_entry_within_index(
-                index_handle, lambda x: x.checksum == profile, profile
-            )
-        else:
-            return index.lookup_entry_within_index(
-                index_handle, lambda x: x.path == profile, profile
-            )
+        return index.lookup_entry_by_checksum_or_path(index_handle, profile)
 
 
 def generate_units(collector: types.ModuleType) -> dict[str, str]:
@@ -14,6 +14,7 @@ import json
 import os
 import platform
 import re
+import subprocess
 import sys
 import time
 import traceback
@@ -49,6 +50,55 @@ def print_version(_: click.Context, __: click.Option, value: bool) -> None:
         exit(0)
 
 
+# Number of the slowest imported modules reported by the startup profile
+STARTUP_PROFILE_TOP = 20
+
+
+def parse_import_times(lines: list[str]) -> list[tuple[str, int, int]]:
+    """Parses the output of the ``-X importtime`` option of Python interpreter.
+
+    :param list lines: lines of the stderr of the interpreter
+    :return: list of triples (module, self time, cumulative time) with times in microseconds
+    """
+    import_times = []
+    for line in lines:
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative_time, module = line[len("import time:") :].split("|", maxsplit=2)
+        import_times.append((module.strip(), int(self_time), int(cumulative_time)))
+    return import_times
+
+
+def print_startup_profile(_: click.Context, __: click.Option, value: bool) -> None:
+    """Profiles the import time of the startup path of Perun and ends
+
+    The imports are measured in a fresh interpreter, since the current one has the modules
+    already loaded.
+
+    :param click.core.Context _: click context
+    :param click.core.Argument __: the click parameter
+    :param bool value: value of the parameter
+    """
+    if value:
+        startup = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import perun.cli"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        import_times = parse_import_times(startup.stderr.splitlines())
+        log.major_info("Startup Profile")
+        total_time = sum(self_time for (_, self_time, _) in import_times)
+        log.minor_status("total import time", status=log.highlight(f"{total_time / 1000:.1f} ms"))
+        log.minor_status("imported modules", status=log.highlight(str(len(import_times))))
+        log.newline()
+        slowest = sorted(import_times, key=lambda import_time: -import_time[2])
+        for module, self_time, cumulative_time in slowest[:STARTUP_PROFILE_TOP]:
+            log.write(f"{cumulative_time / 1000:>10.1f} ms {self_time / 1000:>10.1f} ms  {module}")
+        exit(startup.returncode)
+
+
 def process_bokeh_axis_title(
     ctx: click.Context, param: click.Option, value: Optional[str]
 ) -> Optional[str]:
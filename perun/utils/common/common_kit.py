@@ -2,20 +2,24 @@
 from __future__ import annotations
 
 # Standard Imports
-from typing import Optional, Any, Iterable, Callable, Literal, TYPE_CHECKING
+from typing import Optional, Any, Iterable, Iterator, Callable, Literal, TYPE_CHECKING
+import concurrent.futures
+import contextlib
 import functools
 import importlib
 import itertools
+import multiprocessing
 import operator
 import os
 import re
 import signal
+import sys
+import types
 
 # Third-Party Imports
 import click
 
 # Perun Imports
-from perun.postprocess.regression_analysis import tools
 from perun.utils.exceptions import (
     SignalReceivedException,
     NotPerunRepositoryException,
@@ -24,7 +28,6 @@ from perun.utils.exceptions import (
 
 if TYPE_CHECKING:
     import traceback
-    import types
 
 # Types
 ColorChoiceType = Literal[
@@ -334,6 +337,24 @@ def sanitize_filepart(part: str) -> str:
     return "".join("_" if c in invalid_characters else c for c in str(part))
 
 
+def strtobool(value: str) -> bool:
+    """Converts the string representation of truth to bool
+
+    The true values are 'y', 'yes', 't', 'true', 'on' and '1', the false values are 'n', 'no', 'f',
+    'false', 'off' and '0' (case-insensitive), as in the deprecated ``distutils.util.strtobool``.
+
+    :param str value: the string representation of truth
+    :raises ValueError: if the value does not represent truth
+    :return: the truth value
+    """
+    lowered = value.lower()
+    if lowered in ("y", "yes", "t", "true", "on", "1"):
+        return True
+    if lowered in ("n", "no", "f", "false", "off", "0"):
+        return False
+    raise ValueError(f"invalid truth value {value!r}")
+
+
 def safe_division(dividend: float, divisor: float) -> float:
     """Safe division of dividend by operand
 
@@ -341,6 +362,8 @@ def safe_division(dividend: float, divisor: float) -> float:
     :param number divisor: lower operand of the division, may be zero
     :return: safe value after division of approximated zero
     """
+    from perun.postprocess.regression_analysis import tools
+
     try:
         return dividend / divisor
     except (ZeroDivisionError, ValueError):
@@ -367,6 +390,35 @@ def chunkify(generator: Iterable[Any], chunk_size: int) -> Iterable[Any]:
         yield itertools.chain([first], itertools.islice(generator, chunk_size - 1))
 
 
+@contextlib.contextmanager
+def worker_pool(
+    jobs: int, initializer: Optional[Callable[..., None]] = None, initargs: tuple[Any, ...] = ()
+) -> Iterator[Callable[..., Iterable[Any]]]:
+    """Provides map function that distributes the calls among the pool of worker processes
+
+    The results are yielded in the same order as the arguments, regardless of the order in which
+    the workers finish. For single job no pool is created and the builtin (lazy) map is used.
+
+    Workers are forked if possible, so they inherit the state of the perun (e.g. the runtime
+    configuration); the mapped function and its arguments have to be picklable.
+
+    :param int jobs: number of worker processes
+    :param function initializer: function called once at the start of each worker process
+        (it is not called, when no pool is created)
+    :param tuple initargs: arguments of the initializer
+    :return: map function running in the pool of workers
+    """
+    if jobs <= 1:
+        yield map
+    else:
+        start_methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in start_methods else None)
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, mp_context=context, initializer=initializer, initargs=initargs
+        ) as pool:
+            yield pool.map
+
+
 def abs_in_absolute_range(value: float, border: float) -> bool:
     """Tests if value is in absolute range as follows:
 
@@ -441,6 +493,37 @@ def get_module(module_name: str) -> types.ModuleType:
 MODULE_CACHE: dict[str, types.ModuleType] = {}
 
 
+class LazyModule(types.ModuleType):
+    """Placeholder of a module that is imported only on the first access to its attributes
+
+    After the import, the placeholder takes over all the attributes of the imported module, so
+    further accesses are not slowed down.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        """Imports the module and returns its attribute
+
+        :param str name: name of the accessed attribute
+        :return: the attribute of the imported module
+        """
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, name)
+
+
+def lazy_import(module_name: str) -> types.ModuleType:
+    """Returns the module that is imported only when it is actually used
+
+    Heavy third-party modules (e.g. numpy, pandas or scipy) imported by the modules on the startup
+    path of the CLI are imported lazily, so only the commands that use them pay for their import.
+    Already imported modules are returned as they are.
+
+    :param str module_name: the full name of the module
+    :return: the imported module or its lazy placeholder
+    """
+    return sys.modules.get(module_name) or LazyModule(module_name)
+
+
 @functools.cache
 def split_to_words(identifier: str) -> set[str]:
     """Splits identifier of function into list of words
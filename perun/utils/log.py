@@ -16,7 +16,6 @@ import time
 import traceback
 
 # Third-Party Imports
-import numpy as np
 import termcolor
 
 # Perun Imports
@@ -41,7 +40,10 @@ from perun.utils.structs import (
 
 if TYPE_CHECKING:
     import types
+    import numpy as np
     import numpy.typing as npt
+else:
+    np = common_kit.lazy_import("numpy")
 
 
 VERBOSITY: int = 0
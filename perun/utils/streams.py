@@ -6,7 +6,7 @@ This module encapsulates such functions, so they can be used in CLI, in tests, i
 from __future__ import annotations
 
 # Standard Imports
-from typing import TextIO, Any
+from typing import Any, Collection, Iterable, Iterator, Optional, TextIO
 import io
 import json
 import os
@@ -19,16 +19,249 @@ from ruamel.yaml import YAML
 from perun.utils import log
 
 
+# Collapses the numbers in the lists to single line in the stored profiles
+LIST_OF_NUMBERS_REGEX = re.compile(r",\s+(\d+)")
+# Matches the characters, that can start or end the nested values in JSON
+JSON_STRUCTURE_REGEX = re.compile(r'["\[\]{}]')
+# Matches the rest of the JSON string (after its opening quote)
+JSON_STRING_REST_REGEX = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Value of the members of JSON object, which were skipped (see :func:`iterate_json_members`)
+SKIPPED_VALUE: Any = object()
+
+
 def store_json(profile: dict[Any, Any], file_path: str) -> None:
     """Stores profile w.r.t. :ref:`profile-spec` to output file.
 
+    The profile is serialized by chunks (see :func:`iterate_json_chunks`), so its full
+    serialization is never held in the memory.
+
     :param Profile profile: dictionary with profile w.r.t. :ref:`profile-spec`
     :param str file_path: output path, where the `profile` will be stored
     """
     with open(file_path, "w") as profile_handle:
-        serialized_profile = json.dumps(profile, indent=2)
-        serialized_profile = re.sub(r",\s+(\d+)", r", \1", serialized_profile)
-        profile_handle.write(serialized_profile)
+        for chunk in iterate_json_chunks(profile, indent=2):
+            profile_handle.write(LIST_OF_NUMBERS_REGEX.sub(r", \1", chunk))
+
+
+def iterate_json_chunks(
+    data: dict[str, Any],
+    indent: Optional[int] = None,
+    chunked_keys: Collection[str] = ("resources",),
+) -> Iterator[str]:
+    """Serializes the dictionary to JSON by chunks
+
+    Each member of the dictionary is serialized separately, while the members under the
+    ``chunked_keys`` (e.g. the resources of profile) are further split by their own members
+    (e.g. by the resource types). Concatenation of the chunks equals to ``json.dumps(data,
+    indent=indent)``.
+
+    :param dict data: serialized dictionary
+    :param int indent: indentation of the JSON, if None, then the JSON is compact
+    :param collection chunked_keys: keys of the members, which are further split by chunks
+    :return: iterator of the chunks of serialized JSON
+    """
+    item_separator = ", " if indent is None else ","
+
+    def newline(depth: int) -> str:
+        """Returns the line break (if any) with indentation of given depth"""
+        return "" if indent is None else "\n" + " " * (indent * depth)
+
+    def iterate_object_chunks(
+        obj: dict[str, Any], depth: int, split_keys: Collection[str]
+    ) -> Iterator[str]:
+        """Serializes the members of the object at given depth by chunks"""
+        if not obj:
+            yield "{}"
+            return
+        yield "{"
+        for i, (key, value) in enumerate(obj.items()):
+            yield f"{item_separator if i else ''}{newline(depth + 1)}{json.dumps(str(key))}: "
+            if key in split_keys and isinstance(value, dict):
+                yield from iterate_object_chunks(value, depth + 1, ())
+            else:
+                yield json.dumps(value, indent=indent).replace("\n", newline(depth + 1))
+        yield newline(depth) + "}"
+
+    yield from iterate_object_chunks(data, 0, chunked_keys)
+
+
+class JsonChunkScanner:
+    """Scanner of JSON given by chunks of text
+
+    The scanner keeps in the buffer only the not yet decoded part of the text, hence the memory
+    is bounded by the size of the largest decoded value.
+
+    :ivar iterator chunks: iterator of the (not yet read) chunks of text
+    :ivar str buffer: buffer of read text
+    :ivar int position: position of the first not yet decoded character in the buffer
+    :ivar bool exhausted: true if all the chunks were read
+    """
+
+    __slots__ = ["chunks", "buffer", "position", "exhausted"]
+    decoder = json.JSONDecoder()
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        """Initializes the scanner
+
+        :param iterable chunks: chunks of the text of JSON
+        """
+        self.chunks: Iterator[str] = iter(chunks)
+        self.buffer: str = ""
+        self.position: int = 0
+        self.exhausted: bool = False
+
+    def read_more(self, size: int = 1) -> bool:
+        """Reads at least the given number of characters to the buffer (if possible)
+
+        :param int size: number of characters that are read
+        :return: false if there is nothing more to read
+        """
+        read_chunks = [self.buffer[self.position :]]
+        read_size = 0
+        while read_size < size and not self.exhausted:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.exhausted = True
+            else:
+                read_chunks.append(chunk)
+                read_size += len(chunk)
+        self.buffer, self.position = "".join(read_chunks), 0
+        return read_size > 0
+
+    def peek(self) -> str:
+        """Skips the whitespaces and returns the next character
+
+        :return: next non-whitespace character or empty string at the end of text
+        """
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position].isspace():
+                self.position += 1
+            if self.position < len(self.buffer) or not self.read_more():
+                return self.buffer[self.position : self.position + 1]
+
+    def expect(self, characters: str) -> str:
+        """Consumes the next character, which has to be one of the given characters
+
+        :param str characters: expected characters
+        :return: consumed character
+        :raises json.JSONDecodeError: if there is other character in the text
+        """
+        character = self.peek()
+        if not character or character not in characters:
+            raise json.JSONDecodeError(
+                f"Expecting one of '{characters}'", self.buffer, self.position
+            )
+        self.position += 1
+        return character
+
+    def decode(self) -> Any:
+        """Decodes the next JSON value
+
+        If the value cannot be decoded from the current buffer, then we read more chunks. The read
+        size is doubled each time, so the value is decoded in amortized linear time.
+
+        :return: decoded value
+        :raises json.JSONDecodeError: if there is no valid value in the rest of text
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                # The number at the end of the buffer might continue in the next chunk
+                if end < len(self.buffer) or self.exhausted:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.exhausted:
+                    raise
+            self.read_more(len(self.buffer) - self.position)
+
+    def skip(self) -> None:
+        """Skips the next JSON value without decoding it
+
+        The objects and arrays are skipped by matching their brackets (outside of strings), which
+        is much faster than decoding them. The skipped text is dropped from the buffer as soon as
+        it is scanned. Note that the skipped text is not fully validated.
+
+        :raises json.JSONDecodeError: if the value is not terminated
+        """
+        if self.peek() not in ("{", "["):
+            self.decode()
+            return
+        depth = 0
+        while True:
+            match = JSON_STRUCTURE_REGEX.search(self.buffer, self.position)
+            string_end = None
+            if match is not None and match.group() == '"':
+                string_end = JSON_STRING_REST_REGEX.match(self.buffer, match.end())
+            if match is None or (match.group() == '"' and string_end is None):
+                # The rest of the buffer either does not contain any bracket or ends in string
+                if self.exhausted:
+                    raise json.JSONDecodeError("Unterminated value", self.buffer, self.position)
+                self.position = len(self.buffer) if match is None else match.start()
+                self.read_more(max(len(self.buffer) - self.position, 1))
+            elif string_end is not None:
+                self.position = string_end.end()
+            else:
+                self.position = match.end()
+                depth += 1 if match.group() in "[{" else -1
+                if depth == 0:
+                    return
+
+
+def iterate_json_members(
+    chunks: Iterable[str],
+    chunked_keys: Collection[str] = ("resources",),
+    decoded_keys: Optional[Collection[str]] = None,
+    skipped_keys: Collection[str] = (),
+) -> Iterator[tuple[tuple[str, ...], Any]]:
+    """Incrementally decodes the JSON object given by chunks of text, member by member
+
+    Yields the pairs of paths of keys and the decoded values of the top-level members of the
+    object. The members under the ``chunked_keys`` are further decoded by their own members, i.e.
+    the path consists of two keys. Hence, the whole JSON is never held in the memory.
+
+    The top-level members, that are in the ``skipped_keys`` or that are not in the
+    ``decoded_keys``, are not decoded at all (see :meth:`JsonChunkScanner.skip`) and are
+    yielded with the :data:`SKIPPED_VALUE`.
+
+    :param iterable chunks: chunks of the text of JSON object
+    :param collection chunked_keys: keys of the members, which are decoded by their members
+    :param collection decoded_keys: keys of the decoded members, if None, then all the members
+        (except the skipped ones) are decoded
+    :param collection skipped_keys: keys of the members, which are skipped
+    :return: iterator of pairs of path of keys and decoded values
+    :raises json.JSONDecodeError: if the text is not valid JSON object
+    """
+    scanner = JsonChunkScanner(chunks)
+    scanner.expect("{")
+    if scanner.peek() == "}":
+        scanner.expect("}")
+    else:
+        while True:
+            key = scanner.decode()
+            scanner.expect(":")
+            if key in skipped_keys or (decoded_keys is not None and key not in decoded_keys):
+                scanner.skip()
+                yield (key,), SKIPPED_VALUE
+            elif key in chunked_keys and scanner.peek() == "{":
+                scanner.expect("{")
+                if scanner.peek() == "}":
+                    scanner.expect("}")
+                    yield (key,), {}
+                else:
+                    while True:
+                        member_key = scanner.decode()
+                        scanner.expect(":")
+                        yield (key, member_key), scanner.decode()
+                        if scanner.expect(",}") == "}":
+                            break
+            else:
+                yield (key,), scanner.decode()
+            if scanner.expect(",}") == "}":
+                break
+    if scanner.peek():
+        raise json.JSONDecodeError("Extra data", scanner.buffer, scanner.position)
 
 
 def safely_load_yaml_from_file(yaml_file: str) -> dict[Any, Any]:
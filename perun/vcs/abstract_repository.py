@@ -183,3 +183,11 @@ class AbstractRepository(ABC):
 
         :param str minor_version: minor version that will be checked out
         """
+
+    def reopen(self) -> None:
+        """Reopens the wrapped repository, e.g. in the forked process
+
+        Some implementations keep persistent connections to the underlying version control system
+        (e.g. running processes), which cannot be shared by the parent and the forked process.
+        By default, nothing is reopened.
+        """
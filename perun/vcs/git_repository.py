@@ -36,6 +36,14 @@ class GitRepository(AbstractRepository):
         if self.valid_repo:
             self.git_repo: Repo = Repo(vcs_path)
 
+    def reopen(self) -> None:
+        """Opens new git repository object with its own persistent git processes
+
+        The git processes of the parent process are only released by the forked process (they
+        are not children of the forked process, hence they are not terminated).
+        """
+        self._set_git_repo(self.vcs_path)
+
     @staticmethod
     def contains_git_repo(path: str) -> bool:
         """Checks if there is a git repo at the given @p path.
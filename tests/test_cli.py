@@ -20,7 +20,7 @@ import pytest
 # Perun Imports
 from perun import cli
 from perun.cli_groups import utils_cli, config_cli, run_cli, check_cli
-from perun.logic import config, pcs, stats, temp
+from perun.logic import config, pcs, stats, store, temp
 from perun.testing import asserts
 from perun.utils import exceptions, log
 from perun.utils.common import common_kit
@@ -60,6 +60,11 @@ def test_cli(monkeypatch, pcs_with_root):
     asserts.predicate_from_cli(result, result.output.startswith("Perun"))
     asserts.predicate_from_cli(result, result.exit_code == 0)
 
+    result = runner.invoke(cli.cli, ["--startup-profile"])
+    asserts.predicate_from_cli(result, "Startup Profile" in result.output)
+    asserts.predicate_from_cli(result, "perun.cli" in result.output)
+    asserts.predicate_from_cli(result, result.exit_code == 0)
+
     result = runner.invoke(cli.cli, ["--version"])
     result.exception = "exception"
     # Try that predicate from cli reraises
@@ -442,6 +447,8 @@ def kernel_regression_runner_test(runner, tests_set, tests_edge, exit_code, cpro
         3: ["user-selection"],
         4: ["kernel-ridge"],
         5: ["kernel-smoothing"],
+        6: ["binned-smoothing"],
+        7: ["nystroem-ridge"],
     }
     # Executing the testing
     mode_idx = 0
@@ -887,8 +894,26 @@ def test_kernel_regression_correct(pcs_with_root):
                 "tricube",
             ]
         },
+        # TEST BINNED-SMOOTHING OPTIONS
+        # 60. Test the help printout first
+        {"params": ["--help"], "output": "Usage"},
+        # 61. Test default command
+        {"params": []},
+        # 62. Test the kernel type with the bandwidth method
+        {"params": ["--kernel-type", "normal", "-bm", "silverman"]},
+        # 63. Test the bandwidth value with the number of bins
+        {"params": ["-kt", "tricube", "--bandwidth-value", 0.5, "--bins", 16]},
+        # TEST NYSTROEM-RIDGE OPTIONS
+        # 64. Test the help printout first
+        {"params": ["--help"], "output": "Usage"},
+        # 65. Test default command
+        {"params": []},
+        # 66. Test the gamma value with the number of components
+        {"params": ["--gamma", 1e-3, "--components", 8]},
+        # 67. Test the strength of the regularization
+        {"params": ["-nc", 1000, "--alpha", 0]},
     ]
-    tests_edge = [5, 22, 30, 34, 40, 59]
+    tests_edge = [5, 22, 30, 34, 40, 59, 63, 67]
 
     # Instantiate the runner first
     runner = CliRunner()
@@ -1653,6 +1678,38 @@ def test_postprocess_tag(pcs_single_prof, valid_profile_pool):
     asserts.predicate_from_cli(result, result.exit_code == 0)
 
 
+def test_postprocess_jobs(pcs_single_prof):
+    """Test running postprocessby with models of uids computed in parallel
+
+    Expecting no errors, and the same models as for the sequential computation
+    """
+    runner = CliRunner()
+    result = runner.invoke(cli.status, [])
+    match = re.search(r"([0-9]+@i).*mixed", result.output)
+    assert match
+    cprof_idx = match.groups(1)[0]
+    pending_dir = os.path.join(pcs_single_prof.get_path(), "jobs")
+
+    def postprocess_models(name, params):
+        """Runs the postprocessby and returns the models of the postprocessed profile"""
+        result = runner.invoke(cli.postprocessby, ["-ot", name] + params)
+        asserts.predicate_from_cli(result, result.exit_code == 0)
+        profile_path = os.path.join(pending_dir, f"{name}.perf")
+        return store.load_profile_from_file(profile_path, True)["models"]
+
+    for postprocessor in (
+        ["regression-analysis", "-m", "bisection"],
+        ["regressogram"],
+        ["moving-average"],
+        ["kernel-regression"],
+    ):
+        sequential_models = postprocess_models("sequential", [cprof_idx] + postprocessor)
+        parallel_models = postprocess_models("parallel", ["-j", "3", cprof_idx] + postprocessor)
+        config.runtime().data.clear()
+        assert sequential_models
+        assert parallel_models == sequential_models
+
+
 def test_show_tag(pcs_single_prof, valid_profile_pool, monkeypatch):
     """Test running show with several valid and invalid tags
 
@@ -1920,6 +1977,61 @@ def test_check_all(pcs_with_degradations, monkeypatch):
     asserts.predicate_from_cli(result, "Malformed changelog line in " in result.output)
 
 
+def test_check_reuse(pcs_with_degradations, monkeypatch):
+    """Test reusing the stored results of checks by repeated ``perun check``
+
+    Expecting the stored results are not reused, when the parameters of the methods change
+    """
+    checked_tasks = []
+    run_check_task = check.run_check_task
+
+    def spied_run_check_task(task):
+        checked_tasks.append(task)
+        return run_check_task(task)
+
+    monkeypatch.setattr(check, "run_check_task", spied_run_check_task)
+    runner = CliRunner()
+    result = runner.invoke(cli.cli, ["--no-pager", "check", "head"])
+    asserts.predicate_from_cli(result, result.exit_code == 0)
+    number_of_checks = len(checked_tasks)
+    assert number_of_checks > 0
+
+    result = runner.invoke(cli.cli, ["--no-pager", "check", "head"])
+    asserts.predicate_from_cli(result, result.exit_code == 0)
+    assert len(checked_tasks) == number_of_checks
+
+    pcs_with_degradations.local_config().set("degradation.cutoff", "0.5")
+    result = runner.invoke(cli.cli, ["--no-pager", "check", "head"])
+    asserts.predicate_from_cli(result, result.exit_code == 0)
+    assert len(checked_tasks) == 2 * number_of_checks
+
+
+def test_check_jobs(pcs_with_degradations, monkeypatch):
+    """Test checking degradation with the number of jobs set in the local configuration
+
+    Expecting the configured number of workers, unless it is overridden by ``--jobs``
+    """
+    used_jobs = []
+    worker_pool = common_kit.worker_pool
+
+    def spied_worker_pool(jobs, *args, **kwargs):
+        used_jobs.append(jobs)
+        return worker_pool(jobs, *args, **kwargs)
+
+    monkeypatch.setattr(common_kit, "worker_pool", spied_worker_pool)
+    pcs_with_degradations.local_config().set("degradation.jobs", "2")
+    runner = CliRunner()
+    result = runner.invoke(cli.cli, ["--no-pager", "check", "head"])
+    asserts.predicate_from_cli(result, result.exit_code == 0)
+    assert used_jobs == [2]
+    assert "degradation.jobs" not in config.runtime().data.get("degradation", {})
+
+    result = runner.invoke(cli.cli, ["--no-pager", "check", "-j", "1", "head"])
+    asserts.predicate_from_cli(result, result.exit_code == 0)
+    assert used_jobs == [2, 1]
+    config.runtime().data.clear()
+
+
 @pytest.mark.usefixtures("cleandir")
 def test_utils_create(monkeypatch, tmpdir):
     """Tests creating stuff in the perun"""
@@ -2,23 +2,38 @@
 
 # Standard Imports
 from subprocess import SubprocessError, CalledProcessError
+import collections
+import contextlib
+import io
 import os
 import subprocess
 import signal
+import types
 
 # Third-Party Imports
 from click.testing import CliRunner
+import pytest
 
 # Perun Imports
 from perun import cli
 from perun.collect.complexity import makefiles, symbols, run as complexity, configurator
-from perun.logic import pcs, runner as run
+from perun.collect.kperf import parser as kperf_parser
+from perun.collect.memory import parsing, syscalls
+from perun.logic import config, pcs, runner as run, store, temp
 from perun.profile.factory import Profile
 from perun.testing import asserts, utils as test_utils
 from perun.utils import log
 from perun.utils.common import common_kit
-from perun.utils.external import commands
-from perun.utils.structs import Unit, Executable, CollectStatus, RunnerReport, Job
+from perun.utils.external import commands, processes
+from perun.utils.structs import (
+    Unit,
+    Executable,
+    CollectStatus,
+    GeneratorSpec,
+    PostprocessStatus,
+    RunnerReport,
+    Job,
+)
 from perun.workload.integer_generator import IntegerGenerator
 
 
@@ -42,10 +57,6 @@ def _mocked_libs_existence_exception(_):
     raise NameError
 
 
-def _mocked_record_processing(_, __, ___, ____):
-    return 1
-
-
 def _mocked_symbols_extraction(_):
     return ["_Z13SLList_insertP6SLListi", "main", "_fini", "_init", "_Z13SLList_removeP6SLListi",
             "_ZN9SLListclsD1Ev", "_ZN9SLListclsD2Ev", "_ZN9SLListclsC1Ev", "_ZN9SLListclsC2Ev",
@@ -217,11 +228,8 @@ def test_collect_complexity_errors(monkeypatch, pcs_with_root, complexity_collec
     common_kit.touch_dir(os.path.join(job_params["target_dir"], "bin"))
     with open(os.path.join(job_params["target_dir"], "bin", "trace.log"), "w") as mock_handle:
         mock_handle.write("a b c d\na b c d")
-    old_record_processing = complexity._process_file_record
-    monkeypatch.setattr(complexity, "_process_file_record", _mocked_record_processing)
     result = runner.invoke(cli.collect, command)
     asserts.predicate_from_cli(result, "Call stack error" in result.output)
-    monkeypatch.setattr(complexity, "_process_file_record", old_record_processing)
 
     # Simulate the failure of output processing
     old_find_braces = symbols._find_all_braces
@@ -253,6 +261,74 @@ def test_collect_complexity_errors(monkeypatch, pcs_with_root, complexity_collec
     monkeypatch.setattr(configurator, "create_runtime_config", old_cfg)
 
 
+def _pair_complexity_records(records, address_map):
+    """Pairs the records of complexity log one by one using the call stack"""
+    resources, call_stack = {}, []
+    for action, func, timestamp, size in records:
+        if action == "i":
+            call_stack.append((func, timestamp))
+        elif call_stack and call_stack[-1][0] == func:
+            resources.setdefault(address_map[func], []).append(
+                (timestamp - call_stack.pop()[1], size)
+            )
+        else:
+            return None
+    return resources
+
+
+@pytest.mark.parametrize("block_size", [64, 2**24])
+def test_collect_complexity_log_blocks(monkeypatch, tmp_path, block_size):
+    """Test parsing the complexity log in blocks against pairing the records one by one
+
+    Expects to pass all assertions.
+    """
+    monkeypatch.setattr(complexity, "_BLOCK_SIZE", block_size)
+    address_map = {"0x401000": "main", "0x401100": "SLList_insert", "0x401200": "SLList_search"}
+    monkeypatch.setattr(symbols, "extract_symbol_address_map", lambda _: address_map)
+    executable = Executable(str(tmp_path / "collector"))
+
+    # Generate nested and recursive calls, with the main never returning
+    records, timestamp = [("i", "0x401000", 0, 0)], 0
+    for size in range(50):
+        for func in ("0x401100", "0x401200", "0x401100"):
+            records.append(("i", func, timestamp, 0))
+            timestamp += size % 7 + 1
+        for func in ("0x401100", "0x401200", "0x401100"):
+            timestamp += size % 3 + 1
+            records.append(("o", func, timestamp, size))
+    expected = _pair_complexity_records(records, address_map)
+    (tmp_path / "trace.log").write_text("".join(f"{' '.join(map(str, r))}\n" for r in records))
+
+    status, _, kwargs = complexity.after(executable)
+    assert status == CollectStatus.OK
+    resources = {}
+    for _, resource in kwargs["profile"].all_resources():
+        assert resource["time"] == f"{timestamp / 1000000.0}s"
+        resources.setdefault(resource["uid"], []).append(
+            (resource["amount"], resource["structure-unit-size"])
+        )
+    assert resources == expected
+
+    # Returns without matching calls are reported
+    for broken_records, stack_top in [
+        (records[:10] + [("o", "0x401000", 0, 0)], "0x401100, i"),
+        ([("o", "0x401100", 0, 0)], "empty"),
+    ]:
+        assert _pair_complexity_records(broken_records, address_map) is None
+        (tmp_path / "trace.log").write_text(
+            "".join(f"{' '.join(map(str, r))}\n" for r in broken_records)
+        )
+        status, msg, _ = complexity.after(executable)
+        assert status == CollectStatus.ERROR
+        assert msg.startswith("Call stack error, record: 0x401")
+        assert msg.endswith(f"stack top: {stack_top}")
+
+    (tmp_path / "trace.log").write_text("i 0x401000 0 0\ni 0x401100\n")
+    status, msg, _ = complexity.after(executable)
+    assert status == CollectStatus.ERROR
+    assert msg == "Malformed record: i 0x401100"
+
+
 def test_collect_memory(capsys, pcs_with_root, memory_collect_job, memory_collect_no_debug_job):
     """Test collecting the profile using the memory collector"""
     # Fixme: Add check that the profile was correctly generated
@@ -262,9 +338,9 @@ def test_collect_memory(capsys, pcs_with_root, memory_collect_job, memory_collec
 
     run.run_single_job(*memory_collect_job)
 
-    # Assert that nothing was removed
+    # Assert that nothing was removed, the persistent symbol cache and tmp index were also created
     after_object_count = test_utils.count_contents_on_path(pcs_with_root.get_path())[0]
-    assert before_object_count + 2 == after_object_count
+    assert before_object_count + 4 == after_object_count
 
     profiles = list(
         filter(
@@ -402,6 +478,81 @@ def test_collect_memory_with_generator(pcs_with_root, memory_collect_job):
     assert len(memory_profiles) == 1
 
 
+def test_collect_memory_log_streaming(monkeypatch, tmp_path):
+    """Test that the memory log is parsed into snapshots one allocation at a time
+
+    Expects to pass all assertions.
+    """
+
+    def mocked_symbol_caches(names, addresses, _):
+        syscalls.demangle_cache = {name: name for name in names}
+        syscalls.address_to_line_cache = {ip: ["main.c", "42"] for ip, _ in addresses}
+
+    monkeypatch.setattr(syscalls, "build_symbol_caches", mocked_symbol_caches)
+    allocation = "malloc {}B 1024\nmalloc 0x7f00 +0x3a\nmain 0x11ba +0x3c\n"
+    log_path = tmp_path / "MemoryLog"
+    log_path.write_text(
+        "\n".join(
+            f"time {time}s\n" + allocation.format(amount)
+            for time, amount in [("0.0005", 4), ("0,0025", 8), ("0.0026", 16)]
+        )
+        + "\nEXIT 0.003s\n"
+    )
+    allocations = list(parsing.iterate_allocations(str(log_path)))
+    assert [len(allocation) for allocation in allocations] == [4, 4, 4]
+
+    snapshots = parsing.parse_log(str(log_path), Executable("mct"), 0.001)
+    first_snapshot = next(snapshots)
+    assert first_snapshot["time"] == "0.001000"
+    assert [res["amount"] for res in first_snapshot["resources"]] == [4]
+    assert [
+        (snapshot["time"], [res["amount"] for res in snapshot["resources"]])
+        for snapshot in snapshots
+    ] == [("0.002000", []), ("0.003000", [8, 16])]
+
+    # The snapshots can be added to the profile in batches
+    profile = Profile()
+    for number, snapshot in enumerate(parsing.parse_log(str(log_path), Executable("mct"), 0.001)):
+        profile.update_resources([snapshot], "snapshots", first_snapshot=number)
+    assert sorted(res["snapshot"] for _, res in profile.all_resources()) == [0, 2, 2]
+
+    # The log without the EXIT record is malformed
+    log_path.write_text(f"time 0.0005s\n{allocation.format(4)}\n")
+    with pytest.raises(ValueError):
+        list(parsing.parse_log(str(log_path), Executable("mct"), 0.001))
+
+
+def test_collect_memory_symbol_caches(monkeypatch, pcs_with_root, memory_collect_job):
+    """Test that the symbols of the binary are persistently cached between the collections"""
+    binary = memory_collect_job[0][0]
+    symbols_output = subprocess.check_output(["nm", binary]).decode("utf-8")
+    main_address = "0x" + next(
+        line.split()[0] for line in symbols_output.splitlines() if line.endswith(" main")
+    )
+    names, addresses = {"main", "_Z3foov"}, {(main_address, "0x0")}
+
+    syscalls.build_symbol_caches(names, addresses, binary)
+    assert syscalls.demangle("_Z3foov") == "foo()"
+    assert syscalls.address_to_line(main_address)[0].endswith("memory_collect_test.c")
+    cache_file = os.path.join(syscalls.SYMBOL_CACHE_DIR, f"{syscalls.binary_key(binary)}.json")
+    assert temp.exists_temp_file(cache_file)
+
+    # The repeated collection resolves only the new symbols
+    resolved = []
+    original_resolve = syscalls._resolve_by_stdin
+
+    def _recorded_resolve(sys_call, queries):
+        resolved.extend(queries)
+        return original_resolve(sys_call, queries)
+
+    monkeypatch.setattr(syscalls, "_resolve_by_stdin", _recorded_resolve)
+    syscalls.build_symbol_caches(names | {"_Z3barv"}, addresses, binary)
+    assert resolved == ["_Z3barv"]
+    assert syscalls.demangle("_Z3barv") == "bar()"
+    assert syscalls.demangle("_Z3foov") == "foo()"
+    assert syscalls.address_to_line(main_address)[0].endswith("memory_collect_test.c")
+
+
 def test_collect_bounds(monkeypatch, pcs_with_root):
     """Test collecting the profile using the bounds collector"""
     current_dir = os.path.split(__file__)[0]
@@ -485,6 +636,60 @@ def test_collect_time(monkeypatch, pcs_with_root, capsys):
     assert "Something happened lol!" in err
 
 
+def test_collect_in_parallel(monkeypatch, pcs_with_root, capsys):
+    """Test running the jobs in parallel with the same results as the sequential run"""
+    head = pcs.vcs().get_minor_version_info(pcs.vcs().get_minor_head())
+
+    def mocked_run_collector(collector, job):
+        log.minor_success(f"Collecting by {collector.name} from {job.executable}")
+        resources = [{"uid": "main", "amount": len(job.executable.workload), "type": "time"}]
+        return CollectStatus.OK, Profile({"resources": resources})
+
+    monkeypatch.setattr("perun.logic.runner.run_collector", mocked_run_collector)
+    workloads = ["a", "bb", "ccc", "dddd"]
+    outputs, stored_profiles = [], []
+    for parallel in ("1", "3"):
+        config.runtime().set("execute.parallel", parallel)
+        config.runtime().set("execute.pin_cpus", "true")
+        monkeypatch.setattr(
+            "perun.logic.runner.store_generated_profile",
+            lambda prof, job, *_: stored_profiles.append(
+                (str(job.executable), prof["resources"], prof["header"]["workload"])
+            ),
+        )
+        assert run.run_single_job(["echo"], workloads, ["time"], [], [head]) == CollectStatus.OK
+        out = common_kit.escape_ansi(capsys.readouterr()[0])
+        outputs.append(out[out.index("Running Jobs") :])
+        config.runtime().data.clear()
+
+    # The jobs are reported and stored in the same order
+    assert outputs[0] == outputs[1]
+    assert [f"Job {i} Overview" in outputs[1] for i in range(1, 5)] == [True] * 4
+    assert outputs[1].index("echo ccc - succeeded") < outputs[1].index("Job 4 Overview")
+    assert stored_profiles[:4] == stored_profiles[4:]
+    assert [workload for _, _, workload in stored_profiles[4:]] == workloads
+    assert pcs.vcs().get_minor_head() == head.checksum
+
+    # The progress of postprocessing accounts for all workloads generated by the previous jobs
+    monkeypatch.setattr(
+        "perun.logic.runner.run_postprocessor", lambda _, __, prof: (PostprocessStatus.OK, prof)
+    )
+    generator_params = {"min_range": 1, "max_range": 3, "profile_for_each_workload": True}
+    monkeypatch.setattr(
+        "perun.workload.load_generator_specifications",
+        lambda: {"ints": GeneratorSpec(IntegerGenerator, generator_params)},
+    )
+    outputs = []
+    for parallel in ("1", "2"):
+        config.runtime().set("execute.parallel", parallel)
+        run.run_single_job(["echo"], ["ints", "a"], ["time"], ["normalizer"], [head])
+        out = common_kit.escape_ansi(capsys.readouterr()[0])
+        outputs.append(out[out.index("Running Jobs") :])
+        config.runtime().data.clear()
+    assert outputs[0] == outputs[1]
+    assert outputs[1].count("Progress of the job") == 4
+
+
 def test_integrity_tests(capsys):
     """Basic tests for checking integrity of runners"""
     mock_report = RunnerReport(complexity, "postprocessor", {"profile": {}})
@@ -566,16 +771,56 @@ def test_collect_kperf(monkeypatch, pcs_with_root, capsys):
     after_object_count = test_utils.count_contents_on_path(pcs_with_root.get_path())[0]
     assert before_object_count + 2 == after_object_count
 
+    # Test aggregating the samplings
+    result = runner.invoke(
+        cli.collect, ["-c", "ls", "-w", ".", "kperf", "-w", "0", "-r", "2", "--aggregate"]
+    )
+    assert result.exit_code == 0
+    # The profiles collected within the same second have the same name, hence take the latest
+    jobs_dir = pcs.get_job_directory()
+    aggregated_profile = max(
+        (os.path.join(jobs_dir, name) for name in os.listdir(jobs_dir) if name.endswith(".perf")),
+        key=os.path.getmtime,
+    )
+    profile = store.load_profile_from_file(aggregated_profile, is_raw_profile=True)
+    resources = [resource for _, resource in profile.all_resources()]
+    stacks = [
+        (resource["command"], repr(resource["trace"]), resource["uid"]) for resource in resources
+    ]
+    assert resources and len(stacks) == len(set(stacks))
+    for resource in resources:
+        assert len(resource["repeat-amounts"]) == 2
+        assert sum(resource["repeat-amounts"]) == resource["amount"]
+
     # Test sudo (mocked)
     def mocked_safe_external(*_, **__):
         return b"", b""
 
+    perf_script_commands = []
+
+    @contextlib.contextmanager
+    def mocked_perf_script(command, *_, **__):
+        perf_script_commands.append(command)
+        perf_script = b"ls 12345 1234.5678: 250000 cpu-clock: \n\t55555 main+0x22 (/usr/bin/ls)\n\n"
+        yield types.SimpleNamespace(stdout=io.BytesIO(perf_script), wait=lambda: 0)
+
+    collapsed_resources = []
+    parse_events = kperf_parser.parse_events
+
+    def spied_parse_events(*args):
+        collapsed_resources.extend(parse_events(*args))
+        return collapsed_resources
+
     old_run = commands.run_external_command
     monkeypatch.setattr(commands, "run_safely_external_command", mocked_safe_external)
+    monkeypatch.setattr(processes, "nonblocking_subprocess", mocked_perf_script)
+    monkeypatch.setattr(kperf_parser, "parse_events", spied_parse_events)
     result = runner.invoke(
         cli.collect, ["-c", "ls", "-w", ".", "kperf", "-w", "1", "-r", "1", "--with-sudo"]
     )
     assert result.exit_code == 0
+    assert perf_script_commands == ["sudo perf script -i collected.data"] * 2
+    assert collapsed_resources == [{"amount": 250000, "uid": "main", "command": "ls", "trace": []}]
 
     def mocked_fail_external(cmd, *args, **kwargs):
         if "ls" in cmd:
@@ -593,17 +838,6 @@ def test_collect_kperf(monkeypatch, pcs_with_root, capsys):
     monkeypatch.setattr(commands, "run_safely_external_command", old_run)
 
     # Test error stuff
-    def mocked_is_executable_sc(command):
-        if "stackcoll" in command:
-            return False
-        else:
-            return True
-
-    monkeypatch.setattr("perun.utils.external.commands.is_executable", mocked_is_executable_sc)
-    result = runner.invoke(cli.collect, ["-c", "ls", "-w", ".", "kperf", "-w", "0", "-r", "1"])
-    assert result.exit_code != 0
-    assert "not-executable" in result.output
-
     def mocked_is_executable_perf(command):
         if "perf" in command:
             return False
@@ -614,3 +848,71 @@ def test_collect_kperf(monkeypatch, pcs_with_root, capsys):
     result = runner.invoke(cli.collect, ["-c", "ls", "-w", ".", "kperf", "-w", "0", "-r", "1"])
     assert result.exit_code != 0
     assert "not-executable" in result.output
+
+
+def test_collapse_kperf_stacks():
+    """Test collapsing the stacks of the perf script output
+
+    Expects to pass all assertions.
+    """
+    perf_script = [
+        "# cmdline : /usr/bin/perf record -g ls",
+        "ls 12345 1234.567890:     250000 cpu-clock:pppH: ",
+        "\tffffffff8100 native_write_msr+0x6 ([kernel.kallsyms])",
+        "\t7f0000001000 [unknown] (/usr/lib/libc.so.6)",
+        "\t7f0000003000 inl_a->inl_b+0x10 (/usr/bin/ls)",
+        "\t55555 std::vector<int>::push_back(int const&)+0x1c (/usr/bin/ls)",
+        "",
+        "ls 12345/12346 1234.567891:     250000 cpu-clock:pppH: ",
+        "\tffffffff8100 native_write_msr+0x6 ([kernel.kallsyms])",
+        "\t55555 main+0x22 (/usr/bin/ls)",
+        "",
+        "ls 12345 1234.567892:     250000 cpu-clock:pppH: ",
+        "\tffffffff8100 native_write_msr+0x6 ([kernel.kallsyms])",
+        "\t55555 main+0x22 (/usr/bin/ls)",
+        "",
+        "my prog 12345 1234.567893:     0 cpu-clock:pppH: ",
+        '\t55555 "quoted";func+0x1 (/usr/bin/ls)',
+        "\t55558 (/usr/bin/ls) (/usr/bin/ls)",
+        "",
+        "ls 12345 1234.567894:     100 other-event: ",
+        "\t55555 main+0x22 (/usr/bin/ls)",
+        "",
+    ]
+    stacks = kperf_parser.StackCollapser()
+    counts = stacks.collapse(perf_script)
+    assert {";".join(stacks.stacks[stack_id]): count for stack_id, count in counts.items()} == {
+        "ls;std::vector<int>::push_back;inl_a;inl_b_[i];[libc.so.6];native_write_msr": 250000,
+        "ls;main;native_write_msr": 500000,
+        "my_prog;quoted:func": 1,
+    }
+
+    # The stacks are shared by the runs and their traces by the resources
+    resources = kperf_parser.parse_events([counts, stacks.collapse(perf_script)], stacks)
+    assert len(resources) == 6 and len(stacks.stacks) == 3
+    main_resources = [res for res in resources if res["trace"] == [{"func": "main"}]]
+    assert len(main_resources) == 2
+    assert main_resources[0]["trace"] is main_resources[1]["trace"]
+    assert main_resources[0]["uid"] == "native_write_msr"
+    assert main_resources[0]["command"] == "ls"
+
+    # The samples of the same stacks are aggregated across the runs
+    main_stack = stacks.stack_ids[("ls", "main", "native_write_msr")]
+    counts_without_main = collections.Counter(counts)
+    del counts_without_main[main_stack]
+    aggregated = kperf_parser.aggregate_events([counts, counts_without_main, counts], stacks)
+    assert len(aggregated) == 3
+    assert sorted(
+        (res["amount"], res["repeat-amounts"], len(res["trace"])) for res in aggregated
+    ) == [
+        (3, [1, 1, 1], 0),
+        (750000, [250000, 250000, 250000], 4),
+        (1000000, [500000, 0, 500000], 1),
+    ]
+    profile = Profile({"global": {"time": 1.0, "resources": aggregated}})
+    assert len(profile["resource_type_map"]) == 3
+    assert sorted(res["repeat-amounts"] for _, res in profile.all_resources()) == [
+        [1, 1, 1],
+        [250000, 250000, 250000],
+        [500000, 0, 500000],
+    ]
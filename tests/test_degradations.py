@@ -10,7 +10,7 @@ import pytest
 
 # Perun Imports
 from perun.check.methods.abstract_base_checker import AbstractBaseChecker
-from perun.logic import config, store
+from perun.logic import config, pcs, store
 from perun.utils import log
 from perun.utils.exceptions import UnsupportedModuleException
 import perun.check.factory as check
@@ -87,6 +87,68 @@ def test_degradation_in_history(pcs_with_degradations):
     assert check.PerformanceChange.Degradation in [r[0].result for r in result]
 
 
+def test_degradation_in_parallel(pcs_with_degradations, capsys):
+    """Set of basic tests for checking degradations in several jobs
+
+    Expects the same results and output as when checked sequentially
+    """
+    git_repo = git.Repo(pcs_with_degradations.get_vcs_path())
+    head = str(git_repo.head.commit)
+
+    def summarize(changes):
+        return [(deg.result, deg.location, cmdstr, baseline) for deg, cmdstr, baseline in changes]
+
+    sequential_result = summarize(check.degradation_in_history(head))
+    sequential_minor_result = summarize(check.degradation_in_minor(head, True))
+
+    config.runtime().set("degradation.jobs", 2)
+    config.runtime().set("degradation.force_recheck", "true")
+    assert check.get_number_of_jobs() == 2
+    assert summarize(check.degradation_in_history(head)) == sequential_result
+    assert summarize(check.degradation_in_minor(head, True)) == sequential_minor_result
+    config.runtime().data.clear()
+
+
+def test_degradation_reuse(pcs_with_degradations, monkeypatch):
+    """Set of basic tests for reusing the stored results of already checked pairs
+
+    Expects the stored results are reused, unless forced otherwise
+    """
+    git_repo = git.Repo(pcs_with_degradations.get_vcs_path())
+    head = str(git_repo.head.commit)
+
+    def summarize(changes):
+        return [
+            (deg.result, deg.location, deg.partial_intervals, cmdstr, baseline)
+            for deg, cmdstr, baseline in changes
+        ]
+
+    checked_result = summarize(check.degradation_in_minor(head, True))
+    assert checked_result != []
+    stored_results = store.load_check_results_for(pcs.get_object_directory(), head)
+    assert len(stored_results) == len(check.prepare_checks_in_minor(head))
+
+    def raise_error(_):
+        """Raises error, if some check is run"""
+        raise AssertionError("no check should be run")
+
+    monkeypatch.setattr(check, "run_check_task", raise_error)
+    assert summarize(check.degradation_in_minor(head, True)) == checked_result
+
+    # The stored results are not reused, when the parameters of the methods change
+    for key, value in (("degradation.cutoff", "0.5"), ("degradation.location_filter", "main")):
+        config.runtime().set(key, value)
+        with pytest.raises(AssertionError):
+            check.degradation_in_minor(head, True)
+        config.runtime().data.clear()
+    assert summarize(check.degradation_in_minor(head, True)) == checked_result
+
+    config.runtime().set("degradation.force_recheck", "true")
+    with pytest.raises(AssertionError):
+        check.degradation_in_minor(head, True)
+    config.runtime().data.clear()
+
+
 def test_degradation_between_profiles(pcs_with_root, capsys):
     """Set of basic tests for testing degradation between profiles
 
@@ -0,0 +1,176 @@
+"""
+Tests of non-parametric method kernel regression functionality.
+
+The approximations of kernel regression intended for large number of points
+(i.e. binned-smoothing and nystroem-ridge modes) are compared with the exact
+kernel estimates computed on the same points.
+
+The postprocessby CLI is tested in test_cli module.
+"""
+from __future__ import annotations
+
+# Standard Imports
+import copy
+
+# Third-Party Imports
+import git
+import numpy as np
+
+# Perun Imports
+from perun.logic import stats
+from perun.postprocess.kernel_regression import methods
+from perun.postprocess.kernel_regression.run import postprocess
+import perun.testing.utils as test_utils
+
+
+def _generate_points(count: int) -> tuple[list[float], list[float]]:
+    """Generates sorted noisy points of the non-linear function
+
+    :param int count: number of generated points
+    :return: x and y coordinates of the points
+    """
+    rng = np.random.default_rng(42)
+    x_pts = np.sort(rng.uniform(0, 100, count))
+    y_pts = 50 * np.sin(x_pts / 10) + x_pts + rng.normal(0, 3, count)
+    return list(x_pts), list(y_pts)
+
+
+def test_binned_smoothing():
+    """
+    Test the binned kernel smoothing against the exact spatial-average kernel smoothing.
+
+    Expects to pass all assertions.
+    """
+    x_pts, y_pts = _generate_points(2000)
+    config = {
+        "kernel_mode": "binned-smoothing",
+        "kernel_type": "epanechnikov",
+        "smoothing_method": "spatial-average",
+        "bandwidth_method": "scott",
+        "bandwidth_value": None,
+        "polynomial_order": 3,
+        "bins_count": 1024,
+        "per_key": "structure-unit-size",
+    }
+    exact = methods.kernel_smoothing(x_pts, y_pts, config)
+    binned = methods.execute_kernel_regression(x_pts, y_pts, config)
+
+    assert binned["kernel_mode"] == "binned"
+    assert binned["bandwidth"] == exact["bandwidth"]
+    assert len(binned["bucket_stats"]) == len(x_pts)
+    assert np.allclose(binned["bucket_stats"], exact["bucket_stats"], atol=0.05)
+    assert abs(binned["r_square"] - exact["r_square"]) < 1e-3
+
+    # The points with the same x-coordinate are estimated by their average
+    constant = methods.binned_kernel_smoothing([1.0] * 4, [1.0, 2.0, 3.0, 4.0], config)
+    assert constant["bucket_stats"] == [2.5] * 4
+
+
+def test_nystroem_ridge():
+    """
+    Test the kernel ridge regression with Nystroem approximation of the kernel.
+
+    Expects to pass all assertions.
+    """
+    x_pts, y_pts = _generate_points(20000)
+    config = {
+        "kernel_mode": "nystroem-ridge",
+        "gamma": None,
+        "components_count": 128,
+        "alpha": 1e-3,
+        "per_key": "structure-unit-size",
+    }
+    model = methods.execute_kernel_regression(x_pts, y_pts, config)
+
+    assert model["kernel_mode"] == "nystroem"
+    assert len(model["bucket_stats"]) == len(x_pts)
+    # The estimate is close to the noise-free function
+    expected = 50 * np.sin(np.array(x_pts) / 10) + np.array(x_pts)
+    assert np.abs(np.array(model["bucket_stats"]) - expected).mean() < 1
+    assert model["r_square"] > 0.99
+
+    # The number of components is bounded by the number of points
+    small = methods.nystroem_kernel_ridge(x_pts[:10], y_pts[:10], config)
+    assert len(small["bucket_stats"]) == 10
+
+
+def test_cached_bandwidths(pcs_with_root):
+    """
+    Test the caching of the bandwidths selected by the estimator-settings mode in stats.
+
+    Expects to pass all assertions.
+    """
+    profile = test_utils.load_profile("postprocess_profiles", "kernel_datapoints.perf")
+    repo = git.Repo(pcs_with_root.get_vcs_path())
+    # The bandwidths are cached in the stats of the minor version the profile originates from
+    profile["origin"] = repo.head.commit.hexsha
+    config = {
+        "kernel_mode": "estimator-settings",
+        "reg_type": "lc",
+        "bandwidth_method": "aic",
+        "efficient": False,
+        "randomize": False,
+        "n_sub_samples": 50,
+        "n_re_samples": 25,
+        "return_median": False,
+        "per_key": "structure-unit-size",
+        "of_key": "amount",
+    }
+    stats_id = methods.get_bandwidth_cache_id(profile, config)
+    assert stats_id is not None
+    # The bandwidths are not cached for the modes without the search of the bandwidth
+    assert (
+        methods.get_bandwidth_cache_id(profile, dict(config, kernel_mode="user-selection")) is None
+    )
+
+    # The first run searches for the bandwidths and stores them to the stats
+    code, _, result = postprocess(copy.deepcopy(profile), **config)
+    assert code.value == 0
+    models = [
+        model for model in result["profile"]["models"] if model["model"] == "kernel_regression"
+    ]
+    cached = stats.get_stats_of(methods.BANDWIDTH_STATS_FILE, [stats_id])[stats_id]
+    # The uids with too few points are not computed, hence their bandwidths are not cached
+    models = [model for model in models if model["kernel_mode"] != "manually"]
+    assert cached.keys() == {model["uid"] for model in models}
+    for model in models:
+        assert cached[model["uid"]]["bandwidth"] == model["bandwidth"]
+
+    # The cached bandwidth is reused, if the fit does not degrade
+    uid = models[0]["uid"]
+    stats.update_stats(
+        methods.BANDWIDTH_STATS_FILE, [stats_id], [{uid: {"bandwidth": 42.0, "r_square": -1.0}}]
+    )
+    assert methods.load_cached_bandwidths(profile, config)[uid]["bandwidth"] == 42.0
+    _, _, result = postprocess(copy.deepcopy(profile), **config)
+    model = next(model for model in result["profile"]["models"] if model["uid"] == uid)
+    assert model["bandwidth"] == 42.0
+
+    # The bandwidth is searched again, if the fit with the cached bandwidth degrades
+    stats.update_stats(
+        methods.BANDWIDTH_STATS_FILE, [stats_id], [{uid: {"bandwidth": 1e6, "r_square": 1.0}}]
+    )
+    _, _, result = postprocess(copy.deepcopy(profile), **config)
+    model = next(model for model in result["profile"]["models"] if model["uid"] == uid)
+    assert model["bandwidth"] == models[0]["bandwidth"]
+
+    # The cache is not used at all, when it is turned off
+    assert methods.load_cached_bandwidths(profile, dict(config, cache_bandwidths=False)) == {}
+
+    # The bandwidths are found in older version, even if the newer one caches other profiles
+    cached = methods.load_cached_bandwidths(profile, config)
+    old_profile = copy.deepcopy(profile)
+    first_version = old_profile["origin"]
+    repo.index.commit("second", commit_date="2100-01-01T00:00:00")
+    profile["origin"] = repo.head.commit.hexsha
+    stats.add_stats(methods.BANDWIDTH_STATS_FILE, ["other"], [{uid: {"bandwidth": 1.0}}])
+    assert uid in cached and methods.load_cached_bandwidths(profile, config) == cached
+
+    # The bandwidths of profile from older version are stored to the stats of its version
+    stats.delete_stats_file(methods.BANDWIDTH_STATS_FILE, first_version)
+    code, _, _ = postprocess(old_profile, **config)
+    assert code.value == 0
+    assert stats.get_stats_of(methods.BANDWIDTH_STATS_FILE, [stats_id], first_version).keys() == {
+        stats_id
+    }
+    assert stats.get_stats_of(methods.BANDWIDTH_STATS_FILE).keys() == {"other"}
@@ -0,0 +1,82 @@
+"""
+Tests of non-parametric method moving average functionality.
+
+The batch evaluation of window widths used by the iterative analysis is compared with
+the moving average models computed by pandas.
+
+The postprocessby CLI is tested in test_cli module.
+"""
+from __future__ import annotations
+
+# Standard Imports
+
+# Third-Party Imports
+import numpy as np
+import pytest
+
+# Perun Imports
+from perun.postprocess.moving_average import methods
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"moving_method": "sma", "center": True, "window_type": None, "min_periods": None},
+        {"moving_method": "sma", "center": False, "window_type": None, "min_periods": 1},
+        {"moving_method": "sma", "center": True, "window_type": None, "min_periods": 2},
+        {"moving_method": "sma", "center": True, "window_type": "triang", "min_periods": None},
+        {"moving_method": "smm", "center": False, "min_periods": None},
+        {"moving_method": "ema", "decay": "com", "min_periods": None},
+        {"moving_method": "ema", "decay": "span", "min_periods": 3},
+        {"moving_method": "ema", "decay": "halflife", "min_periods": None},
+    ],
+)
+def test_batch_r_squares(config):
+    """
+    Test the coefficients of determination computed for the batch of window widths.
+
+    Expects to pass all assertions.
+    """
+    rng = np.random.default_rng(42)
+    y_pts = 100 * np.sin(np.arange(500) / 50) + rng.normal(0, 10, 500)
+    # The widths include the widths greater than the number of points, the widths smaller than
+    # the minimal number of observations are rejected by pandas rolling
+    widths = [1, 2, 3, 7, 50, 499, 500, 700, 1200]
+    if config["moving_method"] != "ema":
+        widths = [width for width in widths if width >= (config["min_periods"] or 0)]
+
+    r_squares = methods.compute_r_squares(y_pts, widths, config)
+    for width, r_square in zip(widths, r_squares):
+        _, expected = methods.execute_computation(list(y_pts), dict(config, window_width=width))
+        assert r_square == pytest.approx(expected, abs=1e-9)
+
+    # The constant points have the same coefficients of determination as by sklearn
+    constant = np.full(20, 3.0)
+    for width, r_square in zip(widths, methods.compute_r_squares(constant, widths, config)):
+        _, expected = methods.execute_computation(list(constant), dict(config, window_width=width))
+        assert r_square == expected
+
+
+def test_iterative_analysis():
+    """
+    Test the iterative analysis with the batch evaluation of the window widths.
+
+    Expects to pass all assertions.
+    """
+    rng = np.random.default_rng(42)
+    x_pts = list(np.arange(5000, dtype=float))
+    y_pts = list(100 * np.sin(np.arange(5000) / 500) + rng.normal(0, 20, 5000))
+    for config in (
+        {"moving_method": "sma", "center": True, "window_type": None, "min_periods": None},
+        {"moving_method": "ema", "decay": "span", "min_periods": None},
+    ):
+        bucket_stats, r_square, window_width = methods.iterative_analysis(
+            x_pts, y_pts, dict(config)
+        )
+        # The resulting model is the model of the last evaluated window width
+        expected_stats, expected_r_square = methods.execute_computation(
+            y_pts, dict(config, window_width=window_width + 1)
+        )
+        assert r_square >= 0.88
+        assert r_square == expected_r_square
+        assert bucket_stats.equals(expected_stats)
@@ -9,6 +9,7 @@ import git
 
 # Perun Imports
 from perun.logic import commands, config
+from perun.profile import convert
 from perun.profile.factory import Profile
 import perun.profile.helpers as profiles
 import perun.testing.utils as test_utils
@@ -118,3 +119,46 @@ def test_name_generation(capsys):
     rt_config.set("format.output_profile_template", "sampling-[%memory.sampling%]")
     profile_name = profiles.generate_profile_name({"collector_info": {"name": "trace"}})
     assert profile_name == "sampling-[_].perf"
+
+
+def test_resource_columns(memory_profiles):
+    """Test the columnar representation of the resources
+
+    Expecting that the columns correspond to the resources obtained by all_resources
+    """
+    for memory_profile in memory_profiles:
+        profile = Profile(memory_profile.serialize())
+        row_resources = list(profile.all_resources(True))
+        column_resources = []
+        for _, persistent, columns in profile.resource_columns(True):
+            decoded = {
+                key: list(
+                    column.decode() if isinstance(column, convert.DictionaryColumn) else column
+                )
+                for key, column in columns.items()
+            }
+            for values in zip(*decoded.values()):
+                resource = dict(zip(decoded.keys(), values))
+                resource.update(persistent)
+                column_resources.append(resource)
+        assert [resource for _, resource in row_resources] == column_resources
+
+        # The columns are cached until the resources are updated
+        first_type, _, first_columns = next(iter(profile.resource_columns()))
+        assert next(iter(profile.resource_columns()))[2] is first_columns
+        profile["resources"][first_type]["amount"].append(1)
+        profile["resources"][first_type]["address"].append(1)
+        assert next(iter(profile.resource_columns()))[2] is not first_columns
+        profile.update_resources([{"type": "memory", "uid": "new", "amount": 1}], "list")
+        assert len(list(profile.resource_columns())) == len(profile["resources"])
+
+    # Test the typed columns
+    assert convert.values_to_column([1, 2, 3]).dtype.kind == "i"
+    assert convert.values_to_column([1, 2.5, 3]).dtype.kind == "f"
+    string_column = convert.values_to_column(["b", "a", "b"])
+    assert isinstance(string_column, convert.DictionaryColumn)
+    assert list(string_column.categories) == ["a", "b"]
+    assert list(string_column.decode()) == ["b", "a", "b"]
+    assert len(string_column) == 3
+    assert convert.values_to_column([1, "a", None]).dtype == object
+    assert convert.values_to_column([[1, 2], [3]]).dtype == object
@@ -40,6 +40,35 @@ def test_convert_models_to_dataframe():
     assert len(df) == 12
 
 
+def test_convert_resources_to_dataframe():
+    """Test conversion of resources built from the columns of resource types"""
+    memory_profile = test_utils.load_profile(
+        "full_profiles", "prof-3-memory-2017-05-15-15-43-42.perf"
+    )
+    resources = list(memory_profile.all_resources(True))
+
+    df = convert.resources_to_pandas_dataframe(memory_profile)
+    assert len(df) == len(resources)
+    assert set(df.columns) == memory_profile.all_resource_fields() | {"snapshots"}
+    assert list(df["amount"]) == [resource["amount"] for _, resource in resources]
+    assert list(df["uid"]) == [resource["uid"] for _, resource in resources]
+    assert list(df["snapshots"]) == [snapshot for snapshot, _ in resources]
+
+    # Modifying the returned dataframe does not affect the cached one
+    df.sort_values("amount", ascending=False, inplace=True)
+    df.drop(df.index, inplace=True)
+    assert len(convert.resources_to_pandas_dataframe(memory_profile)) == len(resources)
+
+    # Modifying the resources invalidates the cached dataframe
+    memory_profile.update_resources(
+        [{"type": "memory", "uid": "new", "amount": 1, "address": 0}], "resources"
+    )
+    df = convert.resources_to_pandas_dataframe(memory_profile)
+    assert len(df) == len(resources) + 1
+    assert df["uid"].iloc[-1] == "new"
+    assert df["uid:function"].isna().iloc[-1]
+
+
 def test_flame_graph(memory_profiles):
     """Test creation of flame graph format out of the profile of memory type
 
@@ -14,6 +14,7 @@ from __future__ import annotations
 import pytest
 
 # Perun Imports
+from perun.postprocess.regression_analysis import data_provider, methods
 from perun.postprocess.regression_analysis.run import postprocess
 from perun.utils import exceptions, metrics
 import perun.testing.utils as test_utils
@@ -372,3 +373,60 @@ def test_exp_model():
     test_utils.compare_results(model["r_square"], 1.0)
     test_utils.compare_results([c["value"] for c in model["coeffs"] if c["name"] == "b0"][0], 1.0)
     test_utils.compare_results([c["value"] for c in model["coeffs"] if c["name"] == "b1"][0], 2.0)
+
+
+def test_batch_computation():
+    """Test that the vectorised full computation produces the same models as the stepwise one.
+
+    The data contain non-positive values, which are skipped by the logarithmic, power and
+    exponential models.
+
+    Expects to pass all assertions.
+    """
+    x_pts = [3, 1, 0, -2, 5, 8, 13, 21, 2, 7]
+    y_pts = [4.5, 2.0, -1.0, 0.5, 7.25, 9.0, 15.5, 30.0, 3.0, 8.75]
+    computation_models = ("exponential", "linear", "logarithmic", "power", "quadratic")
+
+    batch_models = list(methods.full_computation(x_pts, y_pts, computation_models))
+    _, step_models = methods._models_initial_step(x_pts, y_pts, computation_models, 1)
+    assert len(batch_models) == len(step_models) == len(computation_models)
+    for batch_model, step_model in zip(batch_models, step_models):
+        assert batch_model["model"] == step_model["model"]
+        assert batch_model["pts_num"] == step_model["pts_num"]
+        assert batch_model["x_start"] == step_model["x_start"]
+        assert batch_model["x_end"] == step_model["x_end"]
+        test_utils.compare_results(batch_model["r_square"], step_model["r_square"])
+        for batch_coeff, step_coeff in zip(batch_model["coeffs"], step_model["coeffs"]):
+            test_utils.compare_results(batch_coeff, step_coeff)
+
+
+def test_data_providers():
+    """Test that the data providers group the points of resources by their uids.
+
+    Expects to pass all assertions.
+    """
+    profile = test_utils.load_profile("postprocess_profiles", "exp_model_datapoints.perf")
+    assert profile is not None
+
+    points_of_uids = {}
+    for _, resource in profile.all_resources():
+        x_pts, y_pts = points_of_uids.setdefault(resource["uid"], ([], []))
+        x_pts.append(resource["structure-unit-size"])
+        y_pts.append(resource["amount"])
+
+    provided = list(
+        data_provider.generic_profile_provider(
+            profile, of_key="amount", per_key="structure-unit-size"
+        )
+    )
+    assert [uid for _, _, uid in provided] == sorted(points_of_uids.keys())
+    for x_pts, y_pts, uid in provided:
+        assert (x_pts, y_pts) == points_of_uids[uid]
+
+    columnar = data_provider.columnar_profile_provider(
+        profile, of_key="amount", per_key="structure-unit-size"
+    )
+    for (x_pts, y_pts, uid), (x_array, y_array, array_uid) in zip(provided, columnar):
+        assert uid == array_uid
+        assert x_array.tolist() == x_pts
+        assert y_array.tolist() == y_pts
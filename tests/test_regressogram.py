@@ -4,7 +4,8 @@ Tests of non-parametric method regressogram functionality.
 Every method to choose optimal width of buckets is tested on a set
 of provided examples and the computation results are compared with
 the expected values. This ensures that the methods works correctly
-always.
+always. The regressograms computed for all uids at once are compared
+with the regressograms computed for each uid separately.
 
 The postprocessby CLI is tested in test_cli module.
 """
@@ -13,8 +14,11 @@ from __future__ import annotations
 # Standard Imports
 
 # Third-Party Imports
+import numpy as np
+import pytest
 
 # Perun Imports
+from perun.postprocess.regressogram import methods
 from perun.postprocess.regressogram.run import postprocess
 import perun.testing.utils as test_utils
 
@@ -67,6 +71,46 @@ def test_regressogram_method():
         profile["profile"]["models"].clear()
 
 
+@pytest.mark.parametrize("statistic_function", ["mean", "median"])
+def test_batched_regressogram(statistic_function):
+    """
+    Test the regressograms of several uids computed at once against the separate regressograms.
+
+    Expects to pass all assertions.
+    """
+    rng = np.random.default_rng(42)
+    # The groups include single point, the same x points, few points and non-integral points
+    x_groups = [
+        np.array([5.0]),
+        np.full(4, 3.0),
+        np.array([1.0, 2.0, 2.0, 7.0]),
+        rng.integers(0, 50, 1000).astype(float),
+        rng.uniform(0, 1, 300),
+    ]
+    y_groups = [rng.normal(0, 10, len(x_group)) for x_group in x_groups]
+    y_groups[1] = np.ones(4)
+    offsets = np.cumsum([0] + [len(x_group) for x_group in x_groups])
+
+    for buckets in [1, 10, *methods.get_supported_selectors()]:
+        models = methods.batched_regressogram(
+            np.concatenate(x_groups),
+            np.concatenate(y_groups),
+            offsets,
+            statistic_function,
+            buckets,
+        )
+        assert len(models) == len(x_groups)
+        for model, x_pts, y_pts in zip(models, x_groups, y_groups):
+            expected = methods.regressogram(list(x_pts), list(y_pts), statistic_function, buckets)
+            r_square, expected_r_square = model.pop("r_square"), expected.pop("r_square")
+            assert model == expected
+            # The coefficient of determination is not defined for single point
+            if len(x_pts) == 1:
+                assert np.isnan(r_square) and np.isnan(expected_r_square)
+            else:
+                assert r_square == pytest.approx(expected_r_square, abs=1e-12)
+
+
 # Common expected interval edges
 _COMMON_INTERVAL = [
     # uid: exp::test1
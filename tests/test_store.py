@@ -2,14 +2,19 @@
 from __future__ import annotations
 
 # Standard Imports
+import json
 import os
+import pickle
+import zlib
 
 # Third-Party Imports
 import pytest
 
 # Perun Imports
-from perun.logic import store, index
+from perun.logic import config, store, index
+from perun.profile import binary, helpers as profile_helpers
 from perun.utils import exceptions, timestamps, streams
+import perun.testing.utils as test_utils
 
 
 @pytest.mark.usefixtures("cleandir")
@@ -122,6 +127,62 @@ def test_versions(tmpdir, monkeypatch):
         assert stored.__dict__ == extended_entry.__dict__
 
 
+@pytest.mark.usefixtures("cleandir")
+def test_mapped_index(tmpdir, monkeypatch):
+    """Test the SwiftCheetah index with O(1) access to entries"""
+    pool_path = os.path.join(os.path.split(__file__)[0], "profiles", "degradation_profiles")
+    profile_name = os.path.join(pool_path, "linear_base.perf")
+    profile = store.load_profile_from_file(profile_name, True, True)
+    st = timestamps.timestamp_to_str(os.stat(profile_name).st_mtime)
+
+    # Create the index in the older FastSloth format
+    monkeypatch.setattr("perun.logic.index.INDEX_VERSION", index.IndexVersion.FastSloth.value)
+    index_file = os.path.join(str(tmpdir), "index")
+    index.touch_index(index_file)
+    checksums = [store.compute_checksum(f"object {i}".encode("utf-8")) for i in range(50)]
+    for i, checksum in enumerate(checksums):
+        entry = index.ExtendedIndexEntry(st, checksum, f"prof-{i:02}.perf", -1, profile)
+        index.write_entry_to_index(index_file, entry)
+    with open(index_file, "rb") as index_handle:
+        old_entries = list(index.walk_index(index_handle))
+    monkeypatch.undo()
+
+    # Upgrade the index by registering new entry
+    new_entry = index.ExtendedIndexEntry(st, checksums[0], "prof-25.5.perf", -1, profile)
+    index.write_entry_to_index(index_file, new_entry)
+    index.write_entry_to_index(index_file, new_entry)
+    with open(index_file, "rb") as index_handle:
+        index_handle.seek(4)
+        assert store.read_int_from_handle(index_handle) == index.IndexVersion.SwiftCheetah.value
+        assert store.read_number_of_entries_from_handle(index_handle) == 51
+        entries = list(index.walk_index(index_handle))
+        assert [e.path for e in entries] == sorted(e.path for e in old_entries + [new_entry])
+        for old_entry, entry in zip(old_entries, entries[:25]):
+            assert old_entry.checksum == entry.checksum
+            assert old_entry.type == entry.type and old_entry.cmd == entry.cmd
+            assert old_entry.postprocessors == entry.postprocessors
+
+        # Lookup of the entries by checksum or path
+        found = index.lookup_entries_by_checksum(index_handle, checksums[0])
+        assert sorted(e.path for e in found) == ["prof-00.perf", "prof-25.5.perf"]
+        found = index.lookup_entry_by_checksum_or_path(index_handle, "prof-42.perf")
+        assert found.checksum == checksums[42]
+        assert found == entries[43]
+        with pytest.raises(exceptions.EntryNotFoundException):
+            index.lookup_entry_by_checksum_or_path(index_handle, "prof-99.perf")
+        assert index.lookup_entries_by_checksum(index_handle, "0" * 40) == []
+
+    # Removal of the entries
+    monkeypatch.setattr("perun.logic.store.split_object_name", lambda _, __: (None, index_file))
+    index.remove_from_index(os.getcwd(), "", ["prof-10.perf", checksums[11]])
+    with open(index_file, "rb") as index_handle:
+        paths = [e.path for e in index.walk_index(index_handle)]
+        assert len(paths) == 49
+        assert "prof-10.perf" not in paths and "prof-11.perf" not in paths
+        assert index.lookup_entries_by_path(index_handle, "prof-10.perf") == []
+        assert index.lookup_entries_by_path(index_handle, "prof-12.perf")[0].path == "prof-12.perf"
+
+
 @pytest.mark.usefixtures("cleandir")
 def test_helpers(tmpdir):
     index_file = os.path.join(str(tmpdir), "index")
@@ -166,6 +227,197 @@ def test_streams(tmpdir, monkeypatch):
     with pytest.raises(exceptions.IncorrectProfileFormatException):
         store.load_profile_from_file("nonexistant", False)
 
-    monkeypatch.setattr("perun.logic.store.read_and_deflate_chunk", lambda _: "p mixed 1\0tmp")
-    with pytest.raises(exceptions.IncorrectProfileFormatException):
+    # Packed object with malformed header
+    with open(tmp_file, "wb") as tmp:
+        tmp.write(store.pack_content(b"p mixed 1\0tmp"))
+    with pytest.raises(exceptions.IncorrectProfileFormatException) as exc:
         store.load_profile_from_file(tmp_file, False)
+    assert str(exc.value) == f"malformed profile '{tmp_file}'"
+
+
+@pytest.mark.usefixtures("cleandir")
+def test_streamed_profiles(tmpdir, monkeypatch):
+    """Test storing and loading profiles by chunks"""
+    profile = test_utils.load_profile("full_profiles", "prof-2-complexity-2017-03-20-21-40-42.perf")
+    serialized_profile = profile.serialize()
+    assert "".join(streams.iterate_json_chunks(serialized_profile)) == json.dumps(
+        serialized_profile
+    )
+    assert "".join(streams.iterate_json_chunks(serialized_profile, indent=2)) == json.dumps(
+        serialized_profile, indent=2
+    )
+    assert list(streams.iterate_json_members(["{", "}"])) == []
+    assert list(streams.iterate_json_members(['{"resources": {}, "a"', ": 12", "3}"])) == [
+        (("resources",), {}),
+        (("a",), 123),
+    ]
+    with pytest.raises(ValueError):
+        list(streams.iterate_json_members(['{"a": 1', "}}"]))
+
+    # Load the raw and packed profile in tiny chunks
+    monkeypatch.setattr(store, "PROFILE_CHUNK_SIZE", 16)
+    raw_file = os.path.join(str(tmpdir), "raw.perf")
+    streams.store_json(serialized_profile, raw_file)
+    assert store.load_profile_from_file(raw_file, True).serialize() == serialized_profile
+
+    object_dir = os.path.join(str(tmpdir), "objects")
+    object_name = store.add_profile_object_to_dir(object_dir, profile)
+    _, object_file = store.split_object_name(object_dir, object_name)
+    body = json.dumps(serialized_profile)
+    content = f"profile {profile['header']['type']} {len(body)}\0{body}".encode("utf-8")
+    assert object_name == store.compute_checksum(content)
+    assert store.load_profile_from_file(object_file, False).serialize() == serialized_profile
+
+    # Truncated objects are malformed
+    truncated_file = os.path.join(str(tmpdir), "truncated")
+    with open(truncated_file, "wb") as truncated_handle:
+        truncated_handle.write(store.pack_content(content[:-10]))
+    with pytest.raises(exceptions.IncorrectProfileFormatException):
+        store.load_profile_from_file(truncated_file, False)
+
+    # Failed compression leaves no partial object behind
+    class FailingCompressor:
+        def compress(self, _):
+            raise zlib.error("failed compression")
+
+    failed_dir = os.path.join(str(tmpdir), "failed")
+    monkeypatch.setattr(store.zlib, "compressobj", FailingCompressor)
+    with pytest.raises(zlib.error):
+        store.add_profile_object_to_dir(failed_dir, profile)
+    assert os.listdir(failed_dir) == []
+
+
+@pytest.mark.usefixtures("cleandir")
+def test_binary_profiles(tmpdir):
+    """Test storing and loading profiles in binary format"""
+    object_dir = os.path.join(str(tmpdir), "objects")
+    for profile_name in [
+        "prof-2-complexity-2017-03-20-21-40-42.perf",
+        "prof-3-memory-2017-05-15-15-43-42.perf",
+    ]:
+        profile = test_utils.load_profile("full_profiles", profile_name)
+        profile.update_resources(
+            [{"uid": "big", "amount": 2**40, "timestamp": 0.5, "order": True}], "resources"
+        )
+
+        config.runtime().set("profiles.object_format", "binary")
+        object_name = store.add_profile_object_to_dir(object_dir, profile)
+        config.runtime().data.clear()
+        _, object_file = store.split_object_name(object_dir, object_name)
+        with open(object_file, "rb") as object_handle:
+            assert binary.is_binary_profile(object_handle.read(4))
+
+        # The profile is loaded with exactly the same values and types
+        loaded_profile = store.load_profile_from_file(object_file, False)
+        assert json.dumps(loaded_profile.serialize()) == json.dumps(profile.serialize())
+        assert binary.dump_profile(loaded_profile)[0] == object_name
+
+        # JSON objects are still loaded
+        json_object_name = store.add_profile_object_to_dir(object_dir, profile)
+        _, json_object_file = store.split_object_name(object_dir, json_object_name)
+        assert store.load_profile_from_file(json_object_file, False).serialize() == (
+            profile.serialize()
+        )
+
+    with open(object_file, "rb") as object_handle:
+        content = object_handle.read()
+    with open(object_file, "wb") as object_handle:
+        object_handle.write(content[:-10])
+    with pytest.raises(exceptions.IncorrectProfileFormatException):
+        store.load_profile_from_file(object_file, False)
+
+
+@pytest.mark.usefixtures("cleandir")
+def test_lazy_profiles(tmpdir):
+    """Test loading the resources and models of stored profiles on their first access"""
+    object_dir = os.path.join(str(tmpdir), "objects")
+    profile = test_utils.load_profile("full_profiles", "prof-2-complexity-2017-03-20-21-40-42.perf")
+    profile["models"] = [{"uid": "f", "model": "linear", "coeffs": [{"name": "b0", "value": 1}]}]
+
+    for object_format in ("json", "binary"):
+        config.runtime().set("profiles.object_format", object_format)
+        object_name = store.add_profile_object_to_dir(object_dir, profile)
+        config.runtime().data.clear()
+        _, object_file = store.split_object_name(object_dir, object_name)
+
+        lazy_profile = store.load_profile_from_file(object_file, False, lazy=True)
+        assert lazy_profile["header"] == profile["header"]
+        assert "resources" in lazy_profile and "models" in lazy_profile
+        assert "resources" in lazy_profile._storage.lazy_sections
+        assert lazy_profile["resources"] == profile["resources"]
+        assert lazy_profile["models"] == profile["models"]
+        assert "resources" not in lazy_profile._storage.lazy_sections
+        assert json.dumps(lazy_profile.serialize()) == json.dumps(profile.serialize())
+
+        # Pickled lazy profiles are loaded whole
+        lazy_profile = store.load_profile_from_file(object_file, False, lazy=True)
+        pickled_profile = pickle.loads(pickle.dumps(lazy_profile))
+        assert not pickled_profile._storage.lazy_sections
+        assert pickled_profile.serialize() == profile.serialize()
+
+        # Overwritten sections are never loaded
+        lazy_profile = store.load_profile_from_file(object_file, False, lazy=True)
+        lazy_profile["models"] = []
+        assert lazy_profile["models"] == []
+        assert "models" not in lazy_profile._storage.lazy_sections
+
+    # Malformed sections are detected on their access
+    json_object_file = store.split_object_name(
+        object_dir, store.add_profile_object_to_dir(object_dir, profile)
+    )[1]
+    lazy_profile = store.load_profile_from_file(json_object_file, False, lazy=True)
+    with open(json_object_file, "wb") as object_handle:
+        object_handle.write(store.pack_content(b"profile time 10\0{}"))
+    with pytest.raises(exceptions.IncorrectProfileFormatException):
+        _ = lazy_profile["resources"]
+
+
+def test_profile_cache(pcs_single_prof, monkeypatch):
+    """Test that the loaded profile objects are cached and evicted"""
+    store.PROFILE_CACHE.invalidate()
+    head = pcs_single_prof.vcs().get_minor_head()
+    object_path = profile_helpers.load_list_for_minor_version(head)[0].realpath
+    checksum = store.version_path_to_sha(object_path)
+
+    # Uncached loads always construct new profiles
+    assert store.load_profile_from_file(object_path, False) is not store.load_profile_from_file(
+        object_path, False
+    )
+    assert checksum not in store.PROFILE_CACHE
+
+    hits, misses = store.PROFILE_CACHE.hits, store.PROFILE_CACHE.misses
+    profile = store.load_profile_from_file(object_path, False, use_cache=True)
+    assert checksum in store.PROFILE_CACHE
+    assert store.load_profile_from_file(object_path, False, use_cache=True) is profile
+    assert store.PROFILE_CACHE.hits == hits + 1
+    assert store.PROFILE_CACHE.misses == misses + 1
+
+    # Too big profiles are not cached at all
+    store.PROFILE_CACHE.invalidate()
+    monkeypatch.setattr("perun.logic.store.DEFAULT_PROFILE_CACHE_SIZE", 1)
+    store.load_profile_from_file(object_path, False, use_cache=True)
+    assert len(store.PROFILE_CACHE) == 0
+    monkeypatch.undo()
+
+    # Test the eviction of least recently used profiles
+    cache = store.ProfileCache(capacity=10)
+    cache.put("a", profile, 4)
+    cache.put("b", profile, 4)
+    assert cache.get("a") is profile
+    cache.put("c", profile, 4)
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.size == 8
+    cache.invalidate("a")
+    assert cache.size == 4 and cache.get("a") is None
+
+    # Test the on-disk cache
+    store.PROFILE_CACHE.invalidate()
+    pcs_single_prof.local_config().set("profiles.cache_on_disk", "true")
+    profile = store.load_profile_from_file(object_path, False, use_cache=True)
+    cache_file = os.path.join(pcs_single_prof.get_tmp_directory(), "profile-cache", checksum)
+    assert os.path.exists(cache_file)
+    store.PROFILE_CACHE.invalidate()
+    disk_profile = store.load_profile_from_file(object_path, False, use_cache=True)
+    assert disk_profile is not profile
+    assert disk_profile.serialize() == profile.serialize()
+    store.PROFILE_CACHE.invalidate()
@@ -6,9 +6,11 @@ import glob
 import os
 import re
 import shutil
+import types
 
 # Third-Party Imports
 from click.testing import CliRunner
+import pytest
 
 # Perun Imports
 from perun import cli
@@ -19,6 +21,7 @@ from perun.utils.exceptions import SystemTapStartupException
 from perun.utils.structs import CollectStatus
 import perun.collect.trace.run as trace_run
 import perun.collect.trace.systemtap.engine as stap
+import perun.collect.trace.systemtap.parse_compact as parse_compact
 import perun.testing.utils as test_utils
 
 _mocked_stap_code = 0
@@ -648,3 +651,106 @@ def test_collect_trace_fail(monkeypatch, pcs_full, trace_collect_job):
     # )
     # assert result.exit_code == 1
     # assert 'Error while parsing the raw trace record' in result.output
+
+
+@pytest.mark.parametrize("block_size", [64, 2**22])
+@pytest.mark.parametrize(
+    "record_file,paired_calls",
+    [
+        ("record_malformed.txt", True),
+        ("record_malformed2.txt", True),
+        ("record_malformed3.txt", False),
+        ("record_malformed4.txt", False),
+        ("record_nested.txt", True),
+    ],
+)
+def test_transform_record_blocks(monkeypatch, record_file, paired_calls, block_size):
+    """Test that the blocks of records are transformed the same as the records one by one
+
+    The traced functions are known probes, hence the nested and recursive calls of the threads
+    without lost records are paired in bulk. The threads of record_malformed3 and 4 lose some of
+    their records, hence their calls may be left to the handlers.
+
+    Expects to pass all assertions.
+    """
+    data_file = os.path.join(os.path.dirname(__file__), "sources", "collect_trace", record_file)
+    with open(data_file, "r") as trace:
+        func_names = {
+            line.rstrip("\n").rsplit(";", 1)[-1]
+            for line in trace
+            if line.split(" ", 1)[0] in ("0", "1") and ";" in line
+        }
+    func_probes = {name: {"name": name, "sample": 0, "lib": "tst"} for name in func_names}
+    probes = types.SimpleNamespace(func=func_probes, usdt={}, usdt_reversed={})
+
+    # Transform the records one by one by their handlers
+    expected_ctx = parse_compact.TransformContext(probes, {"tst"}, True, "")
+    handlers = parse_compact._record_handlers()
+    expected = []
+    for record in parse_compact.parse_records(data_file, probes, True):
+        try:
+            resource = handlers[record["type"]](record, expected_ctx)
+        except (KeyError, IndexError):
+            continue
+        if resource:
+            expected.append(resource)
+
+    bulk_resources = []
+    pair_calls = parse_compact._pair_calls
+
+    def spied_pair_calls(*args):
+        paired = pair_calls(*args)
+        bulk_resources.extend(paired[2])
+        return paired
+
+    monkeypatch.setattr(parse_compact, "_pair_calls", spied_pair_calls)
+    monkeypatch.setattr(parse_compact, "_BLOCK_SIZE", block_size)
+    ctx = parse_compact.TransformContext(probes, {"tst"}, True, "")
+    assert list(parse_compact.transform_record_blocks(data_file, ctx)) == expected
+    if paired_calls:
+        assert bulk_resources
+    assert ctx.probes_hit == expected_ctx.probes_hit
+    assert ctx.dyn_cg == expected_ctx.dyn_cg
+    assert ctx.level_times_exclusive == expected_ctx.level_times_exclusive
+    assert ctx.bottom == expected_ctx.bottom
+    assert ctx.funcs == expected_ctx.funcs
+    assert ctx.per_thread.keys() == expected_ctx.per_thread.keys()
+    for tid, thread_ctx in ctx.per_thread.items():
+        assert thread_ctx.func_stack == expected_ctx.per_thread[tid].func_stack
+        assert thread_ctx.depth == expected_ctx.per_thread[tid].depth
+
+
+@pytest.mark.parametrize("block_size", [1024, 2**22])
+def test_transform_record_shards(monkeypatch, tmp_path, block_size):
+    """Test that the threads transformed in shards by multiple processes produce the same results
+
+    The small blocks are streamed to the shards and merged from them block by block.
+
+    Expects to pass all assertions.
+    """
+    # Interleave the records of the trace with a copy of its records in another thread
+    data_file = os.path.join(
+        os.path.dirname(__file__), "sources", "collect_trace", "record_malformed.txt"
+    )
+    sharded_file = tmp_path / "record_sharded.txt"
+    with open(data_file, "r") as trace:
+        lines = trace.read().splitlines()
+    with open(sharded_file, "w") as trace:
+        for line in lines:
+            record_type, tid, rest = line.split(" ", 2)
+            trace.write(f"{line}\n{record_type} {int(tid) + 1} {rest}\n")
+    probes = types.SimpleNamespace(func={}, usdt={}, usdt_reversed={})
+
+    expected_ctx = parse_compact.TransformContext(probes, {"tst"}, True, "")
+    expected = list(parse_compact.transform_record_blocks(sharded_file, expected_ctx))
+    monkeypatch.setattr(parse_compact, "_BLOCK_SIZE", block_size)
+    for jobs in (1, 2, 4):
+        ctx = parse_compact.TransformContext(probes, {"tst"}, True, "")
+        assert list(parse_compact.transform_record_shards(sharded_file, ctx, jobs)) == expected
+        assert ctx.probes_hit == expected_ctx.probes_hit
+        assert ctx.dyn_cg == expected_ctx.dyn_cg
+        assert ctx.level_times_exclusive == expected_ctx.level_times_exclusive
+        assert ctx.bottom == expected_ctx.bottom
+        assert ctx.funcs == expected_ctx.funcs
+        assert ctx.processes == expected_ctx.processes
+        assert ctx.threads == expected_ctx.threads
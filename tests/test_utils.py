@@ -287,6 +287,45 @@ def test_common(capsys):
     common_kit.ALWAYS_CONFIRM = prev_value
 
 
+def test_lazy_startup():
+    """Tests that the heavy modules are not imported on the startup path of Perun
+
+    Expects to pass all assertions.
+    """
+    heavy_modules = ["numpy", "pandas", "scipy", "sklearn", "holoviews", "bokeh", "angr"]
+    startup = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, perun.cli; print([m for m in {heavy_modules} if m in sys.modules])",
+        ],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(__file__),
+        check=True,
+    )
+    assert startup.stdout.strip().splitlines()[-1] == "[]"
+
+    lazy_numpy = common_kit.lazy_import("numpy")
+    assert lazy_numpy.array([1, 2, 3]).sum() == 6
+    assert common_kit.lazy_import("sys") is sys
+
+    assert common_kit.strtobool("Yes") and common_kit.strtobool("on")
+    assert not common_kit.strtobool("0") and not common_kit.strtobool("false")
+    with pytest.raises(ValueError):
+        common_kit.strtobool("maybe")
+
+    import_times = cli_kit.parse_import_times(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |   click.types",
+            "import time:        20 |        120 | click",
+            "unrelated warning",
+        ]
+    )
+    assert import_times == [("click.types", 100, 100), ("click", 20, 120)]
+
+
 def test_predicates(capsys):
     """Test predicates used for testing"""
     with pytest.raises(AssertionError):